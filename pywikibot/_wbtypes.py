@@ -11,6 +11,7 @@ import datetime
 import json
 import math
 import re
+import sys
 from collections.abc import Iterator, Mapping
 from contextlib import suppress
 from decimal import Decimal
@@ -42,9 +43,26 @@ __all__ = (
 )
 
 
+def _intern(value: Any) -> Any:
+    """Intern *value* if it is a str.
+
+    Entity URIs like calendar models, units and globes and language
+    codes are repeated in many values; interning shares them.
+
+    .. version-added:: 11.7
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 class WbRepresentation(abc.ABC):
 
-    """Abstract class for Wikibase representations."""
+    """Abstract class for Wikibase representations.
+
+    .. version-changed:: 11.7
+       Subclasses use ``__slots__``.
+    """
+
+    __slots__ = ()
 
     _items: tuple[str, ...]
 
@@ -106,6 +124,9 @@ class Coordinate(WbRepresentation):
 
     """Class for handling and storing Coordinates."""
 
+    __slots__ = ('_dim', '_entity', '_precision', 'alt', 'globe', 'lat',
+                 'lon', 'name', 'primary', 'site', 'type')
+
     _items = ('lat', 'lon', 'entity')
 
     @deprecated_signature(since='10.4.0')
@@ -147,7 +168,7 @@ class Coordinate(WbRepresentation):
         self.lon = lon
         self.alt = alt
         self._precision = precision
-        self._entity = globe_item
+        self._entity = _intern(globe_item)
         self.type = typ
         self.name = name
         self._dim = dim
@@ -406,6 +427,9 @@ class WbTime(WbRepresentation):
     minute: int
     second: int
 
+    __slots__ = ('year', 'month', 'day', 'hour', 'minute', 'second',
+                 'precision', 'before', 'after', 'timezone', 'calendarmodel')
+
     PRECISION = _Precision()
 
     FORMATSTR = '{0:+012d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}Z'
@@ -550,7 +574,7 @@ class WbTime(WbRepresentation):
                     f'Site {pywikibot.Site()} has no data repository')
             calendarmodel = site.calendarmodel()
 
-        self.calendarmodel = calendarmodel
+        self.calendarmodel = _intern(calendarmodel)
 
     def _getSecondsAdjusted(self) -> int:
         """Return an internal representation of the time object as seconds.
@@ -959,6 +983,8 @@ class WbQuantity(WbRepresentation):
 
     """A Wikibase quantity representation."""
 
+    __slots__ = ('_unit', 'amount', 'lowerBound', 'site', 'upperBound')
+
     _items = ('amount', 'upperBound', 'lowerBound', 'unit')
 
     @staticmethod
@@ -1003,7 +1029,7 @@ class WbQuantity(WbRepresentation):
             raise ValueError('no amount given')
 
         self.amount = self._todecimal(amount)
-        self._unit = unit
+        self._unit = _intern(unit)
         self.site = site or pywikibot.Site().data_repository()
 
         # also allow entity URIs to be provided via unit parameter
@@ -1092,6 +1118,8 @@ class WbMonolingualText(WbRepresentation):
 
     """A Wikibase monolingual text representation."""
 
+    __slots__ = ('language', 'text')
+
     _items = ('text', 'language')
 
     def __init__(self, text: str, language: str) -> None:
@@ -1103,7 +1131,7 @@ class WbMonolingualText(WbRepresentation):
         if not text or not language:
             raise ValueError('text and language cannot be empty')
         self.text = text
-        self.language = language
+        self.language = _intern(language)
 
     def toWikibase(self) -> dict[str, Any]:
         """Convert the data to a JSON object for the Wikibase API.
@@ -1135,6 +1163,8 @@ class WbDataPage(WbRepresentation):
     .. note:: that this class cannot be used directly.
     """
 
+    __slots__ = ('page', )
+
     _items = ('page', )
 
     @classmethod
@@ -1249,6 +1279,8 @@ class WbGeoShape(WbDataPage):
 
     """A Wikibase geo-shape representation."""
 
+    __slots__ = ()
+
     @classmethod
     def _get_data_site(cls, site: DataSite) -> APISite:
         """Return the site serving as a geo-shape repository.
@@ -1274,6 +1306,8 @@ class WbTabularData(WbDataPage):
 
     """A Wikibase tabular-data representation."""
 
+    __slots__ = ()
+
     @classmethod
     def _get_data_site(cls, site: DataSite) -> APISite:
         """Return the site serving as a tabular-data repository.
@@ -1309,6 +1343,8 @@ class WbUnknown(WbRepresentation):
        *warning* parameter was added
     """
 
+    __slots__ = ('json', 'warning')
+
     _items = ('json',)
 
     def __init__(self, json: dict[str, Any], warning: str = '') -> None:
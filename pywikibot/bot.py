@@ -2087,18 +2087,33 @@ class WikidataBot(Bot, ExistingPageBot):
     def user_add_claim(self, item: pywikibot.page.ItemPage,
                        claim: pywikibot.page.Claim,
                        source: BaseSite | None = None,
-                       bot: bool = True, **kwargs: Any) -> bool:
+                       bot: bool = True, *,
+                       batch: pywikibot.page.EntityEditBatch | None = None,
+                       **kwargs: Any) -> bool:
         """Add a claim to an item, with user confirmation as required.
 
+        If *batch* is given, the claim is only added locally and saved
+        later together with other changes by :meth:`user_save_batch`.
+        Options of the save like *summary* must be passed to the batch
+        or to :meth:`user_save_batch` then.
+
+        .. version-changed:: 11.7
+           *batch* parameter was added.
+
         :param item: Page to be edited
         :param claim: Claim to be saved
         :param source: Site where the claim comes from
         :param bot: Whether to flag as bot (if possible)
+        :param batch: Collect the claim in this edit batch instead of
+            saving it immediately
         :keyword ignore_server_errors: If True, server errors will be reported
           and ignored (default: False)
         :keyword ignore_save_related_errors: If True, errors related to
           page save will be reported and ignored (default: False)
-        :return: Whether the item was saved successfully
+        :return: Whether the item was saved successfully or the claim
+            was added to *batch*
+        :raises ValueError: save options were given together with
+            *batch*
 
         .. note:: calling this method sets the current_page property
            to the item which changes the site property
@@ -2106,6 +2121,11 @@ class WikidataBot(Bot, ExistingPageBot):
         .. note:: calling this method with the 'source' argument modifies
            the provided claim object in place
         """
+        if batch is not None and (kwargs or not bot):
+            raise ValueError(
+                'save options cannot be used with batch; pass them to '
+                'the batch or to user_save_batch() instead')
+
         self.current_page = item
 
         if source:
@@ -2114,8 +2134,47 @@ class WikidataBot(Bot, ExistingPageBot):
                 claim.addSource(sourceclaim)
 
         pywikibot.info(f'Adding {claim.getID()} --> {claim.getTarget()}')
+        if batch is not None:
+            batch.add_claim(item, claim)
+            return True
         return self._save_page(item, item.addClaim, claim, bot=bot, **kwargs)
 
+    def user_save_batch(self, batch: pywikibot.page.EntityEditBatch,
+                        **kwargs: Any) -> bool:
+        """Save the entities of an edit batch with user confirmation.
+
+        Every changed entity is saved by :meth:`user_edit_entity` with
+        a single ``wbeditentity`` request. Entities which were not saved
+        because the user declined their changes or because an error was
+        ignored remain in the batch; unlike
+        :meth:`EntityEditBatch.flush()
+        <pywikibot.page.EntityEditBatch.flush>` the following entities
+        are saved nevertheless. If an error is raised, the entity and
+        the following ones remain in the batch too.
+
+        .. version-added:: 11.7
+
+        :param batch: The edit batch to be saved
+        :keyword show_diff: Show changes of each entity (default: False)
+        :return: Whether all changed entities were saved successfully
+        """
+        kwargs = {**batch.kwargs, **kwargs}
+        kwargs.setdefault('show_diff', False)
+        entities = batch.entities
+        failed = []
+        done = 0
+        try:
+            for entity in entities:
+                if ((entity.getID() == '-1' or batch.changes(entity))
+                        and not self.user_edit_entity(entity, **kwargs)):
+                    failed.append(entity)
+                done += 1
+        finally:
+            batch.clear()
+            for entity in (*failed, *entities[done:]):
+                batch.add(entity)
+        return not failed
+
     def getSource(self, site: BaseSite) -> pywikibot.page.Claim | None:
         """Create a Claim usable as a source for Wikibase statements.
 
@@ -2157,9 +2216,9 @@ class WikidataBot(Bot, ExistingPageBot):
         # unfortunately we need the source claim here, too.
         sourceclaim = self.getSource(source) if source else None
 
-        # Existing claims on page of same property
-        claims = item.get().get('claims')
-        assert claims is not None
+        # Existing claims on page of same property; do not call get()
+        # which would drop changes collected in an edit batch
+        claims = item.claims
 
         claim_id = claim.getID()
         for existing in claims.get(claim_id, []):
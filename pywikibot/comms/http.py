@@ -315,6 +315,9 @@ def request(site: pywikibot.site.BaseSite,
     .. version-changed:: 8.2
        A *protocol* parameter can be given which is passed to the
        :meth:`family.Family.base_url` method.
+    .. version-changed:: 11.7
+       The response time and congestion signals are passed to the
+       site's :meth:`throttle.adapt()<throttle.Throttle.adapt>`.
 
     :param site: The Site to connect to
     :param uri: The URI to retrieve
@@ -333,10 +336,20 @@ def request(site: pywikibot.site.BaseSite,
     headers['user-agent'] = user_agent(site, format_string)
 
     baseuri = site.base_url(uri, protocol=kwargs.pop('protocol', None))
-    r = fetch(baseuri, headers=headers, **kwargs)
+    try:
+        r = fetch(baseuri, headers=headers, **kwargs)
+    except ServerError:
+        site.throttle.adapt(congested=True)
+        raise
+
     retry_after = r.headers.get('retry-after', '0')
     # literal of retry_after may int or float (T414197)
     site.throttle.retry_after = int(float(retry_after))
+    if site.throttle.adaptive:
+        site.throttle.adapt(
+            r.elapsed.total_seconds(),
+            congested=bool(site.throttle.retry_after)
+            or r.status_code == HTTPStatus.TOO_MANY_REQUESTS)
     return r
 
 
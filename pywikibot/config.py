@@ -165,6 +165,20 @@ fake_user_agent_exceptions: dict[str, bool | str] = {}
 site_interface = 'APISite'
 # number of days to cache namespaces, api configuration, etc.
 API_config_expiry = 30
+# Storage backend for cached API responses. 'pickle' stores each
+# response as a single file inside the 'apicache' directory, 'sqlite'
+# stores all responses in the 'apicache.sqlite3' database file which
+# can be shared by several bot processes.
+API_cache_backend = 'pickle'
+# Maximum total size in bytes and maximum number of entries of the API
+# cache. If one of them is exceeded when a response is written, the least
+# recently used entries are evicted. 0 means no limit.
+API_cache_max_bytes = 0
+API_cache_max_entries = 0
+# Maximum number of worker threads which process API requests and
+# generator steps awaited from an asyncio event loop. The site throttle
+# still applies to each request.
+API_async_workers = 32
 
 # The maximum number of bytes which uses a GET request, if not positive
 # it'll always use POST requests
@@ -546,6 +560,14 @@ except AttributeError:
     # we get "StdioOnnaStick instance has no attribute 'isatty'"
     colorized_output = False
 
+# Algorithm used to compare texts for showDiff() and cherry_pick().
+# 'difflib' uses difflib.SequenceMatcher. 'patience' aligns lines which
+# are unique in both texts first and is much faster on large pages.
+diff_algorithm = 'difflib'
+# Maximum CPU time in seconds to compute a 'patience' diff. If it is
+# exceeded, only a summary of the changed lines is shown. 0 means no limit.
+diff_timeout = 5.0
+
 # An indication of the size of your screen, or rather the size of the screen
 # to be shown, for flickrripper
 tkhorsize = 1280
@@ -716,6 +738,19 @@ maxthrottle = 60
 # 'put_throttle' seconds.
 put_throttle: int | float = 10
 
+# How the throttle coordinates several bot processes on this host.
+# 'file' counts the processes in the 'throttle.ctrl' file and multiplies
+# the delays by their number. 'sqlite' shares one token bucket per site in
+# the 'throttle.sqlite3' database file; all processes together do not
+# exceed the read and write rates given by minthrottle and put_throttle.
+throttle_backend = 'file'
+
+# Adapt the read delay to the server load. The request rate is increased
+# slowly while responses are fine and halved when the server reports
+# maxlag, asks to retry later, fails or answers much slower than usual.
+# The delay is kept between minthrottle and maxthrottle.
+throttle_adaptive = False
+
 # Sometimes you want to know when a delay is inserted. If a delay is larger
 # than 'noisysleep' seconds, it is logged on the screen.
 noisysleep = 3.0
@@ -57,7 +57,7 @@ or by adding a list to the given one::
 from __future__ import annotations
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from contextlib import suppress
 from enum import IntEnum
 from typing import Any, cast
@@ -260,6 +260,7 @@ class CosmeticChangesToolkit:
         self.template = self.namespace == Namespace.TEMPLATE
         self.talkpage = self.namespace >= 0 and self.namespace % 2 == 1
         self.ignore = ignore
+        self.spans = textlib.ExceptionSpans('', site=self.site)
 
         self.common_methods = [
             self.commonsfiledesc,
@@ -302,6 +303,31 @@ class CosmeticChangesToolkit:
 
         return text if result is None else result
 
+    def replace_except(self, text: str,
+                       old: str | re.Pattern[str],
+                       new: str | Callable[[re.Match[str]], str],
+                       exceptions: Sequence[str | re.Pattern[str]],
+                       caseInsensitive: bool = False,
+                       allowoverlap: bool = False,
+                       marker: str = '',
+                       count: int = 0) -> str:
+        """Replace *old* by *new* like :func:`textlib.replaceExcept`.
+
+        All methods of the toolkit share the exception matches of
+        :attr:`spans`. The matches of an exception, e.g. comments or
+        nowiki tags, are reused by subsequent methods. If a method has
+        changed the text, the matches of searches behind the changed
+        part are shifted and kept; only those of searches before it
+        are searched again.
+
+        .. version-added:: 11.7
+        """
+        self.spans.text = text
+        return self.spans.replace(old, new, exceptions,
+                                  caseInsensitive=caseInsensitive,
+                                  allowoverlap=allowoverlap,
+                                  marker=marker, count=count)
+
     def _change(self, text: str) -> str:
         """Execute all clean up methods."""
         for method in self.common_methods:
@@ -463,7 +489,7 @@ class CosmeticChangesToolkit:
                     # only change on these file extensions (per T57242)
                     extensions = ('png', 'gif', 'jpg', 'jpeg', 'svg', 'tiff',
                                   'tif')
-                    text = textlib.replaceExcept(
+                    text = self.replace_except(
                         text,
                         r'\[\[\s*({}) *:(?P<name>[^\|\]]*?\.({}))'
                         r'(?P<label>.*?)\]\]'
@@ -471,7 +497,7 @@ class CosmeticChangesToolkit:
                         fr'[[{final_ns}:\g<name>\g<label>]]',
                         exceptions)
                 else:
-                    text = textlib.replaceExcept(
+                    text = self.replace_except(
                         text,
                         r'\[\[\s*({}) *:(?P<nameAndLabel>.*?)\]\]'
                         .format('|'.join(namespaces)),
@@ -530,7 +556,7 @@ class CosmeticChangesToolkit:
         cache: dict[bool | str, Any] = {}
         exceptions = ['comment', 'nowiki', 'pre', 'syntaxhighlight']
         regex = textlib.get_regexes('file', self.site)[0]
-        return textlib.replaceExcept(
+        return self.replace_except(
             text, regex, replace_magicword, exceptions)
 
     def cleanUpLinks(self, text: str) -> str:
@@ -684,9 +710,9 @@ class CosmeticChangesToolkit:
             r'(\|(?P<label>[^\]\|]*))?\]\](?P<linktrail>'
             + self.site.linktrail() + ')')
 
-        return textlib.replaceExcept(text, linkR, handleOneLink,
-                                     ['comment', 'math', 'nowiki', 'pre',
-                                      'startspace'])
+        return self.replace_except(text, linkR, handleOneLink,
+                                   ['comment', 'math', 'nowiki', 'pre',
+                                    'startspace'])
 
     def resolveHtmlEntities(self, text: str) -> str:
         """Replace HTML entities with string."""
@@ -769,8 +795,8 @@ class CosmeticChangesToolkit:
         if self.site.sitename != 'wikipedia:cs':
             exceptions.append('template')
 
-        return textlib.replaceExcept(text, r'(?m)[\t ]+( |$)', r'\1',
-                                     exceptions, site=self.site)
+        return self.replace_except(text, r'(?m)[\t ]+( |$)', r'\1',
+                                   exceptions)
 
     def removeNonBreakingSpaceBeforePercent(self, text: str) -> str:
         """Remove a non-breaking space between number and percent sign.
@@ -779,7 +805,7 @@ class CosmeticChangesToolkit:
         space in front of a percent sign, so it is no longer required to
         place it manually.
         """
-        return textlib.replaceExcept(
+        return self.replace_except(
             text, r'(\d)&(?:nbsp|#160|#x[Aa]0);%', r'\1 %', ['timeline'])
 
     def cleanUpSectionHeaders(self, text: str) -> str:
@@ -801,7 +827,7 @@ class CosmeticChangesToolkit:
         """
         if self.site.sitename in ['wiktionary:jbo', 'wiktionary:en']:
             return text
-        return textlib.replaceExcept(
+        return self.replace_except(
             text,
             r'(?m)^(={1,6})[ \t]*(?P<title>.*[^\s=])[ \t]*\1[ \t]*\r?\n',
             r'\1 \g<title> \1\n',
@@ -819,7 +845,7 @@ class CosmeticChangesToolkit:
             exceptions = ['comment', 'math', 'nowiki', 'pre',
                           'syntaxhighlight', 'template', 'timeline',
                           self.site.redirect_regex]
-            text = textlib.replaceExcept(
+            text = self.replace_except(
                 text,
                 r'(?m)'
                 r'^(?P<bullet>[:;]*(\*+|#+)[:;\*#]*)(?P<char>[^\s\*#:;].+?)',
@@ -839,7 +865,7 @@ class CosmeticChangesToolkit:
                 old, new = template
                 new = '{{%s}}' % new if new else ''
 
-                text = textlib.replaceExcept(
+                text = self.replace_except(
                     text,
                     builder.pattern(old),
                     new, exceptions)
@@ -901,21 +927,21 @@ class CosmeticChangesToolkit:
                 title_regex = (rf'(?P<link>[^{separator}]+?)'
                                r'(\s+(?P<title>[^\s].*?))')
                 url_regex = fr'\[\[?{url}?\s*\]\]?'
-                text = textlib.replaceExcept(
+                text = self.replace_except(
                     text,
                     url_regex.format(title=title_regex),
-                    replace_link, exceptions, site=self.site)
+                    replace_link, exceptions)
 
         # external link in/starting with double brackets
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'\[\[(?P<url>https?://[^\]]+?)\]\]?',
-            r'[\g<url>]', exceptions, site=self.site)
+            r'[\g<url>]', exceptions)
 
         # external link and description separated by a pipe, with
         # whitespace in front of the pipe, so that it is clear that
         # the dash is not a legitimate part of the URL.
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'\[(?P<url>https?://[^\|\] \r\n]+?) +\| *(?P<label>[^\|\]]+?)\]',
             r'[\g<url> \g<label>]', exceptions)
@@ -926,7 +952,7 @@ class CosmeticChangesToolkit:
         extensions = [fr'\.{ext}'
                       for ext in ['pdf', 'html?', 'php', 'aspx?', 'jsp']]
 
-        return textlib.replaceExcept(
+        return self.replace_except(
             text,
             r'\[(?P<url>https?://[^\|\] ]+?(' + '|'.join(extensions) + r')) *'
             r'\| *(?P<label>[^\|\]]+?)\]',
@@ -944,20 +970,20 @@ class CosmeticChangesToolkit:
         # Keep in mind that MediaWiki automatically converts <br> to <br />
         exceptions = ['comment', 'math', 'nowiki', 'pre', 'startspace',
                       'syntaxhighlight']
-        text = textlib.replaceExcept(text, r'(?i)<(b|strong)>(.*?)</\1>',
-                                     r"'''\2'''", exceptions, site=self.site)
-        text = textlib.replaceExcept(text, r'(?i)<(i|em)>(.*?)</\1>',
-                                     r"''\2''", exceptions, site=self.site)
+        text = self.replace_except(text, r'(?i)<(b|strong)>(.*?)</\1>',
+                                   r"'''\2'''", exceptions)
+        text = self.replace_except(text, r'(?i)<(i|em)>(.*?)</\1>',
+                                   r"''\2''", exceptions)
         # horizontal line without attributes in a single line
-        text = textlib.replaceExcept(text, r'(?i)([\r\n])<hr[ /]*>([\r\n])',
-                                     r'\1----\2', exceptions)
+        text = self.replace_except(text, r'(?i)([\r\n])<hr[ /]*>([\r\n])',
+                                   r'\1----\2', exceptions)
         # horizontal line with attributes; can't be done with wiki syntax
         # so we only make it XHTML compliant
-        text = textlib.replaceExcept(text, r'(?i)<hr ([^>/]+?)>',
-                                     r'<hr \1 />',
-                                     exceptions)
+        text = self.replace_except(text, r'(?i)<hr ([^>/]+?)>',
+                                   r'<hr \1 />',
+                                   exceptions)
         # a header where only spaces are in the same line
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'(?i)(?<=[\r\n]) *<h([1-7])> *([^<]+?) *</h\1> *(?=[\r\n])',
             replace_header,
@@ -975,12 +1001,12 @@ class CosmeticChangesToolkit:
         # it should be name = " or name=" NOT name   ="
         text = re.sub(r'(?i)<ref +name(= *| *=)"', r'<ref name="', text)
         # remove empty <ref/>-tag
-        text = textlib.replaceExcept(text,
-                                     r'(?i)(<ref\s*/>|<ref *>\s*</ref>)',
-                                     r'', exceptions)
-        text = textlib.replaceExcept(text,
-                                     r'(?i)<ref\s+([^>]+?)\s*>\s*</ref>',
-                                     r'<ref \1/>', exceptions)
+        text = self.replace_except(text,
+                                   r'(?i)(<ref\s*/>|<ref *>\s*</ref>)',
+                                   r'', exceptions)
+        text = self.replace_except(text,
+                                   r'(?i)<ref\s+([^>]+?)\s*>\s*</ref>',
+                                   r'<ref \1/>', exceptions)
         return text
 
     def fixStyle(self, text: str) -> str:
@@ -988,9 +1014,9 @@ class CosmeticChangesToolkit:
         exceptions = ['comment', 'math', 'nowiki', 'pre', 'startspace',
                       'syntaxhighlight']
         if self.site.code in ('de', 'en'):
-            text = textlib.replaceExcept(text,
-                                         r'(class="[^"]*)prettytable([^"]*")',
-                                         r'\1wikitable\2', exceptions)
+            text = self.replace_except(text,
+                                       r'(class="[^"]*)prettytable([^"]*")',
+                                       r'\1wikitable\2', exceptions)
         return text
 
     def fixTypo(self, text: str) -> str:
@@ -1009,19 +1035,16 @@ class CosmeticChangesToolkit:
         ]
 
         # change <number> ccm -> <number> cm³
-        text = textlib.replaceExcept(text, r'(\d)\s*(?:&nbsp;)?ccm',
-                                     r'\1&nbsp;cm³', exceptions,
-                                     site=self.site)
+        text = self.replace_except(text, r'(\d)\s*(?:&nbsp;)?ccm',
+                                   r'\1&nbsp;cm³', exceptions)
         # Solve wrong Nº sign with °C or °F
         # additional exception requested on fr-wiki for this stuff
         pattern = re.compile('«.*?»')
         exceptions.append(pattern)
-        text = textlib.replaceExcept(text, r'(\d)\s*(?:&nbsp;)?[º°]([CF])',
-                                     r'\1&nbsp;°\2', exceptions,
-                                     site=self.site)
-        text = textlib.replaceExcept(text, 'º([CF])', '°' + r'\1',
-                                     exceptions,
-                                     site=self.site)
+        text = self.replace_except(text, r'(\d)\s*(?:&nbsp;)?[º°]([CF])',
+                                   r'\1&nbsp;°\2', exceptions)
+        text = self.replace_except(text, 'º([CF])', '°' + r'\1',
+                                   exceptions)
         return text
 
     def fixArabicLetters(self, text: str) -> str:
@@ -1051,21 +1074,15 @@ class CosmeticChangesToolkit:
 
         # not to let bot edits in ascii numerals content
         exceptions.append(re.compile(f'[^{faChrs}] *?"*? *?, *?[^{faChrs}]'))
-        text = textlib.replaceExcept(text, ',', '،', exceptions,
-                                     site=self.site)
+        text = self.replace_except(text, ',', '،', exceptions)
         if self.site.code == 'ckb':
-            text = textlib.replaceExcept(text,
-                                         '\u0647([.\u060c_<\\]\\s])',
-                                         '\u06d5\\1', exceptions,
-                                         site=self.site)
-            text = textlib.replaceExcept(text, 'ه\u200c', 'ە', exceptions,
-                                         site=self.site)
-            text = textlib.replaceExcept(text, 'ه', 'ھ', exceptions,
-                                         site=self.site)
-        text = textlib.replaceExcept(text, 'ك', 'ک', exceptions,
-                                     site=self.site)
-        text = textlib.replaceExcept(text, '[ىي]', 'ی', exceptions,
-                                     site=self.site)
+            text = self.replace_except(text,
+                                       '\u0647([.\u060c_<\\]\\s])',
+                                       '\u06d5\\1', exceptions)
+            text = self.replace_except(text, 'ه\u200c', 'ە', exceptions)
+            text = self.replace_except(text, 'ه', 'ھ', exceptions)
+        text = self.replace_except(text, 'ك', 'ک', exceptions)
+        text = self.replace_except(text, '[ىي]', 'ی', exceptions)
 
         return text
 
@@ -1085,50 +1102,50 @@ class CosmeticChangesToolkit:
         # section headers to {{int:}} versions
         exceptions = ['comment', 'includeonly', 'math', 'noinclude', 'nowiki',
                       'pre', 'syntaxhighlight', 'ref', 'timeline']
-        text = textlib.replaceExcept(text,
-                                     r'([\r\n]|^)\=\= *Summary *\=\=',
-                                     r'\1== {{int:filedesc}} ==',
-                                     exceptions, True)
-        text = textlib.replaceExcept(
+        text = self.replace_except(text,
+                                   r'([\r\n]|^)\=\= *Summary *\=\=',
+                                   r'\1== {{int:filedesc}} ==',
+                                   exceptions, True)
+        text = self.replace_except(
             text,
             r'([\r\n])\=\= *\[\[Commons:Copyright tags\|Licensing\]\]: *\=\=',
             r'\1== {{int:license-header}} ==', exceptions, True)
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'([\r\n])'
             r'\=\= *(Licensing|License information|{{int:license}}) *\=\=',
             r'\1== {{int:license-header}} ==', exceptions, True)
 
         # frequent field values to {{int:}} versions
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'([\r\n]\|[Ss]ource *\= *)'
             r'(?:[Oo]wn work by uploader|[Oo]wn work|[Ee]igene [Aa]rbeit) *'
             r'([\r\n])',
             r'\1{{own}}\2', exceptions, True)
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'(\| *Permission *\=) *(?:[Ss]ee below|[Ss]iehe unten) *([\r\n])',
             r'\1\2', exceptions, True)
 
         # added to transwikied pages
-        text = textlib.replaceExcept(text, r'__NOTOC__', '', exceptions, True)
+        text = self.replace_except(text, r'__NOTOC__', '', exceptions, True)
 
         # tracker element for js upload form
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'<!-- *{{ImageUpload\|(?:full|basic)}} *-->',
             '', exceptions[1:], True)
-        text = textlib.replaceExcept(text, r'{{ImageUpload\|(?:basic|full)}}',
-                                     '', exceptions, True)
+        text = self.replace_except(text, r'{{ImageUpload\|(?:basic|full)}}',
+                                   '', exceptions, True)
 
         # duplicated section headers
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'([\r\n]|^)\=\= *{{int:filedesc}} *\=\=(?:[\r\n ]*)\=\= *'
             r'{{int:filedesc}} *\=\=',
             r'\1== {{int:filedesc}} ==', exceptions, True)
-        text = textlib.replaceExcept(
+        text = self.replace_except(
             text,
             r'([\r\n]|^)\=\= *{{int:license-header}} *\=\=(?:[\r\n ]*)'
             r'\=\= *{{int:license-header}} *\=\=',
@@ -11,6 +11,12 @@ from email.mime.multipart import MIMEMultipart as MIMEMultipartOrig
 from io import BytesIO
 
 from pywikibot.comms import http
+from pywikibot.data.api._cache import (
+    CacheBackend,
+    CacheRecord,
+    PickleCacheBackend,
+    SQLiteCacheBackend,
+)
 from pywikibot.data.api._generators import (
     APIGenerator,
     APIGeneratorBase,
@@ -30,15 +36,19 @@ from pywikibot.family import SubdomainFamily
 __all__ = (
     'APIGeneratorBase',
     'APIGenerator',
+    'CacheBackend',
+    'CacheRecord',
     'CachedRequest',
     'ListGenerator',
     'LogEntryListGenerator',
     'OptionSet',
     'PageGenerator',
     'ParamInfo',
+    'PickleCacheBackend',
     'PropertyGenerator',
     'QueryGenerator',
     'Request',
+    'SQLiteCacheBackend',
     'encode_url',
     'update_page',
 )
@@ -0,0 +1,536 @@
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Storage backends for :class:`CachedRequest` entries.
+
+.. version-added:: 11.7
+"""
+from __future__ import annotations
+
+import datetime
+import os
+import pickle
+import sqlite3
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Generator
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pywikibot
+from pywikibot import config
+
+
+__all__ = (
+    'CacheBackend',
+    'CacheRecord',
+    'PickleCacheBackend',
+    'SQLiteCacheBackend',
+)
+
+
+class CacheRecord(NamedTuple):
+
+    """Metadata of a cache entry without its unpickled response data.
+
+    .. version-added:: 11.7
+    """
+
+    key: str
+    site: str
+    description: str
+    created: pywikibot.Timestamp
+    expires: pywikibot.Timestamp
+    accessed: pywikibot.Timestamp
+    size: int
+
+
+def _to_timestamp(value: float) -> pywikibot.Timestamp:
+    """Convert a POSIX timestamp into an aware UTC Timestamp."""
+    return pywikibot.Timestamp.fromtimestamp(value, datetime.timezone.utc)
+
+
+class CacheBackend(ABC):
+
+    """Abstract storage backend for API cache entries.
+
+    A cache entry is identified by the *key* given by
+    :meth:`CachedRequest._create_file_name()
+    <data.api.CachedRequest._create_file_name>` and holds the unique
+    request description, the response data and the creation time.
+
+    The backend counts cache ``hits``, ``misses``, ``writes`` and
+    ``evictions`` of the current process in its :attr:`stats` counter.
+    If the cache exceeds its size budget, least recently used entries
+    are evicted by :meth:`evict`.
+
+    .. version-added:: 11.7
+
+    :param path: location of the cache storage
+    """
+
+    #: Fraction of the budget to which the cache is reduced when it is
+    #: exceeded. Evicting below the limit lets several writes pass
+    #: before the next eviction is necessary.
+    low_water = 0.9
+
+    #: Number of writes after which the usage estimate is refreshed to
+    #: take entries of other processes into account.
+    resync_interval = 100
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializer."""
+        self.path = Path(path)
+        self.stats: Counter[str] = Counter()
+        self._usage: list[int] | None = None
+        self._synced = 0
+
+    def __repr__(self) -> str:
+        """Return representation string."""
+        return f'{type(self).__name__}({str(self.path)!r})'
+
+    @abstractmethod
+    def load(self, key: str) -> tuple[str, Any, pywikibot.Timestamp] | None:
+        """Load a cache entry.
+
+        :param key: the key of the cache entry
+        :return: A tuple of unique description, response data and
+            creation time or None if no entry was found
+        """
+
+    @abstractmethod
+    def store(self, key: str, description: str, data: Any,
+              created: pywikibot.Timestamp, *,
+              expires: pywikibot.Timestamp, site: str) -> None:
+        """Store a cache entry.
+
+        :param key: the key of the cache entry
+        :param description: unique description of the request
+        :param data: the response data to be cached
+        :param created: creation time of the entry
+        :param expires: expiry time of the entry
+        :param site: sitename of the request's site
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete a cache entry if it exists.
+
+        :param key: the key of the cache entry
+        """
+
+    @abstractmethod
+    def purge(self, before: pywikibot.Timestamp | None = None) -> int:
+        """Delete all expired cache entries.
+
+        :param before: delete entries expired before this time. Defaults
+            to current UTC time.
+        :return: number of deleted entries
+        """
+
+    @abstractmethod
+    def usage(self) -> tuple[int, int]:
+        """Return the number of entries and their total size in bytes."""
+
+    @abstractmethod
+    def _evict_lru(self, entries: int, size: int) -> tuple[int, int]:
+        """Delete least recently used entries.
+
+        Entries are deleted until at least *entries* entries and *size*
+        bytes were removed.
+
+        :return: number of entries and bytes removed
+        """
+
+    def _track_write(self, size: int) -> None:
+        """Update statistics and usage estimate after a write."""
+        self.stats['writes'] += 1
+        if self._usage is not None:
+            self._usage[0] += 1
+            self._usage[1] += size
+
+    def evict(self, max_bytes: int = 0, max_entries: int = 0) -> int:
+        """Evict least recently used entries exceeding the budget.
+
+        The check uses an estimate of the cache usage which is updated
+        by writes of this process and refreshed from the storage every
+        :attr:`resync_interval` writes or if the budget seems to be
+        exceeded. Entries are evicted until the usage falls below
+        :attr:`low_water` of the budget.
+
+        :param max_bytes: maximum total size of the cache in bytes; 0
+            means no limit
+        :param max_entries: maximum number of cache entries; 0 means no
+            limit
+        :return: number of evicted entries
+        """
+        if max_bytes <= 0 and max_entries <= 0:
+            return 0
+
+        def exceeded() -> bool:
+            entries, size = self._usage
+            return (0 < max_entries < entries) or (0 < max_bytes < size)
+
+        writes = self.stats['writes']
+        if (self._usage is None
+                or writes - self._synced >= self.resync_interval):
+            self._usage = list(self.usage())
+            self._synced = writes
+        elif exceeded():
+            self._usage = list(self.usage())
+            self._synced = writes
+
+        if not exceeded():
+            return 0
+
+        entries, size = self._usage
+        excess_entries = max(
+            entries - int(max_entries * self.low_water), 0) \
+            if max_entries > 0 else 0
+        excess_size = max(size - int(max_bytes * self.low_water), 0) \
+            if max_bytes > 0 else 0
+        removed, freed = self._evict_lru(excess_entries, excess_size)
+        self._usage = [entries - removed, size - freed]
+        self.stats['evictions'] += removed
+        pywikibot.debug(
+            f'{self!r}: {removed} entries with {freed} bytes evicted; '
+            f'cache statistics: {dict(self.stats)}')
+        return removed
+
+
+class PickleCacheBackend(CacheBackend):
+
+    """Store every cache entry as its own pickle file.
+
+    This is the classic cache layout where *path* is the cache
+    directory and each entry is a pickle file named by its key. The
+    expiry time of an entry is appended to the pickled data as a short
+    :attr:`trailer` which is ignored by :func:`pickle.load`.
+
+    .. version-added:: 11.7
+    """
+
+    #: Trailer with a magic string and the expiry time of an entry
+    trailer = struct.Struct('<4sd')
+
+    #: Magic string of the :attr:`trailer`
+    MAGIC = b'PWBE'
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.path / key
+
+    def load(self, key: str) -> tuple[str, Any, pywikibot.Timestamp] | None:
+        """Load a cache entry from its pickle file.
+
+        The access time of the file is updated explicitly because it is
+        used for LRU eviction and filesystems may be mounted with
+        ``noatime``.
+        """
+        path = self._entry_path(key)
+        try:
+            f = path.open('rb')
+        except OSError:
+            return None  # file not found
+
+        with f:
+            entry = pickle.load(f)
+
+        with suppress(OSError):
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        return entry
+
+    def store(self, key: str, description: str, data: Any,
+              created: pywikibot.Timestamp, *,
+              expires: pywikibot.Timestamp, site: str) -> None:
+        """Write a cache entry to its pickle file.
+
+        *expires* is written to the :attr:`trailer` of the file and used
+        by :meth:`purge`; *site* is not stored.
+        """
+        path = self._entry_path(key)
+        with suppress(OSError), path.open('wb') as f:
+            pickle.dump((description, data, created), f,
+                        protocol=config.pickle_protocol)
+            f.write(self.trailer.pack(self.MAGIC, expires.timestamp()))
+            self._track_write(f.tell())
+            return
+        # delete invalid cache entry
+        path.unlink()
+
+    def delete(self, key: str) -> None:
+        """Delete the pickle file of a cache entry."""
+        self._entry_path(key).unlink(missing_ok=True)
+
+    def _expires(self, path: Path) -> float:
+        """Return the expiry time of a cache file as POSIX timestamp.
+
+        Files without a :attr:`trailer` were written by older versions.
+        Their expiry time is estimated from the modification time and
+        ``config.API_config_expiry`` which limits the expiry of
+        :class:`CachedRequest<data.api.CachedRequest>`.
+        """
+        with path.open('rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size > self.trailer.size:
+                f.seek(-self.trailer.size, os.SEEK_END)
+                magic, expires = self.trailer.unpack(
+                    f.read(self.trailer.size))
+                if magic == self.MAGIC:
+                    return expires
+
+        return path.stat().st_mtime + config.API_config_expiry * 86400
+
+    def purge(self, before: pywikibot.Timestamp | None = None) -> int:
+        """Delete all cache files expired before the given time.
+
+        The expiry time is read from the :attr:`trailer` of each file;
+        the pickled response data are not loaded.
+        """
+        if before is None:
+            before = pywikibot.Timestamp.nowutc()
+        limit = before.timestamp()
+        count = 0
+        if not self.path.is_dir():
+            return count
+
+        for entry in self.path.iterdir():
+            with suppress(OSError):
+                if entry.is_file() and self._expires(entry) < limit:
+                    entry.unlink()
+                    count += 1
+        self._usage = None
+        return count
+
+    def usage(self) -> tuple[int, int]:
+        """Return the number of cache files and their total size."""
+        entries = size = 0
+        with os.scandir(self.path) as it:
+            for entry in it:
+                with suppress(OSError):
+                    if entry.is_file():
+                        size += entry.stat().st_size
+                        entries += 1
+        return entries, size
+
+    def _evict_lru(self, entries: int, size: int) -> tuple[int, int]:
+        """Delete cache files with the oldest access time."""
+        files = []
+        with os.scandir(self.path) as it:
+            for entry in it:
+                with suppress(OSError):
+                    if entry.is_file():
+                        stat = entry.stat()
+                        files.append((stat.st_atime, stat.st_size, entry.path))
+        files.sort()
+
+        removed = freed = 0
+        for _, filesize, filepath in files:
+            if removed >= entries and freed >= size:
+                break
+            with suppress(FileNotFoundError):
+                os.remove(filepath)
+                removed += 1
+                freed += filesize
+        return removed, freed
+
+
+class SQLiteCacheBackend(CacheBackend):
+
+    """Store all cache entries in a single SQLite database file.
+
+    The database uses write-ahead logging which allows concurrent
+    readers from several bot processes while one process is writing.
+    Entries are indexed by site and expiry time so expired entries can
+    be purged with one statement and entries can be queried without
+    unpickling their response data.
+
+    Each thread uses its own database connection. Space freed by
+    eviction is returned to the filesystem incrementally.
+
+    .. version-added:: 11.7
+
+    :param path: path of the database file
+    :param timeout: seconds to wait for a database lock held by another
+        process
+    """
+
+    TABLE = 'apicache'
+
+    def __init__(self, path: str | Path, timeout: float = 30) -> None:
+        """Initializer."""
+        super().__init__(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Return the database connection of the current thread."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout,
+                                   isolation_level=None)
+            conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            with self._lock:
+                if not self._initialized:
+                    self._create_schema(conn)
+                    self._initialized = True
+            self._local.connection = conn
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the cache table and its indexes if they are missing."""
+        conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE} (
+                key TEXT PRIMARY KEY,
+                site TEXT NOT NULL,
+                description TEXT NOT NULL,
+                created REAL NOT NULL,
+                expires REAL NOT NULL,
+                accessed REAL NOT NULL,
+                size INTEGER NOT NULL,
+                data BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS {self.TABLE}_site
+                ON {self.TABLE} (site);
+            CREATE INDEX IF NOT EXISTS {self.TABLE}_expires
+                ON {self.TABLE} (expires);
+            CREATE INDEX IF NOT EXISTS {self.TABLE}_accessed
+                ON {self.TABLE} (accessed);
+        """)
+
+    def close(self) -> None:
+        """Close the database connection of the current thread."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+
+    def load(self, key: str) -> tuple[str, Any, pywikibot.Timestamp] | None:
+        """Load a cache entry and update its access time."""
+        row = self.connection.execute(
+            f'SELECT description, data, created FROM {self.TABLE} '
+            'WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+
+        self.connection.execute(
+            f'UPDATE {self.TABLE} SET accessed = ? WHERE key = ?',
+            (time.time(), key))
+        description, data, created = row
+        return description, pickle.loads(data), _to_timestamp(created)
+
+    def load_data(self, key: str) -> Any:
+        """Load the response data of a cache entry only.
+
+        :raises KeyError: no entry was found for *key*
+        """
+        row = self.connection.execute(
+            f'SELECT data FROM {self.TABLE} WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return pickle.loads(row[0])
+
+    def store(self, key: str, description: str, data: Any,
+              created: pywikibot.Timestamp, *,
+              expires: pywikibot.Timestamp, site: str) -> None:
+        """Insert or replace a cache entry."""
+        blob = pickle.dumps(data, protocol=config.pickle_protocol)
+        self.connection.execute(
+            f'INSERT OR REPLACE INTO {self.TABLE} '
+            '(key, site, description, created, expires, accessed, size, data)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, site, description, created.timestamp(),
+             expires.timestamp(), time.time(), len(blob), blob))
+        self._track_write(len(blob))
+
+    def delete(self, key: str) -> None:
+        """Delete a cache entry."""
+        self.connection.execute(
+            f'DELETE FROM {self.TABLE} WHERE key = ?', (key,))
+
+    def purge(self, before: pywikibot.Timestamp | None = None) -> int:
+        """Delete all entries expired before the given time."""
+        if before is None:
+            before = pywikibot.Timestamp.nowutc()
+        cursor = self.connection.execute(
+            f'DELETE FROM {self.TABLE} WHERE expires < ?',
+            (before.timestamp(), ))
+        self._usage = None
+        return cursor.rowcount
+
+    def usage(self) -> tuple[int, int]:
+        """Return the number of entries and the total size of their data."""
+        return tuple(self.connection.execute(
+            f'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.TABLE}'
+        ).fetchone())
+
+    def _evict_lru(self, entries: int, size: int) -> tuple[int, int]:
+        """Delete expired and least recently accessed entries.
+
+        Entries which are already expired are deleted first. Afterwards
+        pages of the database file which became free are released.
+        """
+        conn = self.connection
+        now = time.time()
+        removed, freed = conn.execute(
+            f'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.TABLE} '
+            'WHERE expires < ?', (now, )).fetchone()
+        conn.execute(f'DELETE FROM {self.TABLE} WHERE expires < ?', (now, ))
+
+        while removed < entries or freed < size:
+            rows = conn.execute(
+                f'SELECT key, size FROM {self.TABLE} ORDER BY accessed '
+                'LIMIT 100').fetchall()
+            if not rows:
+                break
+
+            keys = []
+            for key, entry_size in rows:
+                if removed >= entries and freed >= size:
+                    break
+                keys.append((key, ))
+                removed += 1
+                freed += entry_size
+            conn.executemany(
+                f'DELETE FROM {self.TABLE} WHERE key = ?', keys)
+
+        conn.execute('PRAGMA incremental_vacuum')
+        return removed, freed
+
+    def entries(self, site: str | None = None) -> Generator[CacheRecord]:
+        """Iterate over the metadata of cache entries.
+
+        The response data are not loaded; use :meth:`load_data` to
+        retrieve them.
+
+        :param site: only yield entries of the given sitename like
+            ``'wikipedia:en'``
+        """
+        query = (f'SELECT key, site, description, created, expires, '
+                 f'accessed, size FROM {self.TABLE}')
+        params: tuple[str, ...] = ()
+        if site is not None:
+            query += ' WHERE site = ?'
+            params = (site, )
+
+        for key, sitename, description, created, expires, accessed, size \
+                in self.connection.execute(query, params).fetchall():
+            yield CacheRecord(key, sitename, description,
+                              _to_timestamp(created), _to_timestamp(expires),
+                              _to_timestamp(accessed), size)
+
+    def __len__(self) -> int:
+        """Return the number of cache entries."""
+        return self.connection.execute(
+            f'SELECT COUNT(*) FROM {self.TABLE}').fetchone()[0]
@@ -12,13 +12,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from collections.abc import AsyncGenerator, Callable, Iterable
 from contextlib import suppress
 from typing import Any, cast
 from warnings import warn
 
 import pywikibot
 from pywikibot import config
+from pywikibot.data.api._requests import run_in_thread
 from pywikibot.exceptions import (
     Error,
     InvalidTitleError,
@@ -103,6 +104,30 @@ class APIGeneratorBase(ABC):
 
         return True
 
+    async def __aiter__(self) -> AsyncGenerator[Any]:
+        """Iterate items from an asyncio event loop.
+
+        Each step of the generator including API requests for query
+        continuation is processed in a worker thread of a thread pool
+        with ``config.API_async_workers`` threads. Several generators
+        may be iterated concurrently:
+
+        .. code-block:: python
+
+           async def titles(gen):
+               return [page.title() async for page in gen]
+
+           async def main(site):
+               return await asyncio.gather(
+                   titles(site.allpages(namespace=0, total=100)),
+                   titles(site.allpages(namespace=10, total=100)))
+
+        .. version-added:: 11.7
+        """
+        done = object()
+        while (item := await run_in_thread(next, self, done)) is not done:
+            yield item
+
     def _clean_kwargs(self, kwargs, **mw_api_args):
         """Clean kwargs, define site and request class."""
         if 'site' not in kwargs:
@@ -546,6 +571,42 @@ class QueryGenerator(APIGeneratorBase, GeneratorWrapper):
         elif self.prefix + 'namespace' in self.request:
             del self.request[self.prefix + 'namespace']
 
+    def support_redirect_filter(self) -> bool:
+        """Check if a redirect filter is a supported parameter on this query.
+
+        .. version-added:: 11.7
+
+        :return: True if the module has a ``filterredir`` parameter
+            which can select redirects or non-redirects, False otherwise
+        """
+        if not self.limited_module:
+            return False  # some modules do not have a prefix
+
+        param = self.site._paraminfo.parameter(
+            'query+' + self.limited_module, 'filterredir')
+        return bool(param) and 'nonredirects' in param.get(
+            'type', ['redirects', 'nonredirects'])
+
+    def set_redirect_filter(self, redirects: bool | None) -> None:
+        """Set a redirect filter on this query.
+
+        .. version-added:: 11.7
+
+        :param redirects: True to yield redirects only, False to yield
+            non-redirects only. None clears any redirect restriction.
+        :raises TypeError: module does not support a redirect filter.
+            Check it with :meth:`support_redirect_filter` first.
+        """
+        if not self.support_redirect_filter():
+            raise TypeError(f'{self.limited_module or self.modules} module'
+                            ' does not support a redirect filter parameter')
+
+        key = self.prefix + 'filterredir'
+        if redirects is not None:
+            self.request[key] = 'redirects' if redirects else 'nonredirects'
+        elif key in self.request:
+            del self.request[key]
+
     def continue_update(self) -> None:
         """Update query with continue parameters.
 
@@ -6,17 +6,19 @@
 """Objects representing API requests."""
 from __future__ import annotations
 
+import asyncio
 import datetime
 import hashlib
 import inspect
 import math
 import os
-import pickle
 import pprint
 import re
 import sys
+import threading
 import traceback
 from collections.abc import Callable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from email.mime.nonmultipart import MIMENonMultipart
 from pathlib import Path
@@ -31,6 +33,11 @@ from pywikibot import config
 from pywikibot.backports import sentinel
 from pywikibot.comms import http
 from pywikibot.data import WaitingMixin
+from pywikibot.data.api._cache import (
+    CacheBackend,
+    PickleCacheBackend,
+    SQLiteCacheBackend,
+)
 from pywikibot.exceptions import (
     Client414Error,
     Error,
@@ -81,10 +88,56 @@ WRITE_ACTIONS = {
     'wblmergelexemes', 'wblremoveform', 'wblremovesense',
 }
 
+# Storage backends for CachedRequest selectable by config.API_cache_backend
+CACHE_BACKENDS: dict[str, type[CacheBackend]] = {
+    'pickle': PickleCacheBackend,
+    'sqlite': SQLiteCacheBackend,
+}
+
+_cache_backends: dict[tuple[str, Path], CacheBackend] = {}
+
+# Thread pool of the asyncio entry points and its size
+_async_executor: tuple[int, ThreadPoolExecutor] | None = None
+_async_executor_lock = threading.Lock()
+
 lagpattern = re.compile(
     r'Waiting for [\w.: ]+: (?P<lag>\d+(?:\.\d+)?) seconds? lagged')
 
 
+def _get_async_executor() -> ThreadPoolExecutor:
+    """Return the thread pool used by the asyncio entry points.
+
+    The pool has ``config.API_async_workers`` threads. It is replaced
+    by a new pool if the config variable was changed; running tasks of
+    the previous pool are finished.
+
+    .. version-added:: 11.7
+    """
+    global _async_executor
+    workers = config.API_async_workers
+    with _async_executor_lock:
+        if _async_executor is None or _async_executor[0] != workers:
+            if _async_executor is not None:
+                _async_executor[1].shutdown(wait=False)
+            _async_executor = workers, ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix='pywikibot-async')
+        return _async_executor[1]
+
+
+async def run_in_thread(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking function in the asyncio thread pool.
+
+    This is a thread offload helper for the asyncio entry points like
+    :meth:`Request.asubmit`. The function still blocks a worker thread
+    of the pool while it is running; the number of worker threads is
+    set by ``config.API_async_workers``.
+
+    .. version-added:: 11.7
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_async_executor(), func, *args)
+
+
 class Request(MutableMapping, WaitingMixin):
 
     """A request to a Site's api.php interface.
@@ -1222,6 +1275,34 @@ The text message is:
 
         raise MaxlagTimeoutError(msg)
 
+    async def asubmit(self) -> dict:
+        """Submit a query from an asyncio event loop.
+
+        This is a thread offload convenience: the request is processed
+        by the blocking :meth:`submit` in a worker thread of a thread
+        pool. Parameter encoding, error and retry handling, ``maxlag``
+        and throttling are the same as for the synchronous call but
+        several requests may be awaited concurrently:
+
+        .. code-block:: python
+
+           async def main(site, titles):
+               requests = [site.simple_request(action='query', titles=title)
+                           for title in titles]
+               return await asyncio.gather(
+                   *(req.asubmit() for req in requests))
+
+        .. note:: There is no asynchronous HTTP transport. The number
+           of concurrent requests is limited by the size of the thread
+           pool, which can be raised with ``config.API_async_workers``,
+           and by the site's throttle.
+
+        .. version-added:: 11.7
+
+        :return: a dict containing data retrieved from api.php
+        """
+        return await run_in_thread(self.submit)
+
 
 class CachedRequest(Request):
 
@@ -1335,17 +1416,63 @@ class CachedRequest(Request):
         """Check whether the timestamp is expired."""
         return dt + self.expiry < pywikibot.Timestamp.nowutc()
 
+    @classmethod
+    def _get_cache_backend(cls) -> CacheBackend:
+        """Return the storage backend for cache entries.
+
+        The backend is selected by ``config.API_cache_backend``.
+        ``'pickle'`` stores each entry as a file in the
+        :meth:`cache directory<_get_cache_dir>`, ``'sqlite'`` stores all
+        entries in a single SQLite database file next to it.
+
+        .. version-added:: 11.7
+
+        :meta public:
+        """
+        name = config.API_cache_backend
+        try:
+            backend_class = CACHE_BACKENDS[name]
+        except KeyError:
+            raise ValueError(
+                f'Unknown API cache backend {name!r}; use one of '
+                f'{", ".join(map(repr, CACHE_BACKENDS))}') from None
+
+        path = cls._get_cache_dir()
+        if backend_class is not PickleCacheBackend:
+            path = path.with_suffix('.sqlite3')
+
+        key = name, path
+        if key not in _cache_backends:
+            _cache_backends[key] = backend_class(path)
+        return _cache_backends[key]
+
     def _load_cache(self) -> bool:
         """Load cache entry for request, if available.
 
+        .. version-changed:: 11.7
+           use :meth:`_get_cache_backend` to load the entry and count
+           cache hits and misses.
+
         :return: Whether the request was loaded from the cache
         """
         self._add_defaults()
+        backend = self._get_cache_backend()
+        hit = self._load_cache_entry(backend)
+        backend.stats['hits' if hit else 'misses'] += 1
+        return hit
+
+    def _load_cache_entry(self, backend: CacheBackend) -> bool:
+        """Load cache entry from the given backend.
+
+        .. version-added:: 11.7
+        """
         try:
-            filename = self._cachefile_path()
-            with filename.open('rb') as f:
-                uniquedescr, self._data, self._cachetime = pickle.load(f)
+            key = self._create_file_name()
+            entry = backend.load(key)
+            if entry is None:
+                return False
 
+            uniquedescr, self._data, self._cachetime = entry
             if uniquedescr != self._uniquedescriptionstr():
                 raise RuntimeError('Expected unique description for the cache '
                                    'entry is different from file entry.')
@@ -1355,11 +1482,11 @@ class CachedRequest(Request):
                 return False
 
             pywikibot.debug(
-                f'{type(self).__name__}: cache ({filename.parent}) hit\n'
-                f'{filename.name}, API request:\n{uniquedescr}')
+                f'{type(self).__name__}: cache ({backend!r}) hit\n'
+                f'{key}, API request:\n{uniquedescr}')
 
         except OSError:
-            pass  # file not found
+            pass
         except Exception as e:
             pywikibot.info(f'Could not load cache: {e!r}')
         else:
@@ -1368,14 +1495,26 @@ class CachedRequest(Request):
         return False
 
     def _write_cache(self, data) -> None:
-        """Write data to self._cachefile_path()."""
-        data = self._uniquedescriptionstr(), data, pywikibot.Timestamp.nowutc()
-        path = self._cachefile_path()
-        with suppress(OSError), path.open('wb') as f:
-            pickle.dump(data, f, protocol=config.pickle_protocol)
-            return
-        # delete invalid cache entry
-        path.unlink()
+        """Write data to the cache backend.
+
+        Least recently used entries are evicted afterwards if the cache
+        exceeds ``config.API_cache_max_bytes`` or
+        ``config.API_cache_max_entries``.
+
+        .. version-changed:: 11.7
+           use :meth:`_get_cache_backend` to store the entry; evict
+           entries exceeding the cache budget.
+        """
+        now = pywikibot.Timestamp.nowutc()
+        backend = self._get_cache_backend()
+        try:
+            backend.store(self._create_file_name(),
+                          self._uniquedescriptionstr(), data, now,
+                          expires=now + self.expiry, site=self.site.sitename)
+            backend.evict(config.API_cache_max_bytes,
+                          config.API_cache_max_entries)
+        except Exception as e:
+            pywikibot.info(f'Could not write cache: {e!r}')
 
     def submit(self):
         """Submit cached request."""
@@ -8,14 +8,17 @@ from __future__ import annotations
 
 import difflib
 import math
-from collections import abc
-from collections.abc import Iterable, Sequence
+import time
+from bisect import bisect_left
+from collections import Counter, abc
+from collections.abc import Hashable, Iterable, Sequence
 from difflib import _format_range_unified  # type: ignore[attr-defined]
-from difflib import SequenceMatcher
+from difflib import Match, SequenceMatcher
 from heapq import nlargest
 from itertools import zip_longest
 
 import pywikibot
+from pywikibot import config
 from pywikibot.tools import chars, deprecated_signature
 
 
@@ -237,6 +240,185 @@ class _SuperHunk(abc.Sequence):
             hunk.reviewed = reviewed
 
 
+class _DiffTimeoutError(Exception):
+
+    """The CPU time limit for computing a diff was exceeded."""
+
+
+class _PatienceMatcher(SequenceMatcher):
+
+    """SequenceMatcher using the patience diff algorithm.
+
+    Items are replaced by integer ids first. Lines which occur exactly
+    once in both sequences are aligned by their longest increasing
+    subsequence and the parts between them are compared recursively;
+    only parts without such unique lines are compared by
+    :class:`difflib.SequenceMatcher`. With a time limit, such a part is
+    not compared if the estimated work exceeds the remaining time.
+
+    Only the matching blocks are computed differently; the opcodes are
+    derived from them by the inherited methods.
+
+    .. version-added:: 11.7
+    """
+
+    #: Estimated item comparisons of :meth:`SequenceMatcher.find_longest_match`
+    #: per CPU second
+    COMPARISONS_PER_SECOND = 5_000_000
+
+    def __init__(self, a: Sequence[Hashable], b: Sequence[Hashable],
+                 timeout: float | None = None) -> None:
+        """Initializer.
+
+        :param a: first sequence
+        :param b: second sequence
+        :param timeout: CPU time in seconds to compute the matching
+            blocks; no limit if None or 0
+        """
+        self._deadline = time.process_time() + timeout if timeout else None
+        super().__init__(None, a, b, autojunk=False)
+
+    def _check_deadline(self) -> None:
+        """Raise _DiffTimeoutError if the CPU time limit is exceeded."""
+        if self._deadline and time.process_time() > self._deadline:
+            raise _DiffTimeoutError
+
+    def _check_work(self, a: list[int], b: list[int], alo: int, ahi: int,
+                    blo: int, bhi: int) -> None:
+        """Raise _DiffTimeoutError if a longest match search takes too long.
+
+        The work of :meth:`SequenceMatcher.find_longest_match` is the
+        number of equal item pairs in both ranges; it is quadratic for
+        ranges with few distinct items like table rows.
+        """
+        if not self._deadline:
+            return
+
+        count_b = Counter(b[blo:bhi])
+        work = sum(count_b[item] for item in a[alo:ahi])
+        remaining = self._deadline - time.process_time()
+        if work > remaining * self.COMPARISONS_PER_SECOND:
+            raise _DiffTimeoutError
+
+    def _fallback_matches(self, a: list[int], b: list[int]) -> list[Match]:
+        """Return matching blocks of sequences without unique items.
+
+        The blocks are found like :meth:`SequenceMatcher.get_matching_blocks`
+        does but the time limit is checked before each search.
+        """
+        matcher = SequenceMatcher(None, a, b, autojunk=False)
+        blocks = []
+        queue = [(0, len(a), 0, len(b))]
+        while queue:
+            self._check_deadline()
+            alo, ahi, blo, bhi = queue.pop()
+            self._check_work(a, b, alo, ahi, blo, bhi)
+            i, j, size = match = matcher.find_longest_match(alo, ahi,
+                                                            blo, bhi)
+            if not size:
+                continue
+
+            blocks.append(match)
+            if alo < i and blo < j:
+                queue.append((alo, i, blo, j))
+            if i + size < ahi and j + size < bhi:
+                queue.append((i + size, ahi, j + size, bhi))
+        return blocks
+
+    @staticmethod
+    def _unique_anchors(a: list[int], b: list[int], alo: int, ahi: int,
+                        blo: int, bhi: int) -> list[tuple[int, int]]:
+        """Return aligned positions of items unique in both ranges."""
+        count_a = Counter(a[alo:ahi])
+        count_b = Counter(b[blo:bhi])
+        pos_b = {item: j for j, item in enumerate(b[blo:bhi], blo)
+                 if count_b[item] == 1}
+        pairs = [(i, pos_b[item]) for i, item in enumerate(a[alo:ahi], alo)
+                 if count_a[item] == 1 and item in pos_b]
+        if not pairs:
+            return []
+
+        # longest increasing subsequence of b positions (patience sort)
+        tails: list[int] = []
+        tail_index: list[int] = []
+        previous: list[int] = [-1] * len(pairs)
+        for k, (_, j) in enumerate(pairs):
+            pos = bisect_left(tails, j)
+            if pos:
+                previous[k] = tail_index[pos - 1]
+            if pos == len(tails):
+                tails.append(j)
+                tail_index.append(k)
+            else:
+                tails[pos] = j
+                tail_index[pos] = k
+
+        anchors = []
+        k = tail_index[-1]
+        while k >= 0:
+            anchors.append(pairs[k])
+            k = previous[k]
+        anchors.reverse()
+        return anchors
+
+    def get_matching_blocks(self) -> list[Match]:
+        """Return list of triples describing matching subsequences.
+
+        :raises _DiffTimeoutError: the CPU time limit was exceeded
+        """
+        if self.matching_blocks is not None:
+            return self.matching_blocks
+
+        ids: dict[Hashable, int] = {}
+        a = [ids.setdefault(item, len(ids)) for item in self.a]
+        b = [ids.setdefault(item, len(ids)) for item in self.b]
+
+        matches: list[tuple[int, int]] = []
+        stack = [(0, len(a), 0, len(b))]
+        while stack:
+            self._check_deadline()
+            alo, ahi, blo, bhi = stack.pop()
+
+            # common prefix and suffix
+            while alo < ahi and blo < bhi and a[alo] == b[blo]:
+                matches.append((alo, blo))
+                alo += 1
+                blo += 1
+            while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+                ahi -= 1
+                bhi -= 1
+                matches.append((ahi, bhi))
+            if alo == ahi or blo == bhi:
+                continue
+
+            anchors = self._unique_anchors(a, b, alo, ahi, blo, bhi)
+            if not anchors:
+                for i, j, size in self._fallback_matches(a[alo:ahi],
+                                                         b[blo:bhi]):
+                    matches.extend((alo + i + k, blo + j + k)
+                                   for k in range(size))
+                continue
+
+            for i, j in anchors:
+                matches.append((i, j))
+                stack.append((alo, i, blo, j))
+                alo, blo = i + 1, j + 1
+            stack.append((alo, ahi, blo, bhi))
+
+        matches.sort()
+        blocks: list[Match] = []
+        for i, j in matches:
+            if blocks:
+                last = blocks[-1]
+                if last.a + last.size == i and last.b + last.size == j:
+                    blocks[-1] = Match(last.a, last.b, last.size + 1)
+                    continue
+            blocks.append(Match(i, j, 1))
+        blocks.append(Match(len(a), len(b), 0))
+        self.matching_blocks = blocks
+        return blocks
+
+
 class PatchManager:
 
     """Apply patches to text_a to obtain a new text.
@@ -246,8 +428,13 @@ class PatchManager:
     .. version-changed:: 11.0
        *text_a* and *text_b* are positional-only parameters.
        *by_letter* and *replace_invisible* are keyword-only parameters.
+    .. version-changed:: 11.7
+       *algorithm* and *timeout* parameters were added.
     """
 
+    #: Supported diff algorithms
+    ALGORITHMS = ('difflib', 'patience')
+
     @deprecated_signature(since='11.0.0')
     def __init__(
         self,
@@ -258,6 +445,8 @@ class PatchManager:
         *,
         by_letter: bool | None = None,
         replace_invisible: bool = False,
+        algorithm: str | None = None,
+        timeout: float | None = None,
     ) -> None:
         """Initializer.
 
@@ -268,6 +457,13 @@ class PatchManager:
             comparison can be done letter by letter.
         :param replace_invisible: Replace invisible characters like
             U+200e with the charnumber in brackets (e.g. <200e>).
+        :param algorithm: 'difflib' or 'patience'; the
+            ``diff_algorithm`` config variable is used if None.
+        :param timeout: CPU time in seconds for the 'patience' diff; the
+            ``diff_timeout`` config variable is used if None. If the
+            time is exceeded, the whole changed part becomes a single
+            hunk and :meth:`print_hunks` only shows a summary.
+        :raises ValueError: unknown *algorithm*
         """
         self.context = context
         self._replace_invisible = replace_invisible
@@ -278,9 +474,25 @@ class PatchManager:
             self.a = text_a
             self.b = text_b
 
+        if algorithm is None:
+            algorithm = config.diff_algorithm
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f'Unknown diff algorithm {algorithm!r}; use one '
+                             f'of {", ".join(self.ALGORITHMS)}')
+        self.timeout = config.diff_timeout if timeout is None else timeout
+
+        #: True if the diff was not computed within the timeout
+        self.summary = False
         # groups and hunk have same order (one hunk correspond to one group).
-        s = difflib.SequenceMatcher(None, self.a, self.b)
-        self.groups = list(s.get_grouped_opcodes(0))
+        if algorithm == 'patience':
+            s = _PatienceMatcher(self.a, self.b, self.timeout)
+        else:
+            s = difflib.SequenceMatcher(None, self.a, self.b)
+        try:
+            self.groups = list(s.get_grouped_opcodes(0))
+        except _DiffTimeoutError:
+            self.summary = True
+            self.groups = self._get_summary_groups()
         self.hunks = []
         previous_hunk = None
         for group in self.groups:
@@ -298,6 +510,30 @@ class PatchManager:
         self.blocks = self.get_blocks()
         self._super_hunks = self._generate_super_hunks()
 
+    def _get_summary_groups(
+        self
+    ) -> list[list[tuple[str, int, int, int, int]]]:
+        """Return one group for all lines between common head and tail.
+
+        .. version-added:: 11.7
+        """
+        a, b = self.a, self.b
+        size = min(len(a), len(b))
+        lo = 0
+        while lo < size and a[lo] == b[lo]:
+            lo += 1
+        hi = 0
+        while hi < size - lo and a[-1 - hi] == b[-1 - hi]:
+            hi += 1
+
+        a_end, b_end = len(a) - hi, len(b) - hi
+        group = []
+        if lo < a_end:
+            group.append(('delete', lo, a_end, lo, lo))
+        if lo < b_end:
+            group.append(('insert', a_end, a_end, lo, b_end))
+        return [group] if group else []
+
     def get_blocks(self) -> list[tuple[int, tuple[int, int], tuple[int, int]]]:
         """Return list with blocks of indexes.
 
@@ -330,8 +566,21 @@ class PatchManager:
         return blocks
 
     def print_hunks(self) -> None:
-        """Print the headers and diff texts of all hunks to the output."""
-        if self.hunks:
+        """Print the headers and diff texts of all hunks to the output.
+
+        .. version-changed:: 11.7
+           only a summary of the changes is printed if the diff was not
+           computed within the timeout.
+        """
+        if self.summary and self.hunks:
+            hunk = self.hunks[0]
+            removed = hunk.a_rng[1] - hunk.a_rng[0]
+            added = hunk.b_rng[1] - hunk.b_rng[0]
+            pywikibot.info(
+                f'{hunk.get_header()}<<lightyellow>>Diff was not computed '
+                f'within {self.timeout} seconds: {removed} lines removed, '
+                f'{added} lines added<<default>>')
+        elif self.hunks:
             pywikibot.info('\n'.join(self._generate_diff(super_hunk)
                                      for super_hunk in self._super_hunks))
 
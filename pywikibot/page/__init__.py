@@ -11,12 +11,19 @@ from typing import Union
 from pywikibot.page._basepage import BasePage
 from pywikibot.page._category import Category
 from pywikibot.page._filepage import FileInfo, FilePage
-from pywikibot.page._links import BaseLink, Link, SiteLink, html2unicode
+from pywikibot.page._links import (
+    BaseLink,
+    Link,
+    LinkTable,
+    SiteLink,
+    html2unicode,
+)
 from pywikibot.page._page import Page
 from pywikibot.page._revision import Revision
 from pywikibot.page._user import Contribution, User
 from pywikibot.page._wikibase import (
     Claim,
+    EntityEditBatch,
     ItemPage,
     LexemeForm,
     LexemePage,
@@ -33,6 +40,7 @@ from pywikibot.site import BaseSite as _BaseSite
 __all__ = (
     'BaseLink',
     'Link',
+    'LinkTable',
     'SiteLink',
     'BasePage',
     'Page',
@@ -47,6 +55,7 @@ __all__ = (
     'PropertyPage',
     'Property',
     'Claim',
+    'EntityEditBatch',
     'FileInfo',
     'WikibaseEntity',
     'MediaInfo',
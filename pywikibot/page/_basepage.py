@@ -677,14 +677,45 @@ class BasePage(ComparableMixin):
 
     @text.deleter
     def text(self) -> None:
-        """Delete the current (edited) wikitext."""
+        """Delete the current (edited) wikitext.
+
+        .. version-changed:: 11.7
+           cached parse results of the deleted text are removed; see
+           :func:`textlib.clear_parse_cache`.
+        """
         if hasattr(self, '_text'):
+            if self._text is not None:
+                textlib.clear_parse_cache(self._text)
             del self._text
         if hasattr(self, '_expanded_text'):
             del self._expanded_text
         if hasattr(self, '_raw_extracted_templates'):
             del self._raw_extracted_templates
 
+    @property
+    def section_index(self) -> textlib.SectionIndex:
+        """Return a section index of the current :attr:`text`.
+
+        The index is cached and built again only if :attr:`text` was
+        changed other than by the index itself. Use
+        :meth:`textlib.SectionIndex.replace` to rewrite a single section
+        without scanning the whole text again:
+
+        .. code-block:: python
+
+           index = page.section_index
+           i = index.sections.index('History')
+           page.text = index.replace(i, '\nNew content\n\n')
+
+        .. version-added:: 11.7
+        """
+        text = self.text
+        index = getattr(self, '_section_index', None)
+        if index is None or index.text != text:
+            index = textlib.SectionIndex(text, self.site)
+            self._section_index = index
+        return index
+
     def preloadText(self) -> str:
         """The text returned by EditFormPreloadText.
 
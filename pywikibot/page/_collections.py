@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import reprlib
 from collections import defaultdict
-from collections.abc import MutableMapping, MutableSequence
+from collections.abc import Callable, MutableMapping, MutableSequence
 from typing import Any
 
 import pywikibot
@@ -24,7 +24,40 @@ __all__ = (
 )
 
 
-class BaseDataDict(MutableMapping):
+class _LazyCompletion:
+
+    """Mixin for mappings of which only a subset of keys was loaded.
+
+    If an entity was fetched with a ``languages`` or ``sitefilter``
+    restriction, :attr:`_loader` is set by the entity. It is called
+    once when a key is looked up which was not loaded; the loader adds
+    the remaining keys to :attr:`_data` except those which were set or
+    deleted meanwhile.
+
+    .. version-added:: 11.7
+    """
+
+    #: callable to load the remaining data or None if data are complete
+    _loader: Callable[[], None] | None = None
+
+    #: keys deleted before the data were completed
+    _deleted: frozenset[str] = frozenset()
+
+    def _complete(self, key: str) -> None:
+        """Load the remaining data if *key* is missing."""
+        if self._loader is not None and key not in self._data:
+            loader, self._loader = self._loader, None
+            loader()
+
+    def _delete(self, key: str) -> None:
+        """Delete *key* and keep it deleted when data are completed."""
+        self._complete(key)
+        del self._data[key]
+        if self._loader is not None:
+            self._deleted |= {key}
+
+
+class BaseDataDict(_LazyCompletion, MutableMapping):
 
     """Base structure holding data for a Wikibase entity.
 
@@ -45,6 +78,7 @@ class BaseDataDict(MutableMapping):
 
     def __getitem__(self, key: BaseSite | str) -> Any:
         key = self.normalizeKey(key)
+        self._complete(key)
         return self._data[key]
 
     def __setitem__(self, key: BaseSite | str, value: Any) -> None:
@@ -52,8 +86,7 @@ class BaseDataDict(MutableMapping):
         self._data[key] = value
 
     def __delitem__(self, key: BaseSite | str) -> None:
-        key = self.normalizeKey(key)
-        del self._data[key]
+        self._delete(self.normalizeKey(key))
 
     def __iter__(self):
         return iter(self._data)
@@ -63,6 +96,7 @@ class BaseDataDict(MutableMapping):
 
     def __contains__(self, key: BaseSite | str) -> bool:
         key = self.normalizeKey(key)
+        self._complete(key)
         return key in self._data
 
     def __repr__(self) -> str:
@@ -199,38 +233,70 @@ class AliasesDict(BaseDataDict):
 
 class ClaimCollection(MutableMapping):
 
-    """A structure holding claims for a Wikibase entity."""
+    """A structure holding claims for a Wikibase entity.
+
+    .. version-changed:: 11.7
+       Claims created by :meth:`fromJSON` are decoded lazily for each
+       property when it is accessed first.
+    """
 
     def __init__(self, repo) -> None:
         """Initializer."""
         super().__init__()
         self.repo = repo
         self._data = {}
+        # properties whose value in _data is still the JSON list
+        self._undecoded: set[str] = set()
+        self._item = None
 
     @classmethod
     def fromJSON(cls, data, repo):
-        """Construct a new ClaimCollection from JSON."""
+        """Construct a new ClaimCollection from JSON.
+
+        The JSON of a property is kept and converted into
+        :class:`Claim<pywikibot.page.Claim>` objects when the property
+        is accessed first.
+
+        .. version-changed:: 11.7
+           Claims are decoded lazily.
+        """
         this = cls(repo)
         if data == []:  # workaround for T222159
             return this
-        for key, claims in data.items():
-            this[key] = [pywikibot.page.Claim.fromJSON(repo, claim)
-                         for claim in claims]
+        this._data.update(data)
+        this._undecoded.update(data)
         return this
 
+    def _decode(self, key) -> None:
+        """Create Claim objects of an undecoded property.
+
+        .. version-added:: 11.7
+        """
+        self._undecoded.discard(key)
+        claims = [pywikibot.page.Claim.fromJSON(self.repo, claim)
+                  for claim in self._data[key]]
+        if self._item is not None:
+            for claim in claims:
+                claim.on_item = self._item
+        self._data[key] = claims
+
     @classmethod
     def new_empty(cls, repo):
         """Construct a new empty ClaimCollection."""
         return cls(repo)
 
     def __getitem__(self, key):
+        if key in self._undecoded:
+            self._decode(key)
         return self._data[key]
 
     def __setitem__(self, key, value) -> None:
+        self._undecoded.discard(key)
         self._data[key] = value
 
     def __delitem__(self, key) -> None:
         del self._data[key]
+        self._undecoded.discard(key)
 
     def __iter__(self):
         return iter(self._data)
@@ -242,6 +308,8 @@ class ClaimCollection(MutableMapping):
         return key in self._data
 
     def __repr__(self) -> str:
+        for key in list(self._undecoded):
+            self._decode(key)
         return f'{type(self).__name__}({reprlib.repr(self._data)})'
 
     @classmethod
@@ -260,10 +328,17 @@ class ClaimCollection(MutableMapping):
         When diffto is provided, JSON representing differences to the
         provided data is created.
 
+        .. version-changed:: 11.7
+           With *diffto*, properties which were not accessed and whose
+           JSON is unchanged are skipped without being decoded.
+
         :param diffto: JSON containing entity data
         """
         claims = {}
         for prop in self:
+            if (diffto and prop in self._undecoded
+                    and diffto.get(prop) == self._data[prop]):
+                continue  # not accessed, nothing changed
             if self[prop]:
                 claims[prop] = [claim.toJSON() for claim in self[prop]]
 
@@ -274,6 +349,9 @@ class ClaimCollection(MutableMapping):
         props_add = set(claims)
         props_orig = set(diffto)
         for prop in (props_orig | props_add):
+            if prop in self._undecoded:
+                continue
+
             if prop not in props_orig:
                 diff_claims[prop].extend(claims[prop])
                 continue
@@ -311,13 +389,20 @@ class ClaimCollection(MutableMapping):
         return diff_claims
 
     def set_on_item(self, item) -> None:
-        """Set Claim.on_item attribute for all claims in this collection."""
-        for claims in self.values():
-            for claim in claims:
-                claim.on_item = item
+        """Set Claim.on_item attribute for all claims in this collection.
 
+        .. version-changed:: 11.7
+           The attribute of undecoded claims is set when they are
+           decoded.
+        """
+        self._item = item
+        for prop, claims in self._data.items():
+            if prop not in self._undecoded:
+                for claim in claims:
+                    claim.on_item = item
 
-class SiteLinkCollection(MutableMapping):
+
+class SiteLinkCollection(_LazyCompletion, MutableMapping):
 
     """A structure holding SiteLinks for a Wikibase item."""
 
@@ -360,6 +445,7 @@ class SiteLinkCollection(MutableMapping):
         :rtype: pywikibot.page.SiteLink
         """
         key = self.getdbName(key)
+        self._complete(key)
         val = self._data[key]
         if isinstance(val, str):
             val = pywikibot.page.SiteLink(val, key)
@@ -391,8 +477,7 @@ class SiteLinkCollection(MutableMapping):
         self._data[key] = val
 
     def __delitem__(self, key) -> None:
-        key = self.getdbName(key)
-        del self._data[key]
+        self._delete(self.getdbName(key))
 
     def __iter__(self):
         return iter(self._data)
@@ -402,6 +487,7 @@ class SiteLinkCollection(MutableMapping):
 
     def __contains__(self, key) -> bool:
         key = self.getdbName(key)
+        self._complete(key)
         return key in self._data
 
     @classmethod
@@ -27,6 +27,7 @@ from pywikibot.tools import ComparableMixin, first_upper, is_ip_address
 __all__ = (
     'BaseLink',
     'Link',
+    'LinkTable',
     'SiteLink',
     'html2unicode',
 )
@@ -643,6 +644,125 @@ class Link(BaseLink):
         return link
 
 
+class LinkTable:
+
+    """Wikilinks of several page texts and their targets.
+
+    Links are extracted from the wikitext of the added pages and their
+    existence and redirect targets are loaded in batches:
+
+    .. code-block:: python
+
+       table = LinkTable(site)
+       for page in pages:
+           table.add(page)
+       table.resolve()
+       for page, linked_pages in table.links.items():
+           for linked in linked_pages:
+               if linked.isRedirectPage():
+                   target = linked.getRedirectTarget()
+
+    Each distinct link title is parsed only once and a page linked
+    from several texts is represented by the same object. Links in
+    comments, nowiki and other disabled parts, interwiki links, links
+    to special pages as well as category and file links without a
+    leading colon are skipped.
+
+    .. version-added:: 11.7
+    """
+
+    #: Title of a wikilink; labels may contain further links
+    LINK_PATTERN = re.compile(r'\[\[(?P<title>[^\[\]{}<>|\n]*)(?=\||\]\])')
+
+    def __init__(self, site=None) -> None:
+        """Initializer.
+
+        :param site: the site of the pages and their links
+        :type site: pywikibot.site.APISite
+        """
+        self.site = site or pywikibot.Site()
+        #: linked pages in text order by the page they are linked from
+        self.links: dict[pywikibot.page.BasePage,
+                         list[pywikibot.page.Page]] = {}
+        self._parsed: dict[str, pywikibot.page.Page | None] = {}
+        self._pages: dict[pywikibot.page.Page, pywikibot.page.Page] = {}
+        self._resolved: set[pywikibot.page.Page] = set()
+
+    def add(self,
+            page: pywikibot.page.BasePage,
+            text: str | None = None) -> list[pywikibot.page.Page]:
+        """Add the links of a page to the table.
+
+        :param page: the page the links are found on
+        :param text: wikitext of the page; the page text is used if
+            not given
+        :return: the linked pages
+        """
+        if text is None:
+            text = page.text
+        self.links[page] = self.extract(text)
+        return self.links[page]
+
+    def extract(self, text: str) -> list[pywikibot.page.Page]:
+        """Return pages linked from a text without adding them.
+
+        :param text: wikitext to be scanned
+        :return: the linked pages in text order without duplicates
+        """
+        text = textlib.removeDisabledParts(text, site=self.site)
+        pages = {}
+        for match in self.LINK_PATTERN.finditer(text):
+            page = self._page(match['title'])
+            if page is not None:
+                pages[page] = None
+        return list(pages)
+
+    def _page(self, title: str) -> pywikibot.page.Page | None:
+        """Return the page of a link title; parse it only once."""
+        title = title.partition('#')[0]
+        try:
+            return self._parsed[title]
+        except KeyError:
+            pass
+
+        page = None
+        if title.strip():
+            try:
+                link = Link(title, self.site)
+                site, namespace = link.site, link.namespace
+            except (InvalidTitleError, SiteDefinitionError):
+                pass
+            else:
+                if site == self.site and namespace >= 0 and (
+                        namespace not in (Namespace.FILE, Namespace.CATEGORY)
+                        or title.lstrip().startswith(':')):
+                    page = pywikibot.Page(link)
+                    # share the page object between all links to it
+                    page = self._pages.setdefault(page, page)
+
+        self._parsed[title] = page
+        return page
+
+    @property
+    def pages(self) -> list[pywikibot.page.Page]:
+        """All linked pages of the table."""
+        return list(self._pages)
+
+    def resolve(self, groupsize: int | None = None) -> None:
+        """Load existence and redirect targets of all linked pages.
+
+        Pages already resolved are not queried again. See
+        :meth:`APISite.preloadpageinfo()
+        <pywikibot.site._generators.GeneratorsMixin.preloadpageinfo>`.
+
+        :param groupsize: how many pages to query at a time
+        """
+        pending = [page for page in self._pages
+                   if page not in self._resolved]
+        for page in self.site.preloadpageinfo(pending, groupsize=groupsize):
+            self._resolved.add(page)
+
+
 class SiteLink(BaseLink):
 
     """A single sitelink in a Wikibase item.
@@ -16,8 +16,12 @@ from __future__ import annotations
 
 import json as jsonlib
 import re
+import sys
+import weakref
 from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
 from contextlib import suppress
+from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Literal, NoReturn
 
@@ -52,6 +56,7 @@ from pywikibot.tools import cached, deprecated_args, first_upper
 
 __all__ = (
     'Claim',
+    'EntityEditBatch',
     'ItemPage',
     'LexemeForm',
     'LexemePage',
@@ -95,6 +100,18 @@ class WikibaseEntity:
 
     DATA_ATTRIBUTES: dict[str, Any] = {}
 
+    #: data attributes which can be loaded separately by ``wbgetentities``
+    LOADABLE_PROPS = ('aliases', 'claims', 'descriptions', 'labels',
+                      'sitelinks')
+
+    #: ``wbgetentities`` props of data attributes with another name
+    _PROP_NAMES: dict[str, str] = {}
+
+    #: parts of the entity data which are not completely loaded; None
+    #: means the part was not loaded at all, a frozenset contains the
+    #: languages or sites loaded. It is never modified in place.
+    _partial: dict[str, frozenset[str] | None] = {}
+
     def __init__(self, repo, id_: str | None = None) -> None:
         """Initializer.
 
@@ -130,6 +147,11 @@ class WikibaseEntity:
             if self.getID() == '-1':
                 self._initialize_empty()
                 return getattr(self, name)
+            if (self._partial.get(name, ()) is None
+                    and hasattr(self, '_content')):
+                # load a part which was omitted by a filtered get()
+                self._load_parts([name])
+                return self._init_data_attribute(name)
             return self.get()[name]
 
         raise AttributeError(
@@ -184,6 +206,8 @@ class WikibaseEntity:
         """
         data = {}
         for key in self.DATA_ATTRIBUTES:
+            if key in self._partial and self._partial[key] is None:
+                continue  # not loaded, nothing to be changed
             attr = getattr(self, key, None)
             if attr is None:
                 continue
@@ -240,20 +264,72 @@ class WikibaseEntity:
                 return False
         return 'missing' not in self._content
 
-    def get(self, force: bool = False) -> dict:
+    def get(
+        self,
+        force: bool = False,
+        *,
+        props: Iterable[str] | None = None,
+        languages: Iterable[str] | None = None,
+        sitefilter: Iterable[str] | None = None,
+    ) -> dict:
         """Fetch all entity data and cache it.
 
+        The data to be loaded can be restricted by *props*, *languages*
+        and *sitefilter*. Parts which were omitted are loaded with an
+        additional request when they are accessed: a data attribute like
+        ``claims`` which was not requested is fetched as a whole; a
+        label, description, alias or sitelink which was filtered out
+        completes the corresponding collection when it is looked up.
+        The returned dict only contains the parts which are loaded.
+
+        .. code-block:: python
+
+           item = pywikibot.ItemPage(repo, 'Q42')
+           item.get(props=['labels', 'descriptions'], languages=['en'])
+           item.labels['en']  # no further request
+           item.claims  # loads claims
+           item.labels['de']  # loads all labels
+
+        .. version-changed:: 11.7
+           *props*, *languages* and *sitefilter* parameters were added.
+
         :param force: Override caching
+        :param props: Data attributes to be loaded, a subset of
+            :attr:`LOADABLE_PROPS`; all data are loaded if None. If
+            the entity is already loaded, requested parts which are
+            missing are loaded.
+        :param languages: Only load labels, descriptions and aliases of
+            these language codes
+        :param sitefilter: Only load sitelinks of these site dbNames
         :raise NoWikibaseEntityError: if this entity doesn't exist
+        :raise ValueError: unknown value in *props*
         :return: Actual data which entity holds
         """
+        if languages is not None:
+            languages = list(languages)
+        if sitefilter is not None:
+            sitefilter = list(sitefilter)
+        if props is not None:
+            props = set(props)
+            if not props <= set(self.LOADABLE_PROPS):
+                raise ValueError(
+                    f'Unknown props {sorted(props - set(self.LOADABLE_PROPS))}'
+                    f'; expected {self.LOADABLE_PROPS}')
+
         if force or not hasattr(self, '_content'):
             identification = self._defined_by()
             if not identification:
                 raise NoWikibaseEntityError(self)
 
+            filtered = (props is not None or languages is not None
+                        or sitefilter is not None)
             try:
-                data = self.repo.loadcontent(identification)
+                data = self.repo.loadcontent(
+                    identification,
+                    *(['info', *sorted(props)] if props is not None else []),
+                    languages=languages,
+                    sitefilter=sitefilter,
+                )
             except APIError as err:
                 if err.code == 'no-such-entity':
                     raise NoWikibaseEntityError(self)
@@ -261,6 +337,15 @@ class WikibaseEntity:
             item_index, content = data.popitem()
             self.id = item_index
             self._content = content
+            self._partial = (self._get_partial(props, languages, sitefilter)
+                             if filtered else {})
+        elif self._partial and props is not None:
+            missing = [key for key, loaded in self._partial.items()
+                       if loaded is None
+                       and self._PROP_NAMES.get(key, key) in props]
+            if missing:
+                self._load_parts(missing)
+
         if 'missing' in self._content:
             raise NoWikibaseEntityError(self)
 
@@ -269,16 +354,101 @@ class WikibaseEntity:
         data = {}
 
         # This initializes all data
-        for key, cls in self.DATA_ATTRIBUTES.items():
-            value = cls.fromJSON(self._content.get(key, {}), self.repo)
-            setattr(self, key, value)
-            data[key] = value
-            # fixme: need better handling for this
-            if key in ['claims', 'statements']:
-                value.set_on_item(self)
+        for key in self.DATA_ATTRIBUTES:
+            if self._partial.get(key, ()) is None:
+                self.__dict__.pop(key, None)
+            else:
+                data[key] = self._init_data_attribute(key)
 
         return data
 
+    def _init_data_attribute(self, key: str) -> Any:
+        """Create a data attribute from the loaded content.
+
+        .. version-added:: 11.7
+
+        :param key: Data attribute to be created
+        :return: the new value of the data attribute
+        """
+        value = self.DATA_ATTRIBUTES[key].fromJSON(
+            self._content.get(key, {}), self.repo)
+        if key in self._partial:
+            value._loader = partial(self._complete_part, key)
+        setattr(self, key, value)
+        # fixme: need better handling for this
+        if key in ['claims', 'statements']:
+            value.set_on_item(self)
+        return value
+
+    def _get_partial(
+        self,
+        props: set[str] | None,
+        languages: Iterable[str] | None,
+        sitefilter: Iterable[str] | None,
+    ) -> dict[str, frozenset[str] | None]:
+        """Return the parts which are omitted by the given filters.
+
+        .. version-added:: 11.7
+        """
+        result = {}
+        for key in self.DATA_ATTRIBUTES:
+            prop = self._PROP_NAMES.get(key, key)
+            if prop not in self.LOADABLE_PROPS:
+                continue
+            if props is not None and prop not in props:
+                result[key] = None
+            elif key == 'sitelinks':
+                if sitefilter is not None:
+                    result[key] = frozenset(sitefilter)
+            elif prop != 'claims' and languages is not None:
+                result[key] = frozenset(languages)
+        return result
+
+    def _load_parts(self, parts: list[str]) -> None:
+        """Load data attributes which were omitted by a filtered get.
+
+        .. version-added:: 11.7
+
+        :param parts: Data attributes to be loaded completely
+        """
+        data = self.repo.loadcontent(
+            self._defined_by(), 'info',
+            *sorted(self._PROP_NAMES.get(key, key) for key in parts))
+        _, content = data.popitem()
+        for key in parts:
+            self._content[key] = content.get(key, {})
+        self._partial = {key: loaded for key, loaded in self._partial.items()
+                         if key not in parts}
+
+    def _complete_part(self, key: str) -> None:
+        """Complete a language or site filtered data attribute.
+
+        Entries of the languages or sites which were requested are kept,
+        also if they were modified or deleted meanwhile. Entries which
+        were set or deleted locally are kept as well.
+
+        .. version-added:: 11.7
+
+        :param key: Data attribute to be completed
+        """
+        requested = self._partial.get(key) or frozenset()
+        data = self.repo.loadcontent(self._defined_by(), 'info', key)
+        _, content = data.popitem()
+        json = content.get(key) or {}  # [] if empty, T222159
+
+        if hasattr(self, '_content'):
+            self._content[key] = {**json, **(self._content.get(key) or {})}
+        self._partial = {name: value for name, value in self._partial.items()
+                         if name != key}
+
+        collection = self.__dict__.get(key)
+        if collection is not None:
+            keep = {*requested, *collection._data, *collection._deleted}
+            missing = {name: value for name, value in json.items()
+                       if name not in keep}
+            collection._data.update(
+                self.DATA_ATTRIBUTES[key].fromJSON(missing, self.repo)._data)
+
     def editEntity(
         self,
         data: ENTITY_DATA_TYPE | None = None,
@@ -377,14 +547,15 @@ class MediaInfo(WikibaseEntity):
         'statements': ClaimCollection,
     }
 
+    _PROP_NAMES = {'statements': 'claims'}
+
     def __getattr__(self, name):
         if name == 'claims':  # T149410
             return self.statements
 
-        if name in self.DATA_ATTRIBUTES:
-            if not self.exists():
-                self._assert_has_id()
-                self._initialize_empty()
+        if name in self.DATA_ATTRIBUTES and not self.exists():
+            self._assert_has_id()
+            self._initialize_empty()
             return getattr(self, name)
 
         return super().__getattr__(name)
@@ -587,7 +758,7 @@ class WikibasePage(BasePage, WikibaseEntity):
     There should be no need to instantiate this directly.
     """
 
-    _cache_attrs = (*BasePage._cache_attrs, '_content')
+    _cache_attrs = (*BasePage._cache_attrs, '_content', '_partial')
 
     def __init__(self, site, title: str = '', **kwargs) -> None:
         """Initializer.
@@ -712,10 +883,26 @@ class WikibasePage(BasePage, WikibaseEntity):
         """
         return True
 
-    def get(self, force: bool = False, *args, **kwargs) -> dict:
+    def get(
+        self,
+        force: bool = False,
+        *args,
+        props: Iterable[str] | None = None,
+        languages: Iterable[str] | None = None,
+        sitefilter: Iterable[str] | None = None,
+        **kwargs
+    ) -> dict:
         """Fetch all page data, and cache it.
 
+        .. version-changed:: 11.7
+           *props*, *languages* and *sitefilter* parameters were added;
+           see :meth:`WikibaseEntity.get` for details.
+
         :param force: Override caching
+        :param props: Data attributes to be loaded; all if None
+        :param languages: Only load labels, descriptions and aliases of
+            these language codes
+        :param sitefilter: Only load sitelinks of these site dbNames
         :raise NotImplementedError: a value in args or kwargs
         :return: Actual data which entity holds
 
@@ -732,7 +919,9 @@ class WikibasePage(BasePage, WikibaseEntity):
         # TODO: this variable is specific to ItemPage
         lazy_loading_id = not hasattr(self, 'id') and hasattr(self, '_site')
         try:
-            data = WikibaseEntity.get(self, force=force)
+            data = WikibaseEntity.get(self, force=force, props=props,
+                                      languages=languages,
+                                      sitefilter=sitefilter)
         except NoWikibaseEntityError:
             if lazy_loading_id:
                 p = pywikibot.Page(self._site, self._title)
@@ -1137,6 +1326,18 @@ class ItemPage(WikibasePage):
     ) -> dict[str, Any]:
         """Fetch all item data, and cache it.
 
+        *props*, *languages* and *sitefilter* keyword arguments may be
+        given to load only a part of the item data; see
+        :meth:`WikibaseEntity.get` for details.
+
+        .. code-block:: python
+
+           item.get(props=['labels'], languages=['en', 'de'])
+
+        .. version-changed:: 11.7
+           *props*, *languages* and *sitefilter* keyword arguments are
+           supported.
+
         :param force: Override caching
         :param get_redirect: Return the item content, do not follow the
                              redirect, do not raise an exception.
@@ -1450,8 +1651,13 @@ class Property:
     For example, a claim on an ItemPage has many property attributes,
     and so it subclasses this Property class, but a claim does not have
     Page like behaviour and semantics.
+
+    .. version-changed:: 11.7
+       ``__slots__`` are used and the property id is interned.
     """
 
+    __slots__ = ('_type', 'id', 'repo')
+
     types = {
         'commonsMedia': FilePage,
         'external-id': str,
@@ -1499,7 +1705,7 @@ class Property:
             be queried via the API
         """
         self.repo = site
-        self.id = id.upper()
+        self.id = sys.intern(id.upper())
         if datatype:
             self._type = datatype
 
@@ -1641,12 +1847,25 @@ class Claim(Property):
     """A Claim on a Wikibase entity.
 
     Claims are standard claims as well as references and qualifiers.
+
+    .. version-changed:: 11.7
+       ``__slots__`` are used; rank and snak type strings read from
+       JSON are interned. :attr:`sources` and :attr:`qualifiers` are
+       created on first access. Item targets read from JSON are shared
+       between claims as long as they are referenced.
     """
 
+    __slots__ = ('_on_item', '_qualifiers', '_sources', 'hash',
+                 'isQualifier', 'isReference', 'rank', 'snak', 'snaktype',
+                 'target')
+
+    #: ItemPage targets shared by claims created from JSON
+    _item_targets: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
     TARGET_CONVERTER = {
         'wikibase-item': lambda value, site:
-            ItemPage(site.get_repo_for_entity_type('item'),
-                     'Q' + str(value['numeric-id'])),
+            Claim._item_target(site.get_repo_for_entity_type('item'),
+                               value['numeric-id']),
         'wikibase-property': lambda value, site:
             PropertyPage(site.get_repo_for_entity_type('property'),
                          'P' + str(value['numeric-id'])),
@@ -1703,12 +1922,55 @@ class Claim(Property):
         self.isQualifier = is_qualifier
         if self.isQualifier and self.isReference:
             raise ValueError('Claim cannot be both a qualifier and reference.')
-        self.sources = []
-        self.qualifiers = OrderedDict()
+        self._sources = None
+        self._qualifiers = None
         self.target = None
         self.snaktype = 'value'
         self._on_item = None  # The item it's on
 
+    @classmethod
+    def _item_target(cls, repo: DataSite, numeric_id: int) -> ItemPage:
+        """Return a shared ItemPage for a target read from JSON.
+
+        .. version-added:: 11.7
+        """
+        key = (repo, numeric_id)
+        target = cls._item_targets.get(key)
+        if target is None:
+            target = ItemPage(repo, f'Q{numeric_id}')
+            cls._item_targets[key] = target
+        return target
+
+    @property
+    def sources(self) -> list[OrderedDict[str, list[Claim]]]:
+        """Sources of this claim, each a mapping of property ids to claims.
+
+        .. version-changed:: 11.7
+           The list is created on first access.
+        """
+        if self._sources is None:
+            self._sources = []
+        return self._sources
+
+    @sources.setter
+    def sources(self, value: list[OrderedDict[str, list[Claim]]]) -> None:
+        self._sources = value
+
+    @property
+    def qualifiers(self) -> OrderedDict[str, list[Claim]]:
+        """Qualifiers of this claim by property id.
+
+        .. version-changed:: 11.7
+           The mapping is created on first access.
+        """
+        if self._qualifiers is None:
+            self._qualifiers = OrderedDict()
+        return self._qualifiers
+
+    @qualifiers.setter
+    def qualifiers(self, value: OrderedDict[str, list[Claim]]) -> None:
+        self._qualifiers = value
+
     @property
     def on_item(self) -> WikibaseEntity | None:
         """Return entity this claim is attached to."""
@@ -1717,10 +1979,10 @@ class Claim(Property):
     @on_item.setter
     def on_item(self, item) -> None:
         self._on_item = item
-        for values in self.qualifiers.values():
+        for values in (self._qualifiers or {}).values():
             for qualifier in values:
                 qualifier.on_item = item
-        for source in self.sources:
+        for source in self._sources or []:
             for values in source.values():
                 for val in values:
                     val.on_item = item
@@ -1780,16 +2042,18 @@ class Claim(Property):
             if getattr(self, attr) != getattr(other, attr):
                 return False
 
-        if not (ignore_quals or self._claim_mapping_same(self.qualifiers,
-                                                         other.qualifiers)):
+        if not (ignore_quals or self._claim_mapping_same(
+                self._qualifiers or {}, other._qualifiers or {})):
             return False
 
         if not ignore_refs:
-            if len(self.sources) != len(other.sources):
+            sources = self._sources or []
+            other_sources = other._sources or []
+            if len(sources) != len(other_sources):
                 return False
 
-            for source in self.sources:
-                for other_source in other.sources:
+            for source in sources:
+                for other_source in other_sources:
                     if self._claim_mapping_same(source, other_source):
                         break
                 else:
@@ -1832,7 +2096,7 @@ class Claim(Property):
         elif 'hash' in data:
             claim.hash = data['hash']
 
-        claim.snaktype = data['mainsnak']['snaktype']
+        claim.snaktype = sys.intern(data['mainsnak']['snaktype'])
         if claim.getSnakType() == 'value':
             value = data['mainsnak']['datavalue']['value']
 
@@ -1857,13 +2121,13 @@ class Claim(Property):
                 claim.target.warning = msg
 
         if 'rank' in data:  # References/Qualifiers don't have ranks
-            claim.rank = data['rank']
+            claim.rank = sys.intern(data['rank'])
         if 'references' in data:
             for source in data['references']:
                 claim.sources.append(cls.referenceFromJSON(site, source))
         if 'qualifiers' in data:
             for prop in data['qualifiers-order']:
-                claim.qualifiers[prop] = [
+                claim.qualifiers[sys.intern(prop)] = [
                     cls.qualifierFromJSON(site, qualifier)
                     for qualifier in data['qualifiers'][prop]]
         return claim
@@ -1927,7 +2191,7 @@ class Claim(Property):
             if hasattr(self, 'hash') and self.hash is not None:
                 data['hash'] = self.hash
         else:
-            if self.qualifiers:
+            if self._qualifiers:
                 data['qualifiers'] = {}
                 data['qualifiers-order'] = list(self.qualifiers.keys())
                 for prop, qualifiers in self.qualifiers.items():
@@ -1936,7 +2200,7 @@ class Claim(Property):
                     data['qualifiers'][prop] = [
                         qualifier.toJSON() for qualifier in qualifiers]
 
-            if self.sources:
+            if self._sources:
                 data['references'] = []
                 for collection in self.sources:
                     reference = {
@@ -2628,3 +2892,189 @@ LexemePage.DATA_ATTRIBUTES.update({
     'forms': LexemeFormCollection,
     'senses': LexemeSenseCollection,
 })
+
+
+class EntityEditBatch:
+
+    """Collect changes of Wikibase entities and save them together.
+
+    Claims, qualifiers, sources, labels, descriptions, aliases and
+    sitelinks are changed locally first. :meth:`flush` saves every
+    changed entity with a single ``wbeditentity`` request; its data is
+    the minimal diff of :meth:`WikibaseEntity.toJSON` to the loaded
+    content. Used as a context manager, the batch is flushed when the
+    block is left without an exception:
+
+    .. code-block:: python
+
+       with EntityEditBatch(summary='Import from enwiki') as batch:
+           batch.add_claim(item, claim)
+           batch.add_qualifier(claim, qualifier)
+           batch.add_sources(claim, [source])
+           batch.edit_labels(item, {'en': 'Label'})
+
+    Keyword arguments are passed to :meth:`WikibasePage.editEntity`.
+    With ``asynchronous=True`` the saves of a flush are queued and run
+    in the background within the write throttle while the next
+    entities are prepared.
+
+    .. version-added:: 11.7
+
+    :param kwargs: Default keyword arguments for
+        :meth:`WikibasePage.editEntity` like *summary*, *bot*, *tags*,
+        *asynchronous* or *callback*
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initializer."""
+        self.kwargs = kwargs
+        self._entities: list[WikibaseEntity] = []
+
+    def __enter__(self) -> EntityEditBatch:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    @property
+    def entities(self) -> tuple[WikibaseEntity, ...]:
+        """Entities with pending changes in the order of their addition."""
+        return tuple(self._entities)
+
+    def add(self, entity: WikibaseEntity) -> WikibaseEntity:
+        """Add an entity which was or will be changed locally.
+
+        The entity is loaded if it was not loaded yet so that the diff
+        to its content can be created.
+
+        :return: the given *entity*
+        """
+        if all(entity is not other for other in self._entities):
+            if entity.getID() != '-1' and not hasattr(entity, '_content'):
+                entity.get()
+            self._entities.append(entity)
+        return entity
+
+    def changes(self, entity: WikibaseEntity) -> dict:
+        """Return the data which would be saved for *entity*."""
+        return entity.toJSON(diffto=getattr(entity, '_content', None))
+
+    def add_claim(self, entity: WikibaseEntity, claim: Claim) -> None:
+        """Add a claim to the entity.
+
+        :raises ValueError: the claim is already used in an entity
+        """
+        if claim.on_item is not None:
+            raise ValueError(
+                'The provided Claim instance is already used in an entity')
+        self.add(entity)
+        entity.claims.setdefault(claim.getID(), []).append(claim)
+        claim.on_item = entity
+
+    def add_qualifier(self, claim: Claim, qualifier: Claim) -> None:
+        """Add a qualifier to a claim of an entity in this batch.
+
+        :raises RuntimeError: *claim* is a qualifier or reference or
+            it is not attached to an entity
+        :raises ValueError: the qualifier is already used in an entity
+        """
+        claim._assert_mainsnak('Cannot add qualifiers to a {}')
+        claim._assert_attached()
+        if qualifier.on_item is not None:
+            raise ValueError(
+                'The provided Claim instance is already used in an entity')
+        self.add(claim.on_item)
+        qualifier.isQualifier = True
+        claim.qualifiers.setdefault(qualifier.getID(), []).append(qualifier)
+        qualifier.on_item = claim.on_item
+
+    def add_sources(self, claim: Claim, sources: Iterable[Claim]) -> None:
+        """Add claims as one source to a claim of an entity in this batch.
+
+        :raises RuntimeError: *claim* is a qualifier or reference or
+            it is not attached to an entity
+        :raises ValueError: a source claim is already used in an entity
+        """
+        claim._assert_mainsnak('Cannot add sources to a {}')
+        claim._assert_attached()
+        sources = list(sources)
+        if any(source.on_item is not None for source in sources):
+            raise ValueError(
+                'The provided Claim instance is already used in an entity')
+        self.add(claim.on_item)
+        source_dict = defaultdict(list)
+        for source in sources:
+            source.isReference = True
+            source.on_item = claim.on_item
+            source_dict[source.getID()].append(source)
+        claim.sources.append(source_dict)
+
+    def _edit_terms(self, entity: WikibaseEntity, attr: str,
+                    data: dict) -> None:
+        """Set or remove labels, descriptions or aliases of an entity."""
+        self.add(entity)
+        collection = getattr(entity, attr)
+        for key, value in data.items():
+            if value:
+                collection[key] = value
+            else:
+                collection.pop(key, None)
+
+    def edit_labels(self, entity: WikibaseEntity,
+                    labels: LANGUAGE_TYPE) -> None:
+        """Set labels of an entity; an empty value removes the label."""
+        self._edit_terms(entity, 'labels', labels)
+
+    def edit_descriptions(self, entity: WikibaseEntity,
+                          descriptions: LANGUAGE_TYPE) -> None:
+        """Set descriptions of an entity; an empty value removes it."""
+        self._edit_terms(entity, 'descriptions', descriptions)
+
+    def edit_aliases(self, entity: WikibaseEntity,
+                     aliases: ALIASES_TYPE) -> None:
+        """Set aliases of an entity; an empty list removes them."""
+        self._edit_terms(entity, 'aliases', aliases)
+
+    def set_sitelinks(self, item: ItemPage,
+                      sitelinks: list[SITELINK_TYPE]) -> None:
+        """Set sitelinks of an item; an empty title removes the sitelink.
+
+        Each sitelink can be a Page object, a BaseLink object or a
+        ``{'site': dbname, 'title': title}`` dictionary like with
+        :meth:`ItemPage.setSitelinks`.
+        """
+        self.add(item)
+        for dbname, json in SiteLinkCollection.normalizeData(
+                sitelinks).items():
+            if json.get('title'):
+                item.sitelinks[dbname] = json
+            else:
+                item.sitelinks.pop(dbname, None)
+
+    def flush(self, **kwargs: Any) -> None:
+        """Save all changed entities, each with one ``wbeditentity``.
+
+        Entities without changes are skipped. If saving an entity
+        fails, it and the following entities remain in the batch.
+
+        :param kwargs: Keyword arguments for
+            :meth:`WikibasePage.editEntity` which override those given
+            to the initializer
+        """
+        kwargs = {**self.kwargs, **kwargs}
+        while self._entities:
+            entity = self._entities[0]
+            if entity.getID() == '-1' or self.changes(entity):
+                entity.editEntity(**kwargs)
+            self._entities.pop(0)
+
+    def clear(self) -> None:
+        """Forget all entities without saving them.
+
+        Local changes of the entities are kept.
+        """
+        self._entities.clear()
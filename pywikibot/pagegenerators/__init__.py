@@ -670,15 +670,24 @@ def RepeatingGenerator(
 
 def PreloadingGenerator(generator: Iterable[pywikibot.page.Page],
                         groupsize: int = 50,
-                        quiet: bool = False
+                        quiet: bool = False,
+                        workers: int | None = None,
                         ) -> Generator[pywikibot.page.Page]:
     """Yield preloaded pages taken from another generator.
 
+    .. version-changed:: 11.7
+       *workers* parameter was added.
+
     :param generator: Pages to iterate over
     :param groupsize: How many pages to preload at once
     :param quiet: If False (default), show the "Retrieving pages"
         message
+    :param workers: Number of groups to be preloaded concurrently. See
+        :meth:`APISite.preloadpages()
+        <pywikibot.site._generators.GeneratorsMixin.preloadpages>`.
     """
+    # collect enough pages to keep all workers busy
+    workers = max(workers or 1, 1)
     # pages may be on more than one site, for example if an interwiki
     # generator is used, so use a separate preloader for each site
     sites: PRELOAD_SITE_TYPE = {}
@@ -688,15 +697,16 @@ def PreloadingGenerator(generator: Iterable[pywikibot.page.Page],
         sites.setdefault(site, []).append(page)
 
         groupsize = min(groupsize, site.maxlimit)
-        if len(sites[site]) >= groupsize:
+        if len(sites[site]) >= groupsize * workers:
             # if this site is at the groupsize, process it
             group = sites.pop(site)
             yield from site.preloadpages(group, groupsize=groupsize,
-                                         quiet=quiet)
+                                         quiet=quiet, workers=workers)
 
     for site, pages in sites.items():
         # process any leftover sites that never reached the groupsize
-        yield from site.preloadpages(pages, groupsize=groupsize, quiet=quiet)
+        yield from site.preloadpages(pages, groupsize=groupsize, quiet=quiet,
+                                     workers=workers)
 
 
 def DequePreloadingGenerator(
@@ -725,13 +735,26 @@ def DequePreloadingGenerator(
 def PreloadingEntityGenerator(
     generator: Iterable[pywikibot.page.WikibaseEntity],
     groupsize: int = 50,
+    *,
+    props: str | Iterable[str] | None = None,
+    languages: str | Iterable[str] | None = None,
 ) -> Generator[pywikibot.page.WikibaseEntity]:
     """Yield preloaded pages taken from another generator.
 
     Function basically is copied from above, but for Wikibase entities.
 
+    .. version-changed:: 11.7
+       *props* and *languages* parameters were added.
+
+    .. seealso:: :meth:`DataSite.preload_entities()
+       <pywikibot.site._datasite.DataSite.preload_entities>`
+
     :param generator: Pages to iterate over
     :param groupsize: How many pages to preload at once
+    :param props: ``wbgetentities`` props to be loaded like 'labels'
+        or 'claims'; all data is loaded if None
+    :param languages: Only load labels, descriptions and aliases in
+        these languages
     """
     sites: dict[pywikibot.site.BaseSite,
                 list[pywikibot.page.WikibaseEntity]] = {}
@@ -742,9 +765,11 @@ def PreloadingEntityGenerator(
             # if this site is at the groupsize, process it
             group = sites.pop(site)
             repo = site.data_repository()
-            yield from repo.preload_entities(group, groupsize)
+            yield from repo.preload_entities(group, groupsize, props=props,
+                                             languages=languages)
 
     for site, pages in sites.items():
         # process any leftover sites that never reached the groupsize
         repo = site.data_repository()
-        yield from repo.preload_entities(pages, groupsize)
+        yield from repo.preload_entities(pages, groupsize, props=props,
+                                         languages=languages)
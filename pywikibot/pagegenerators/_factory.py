@@ -225,6 +225,10 @@ class GeneratorFactory:
            with the *quiet* option.
            The generator specified by ``-start`` and ``-until`` is
            evaluated lazily by this method.
+        .. version-changed:: 11.7
+           The ``-redirect`` filter is pushed down into the request
+           parameters of API generators which support it; pages are
+           only filtered client-side if any generator does not.
 
         :param gen: Another generator to be combined with
         :param preload: Preload pages using PreloadingGenerator
@@ -241,6 +245,11 @@ class GeneratorFactory:
             else:
                 self.gens.append(apgen)
 
+        # push the redirect filter down into the API requests; the pages
+        # are filtered afterwards unless all generators support it
+        redirect_pushed = bool(self.gens) and all(
+            [self._push_redirect_filter(gen_item) for gen_item in self.gens])
+
         for i, gen_item in enumerate(self.gens):
             if self.namespaces:
                 if (isinstance(gen_item, api.QueryGenerator)
@@ -289,7 +298,7 @@ class GeneratorFactory:
             dupfiltergen = SubpageFilterGenerator(
                 dupfiltergen, self.subpage_max_depth)
 
-        if self.redirectfilter is not None:
+        if self.redirectfilter is not None and not redirect_pushed:
             # Generator expects second parameter true to exclude redirects, but
             # our logic is true to assert it is a redirect, false when it isn't
             dupfiltergen = RedirectFilterPageGenerator(
@@ -337,6 +346,35 @@ class GeneratorFactory:
 
         return dupfiltergen
 
+    def _push_redirect_filter(self, gen: Any) -> bool:
+        """Set the redirect filter as request parameter of a generator.
+
+        The filter is pushed down into :class:`api.QueryGenerator`
+        requests if the API module supports it and no other redirect
+        restriction was given by the generator's caller.
+
+        .. version-added:: 11.7
+
+        :param gen: a generator of :attr:`gens`
+        :return: True if the generator yields filtered pages only
+        """
+        if self.redirectfilter is None:
+            return True
+
+        if not isinstance(gen, api.QueryGenerator) \
+           or not gen.support_redirect_filter():
+            return False
+
+        value = gen.request.get(gen.prefix + 'filterredir', ['all'])
+        if value == ['all']:
+            gen.set_redirect_filter(self.redirectfilter)
+            return True
+
+        # keep an existing restriction; the pages are filtered afterwards
+        # unless the restriction is the same
+        return value == ['redirects' if self.redirectfilter
+                         else 'nonredirects']
+
     def getCategory(self, category: str  # noqa: N802
                     ) -> tuple[pywikibot.Category, str | None]:
         """Return Category and start as defined by category.
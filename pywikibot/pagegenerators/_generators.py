@@ -1193,6 +1193,8 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
 
     .. version-added:: 7.2
        the `content` parameter
+    .. version-added:: 11.7
+       the `titles` parameter
 
     :param filename: Filename of XML dump
     :param start: Skip entries below that value
@@ -1201,6 +1203,9 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
     :param text_predicate: A callable with entry.text as parameter and boolean
         as result to indicate the generator should return the page or not
     :param content: If True, assign old page content to Page.text
+    :param titles: If given, only these page titles or page ids are read
+        from the dump using its page index instead of scanning the whole
+        dump. See :meth:`xmlreader.XmlDump.lookup_pages`.
 
     :ivar skipping: True if start parameter is given, else False
     :ivar parser: holds the xmlreader.XmlDump parse method
@@ -1214,6 +1219,7 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
         site: BaseSite | None = None,
         text_predicate: Callable[[str], bool] | None = None,
         content=False,
+        titles: Iterable[str | int] | None = None,
     ) -> None:
         """Initializer."""
         self.text_predicate = text_predicate
@@ -1230,7 +1236,12 @@ class XMLDumpPageGenerator(abc.Iterator):  # type: ignore[type-arg]
         else:
             self.namespaces = self.site.namespaces.resolve(namespaces)
         dump = xmlreader.XmlDump(filename, on_error=pywikibot.error)
-        self.parser = dump.parse()
+        if titles is None:
+            self.parser = dump.parse(
+                namespaces=[ns.id for ns in self.namespaces]
+                if namespaces else None)
+        else:
+            self.parser = dump.lookup_pages(titles)
 
     def __next__(self) -> pywikibot.page.Page:
         """Get next Page."""
@@ -312,6 +312,23 @@ class APISite(
         return self._request_class({'parameters': kwargs}).create_simple(
             self, **kwargs)
 
+    async def asubmit(self, **kwargs: Any) -> dict[str, Any]:
+        """Submit a simple request from an asyncio event loop.
+
+        All kwargs are passed as API parameters like in
+        :meth:`simple_request`. The request is submitted by
+        :meth:`Request.asubmit()<data.api.Request.asubmit>`.
+
+        .. code-block:: python
+
+           data = await site.asubmit(action='query', meta='siteinfo')
+
+        .. version-added:: 11.7
+
+        :return: a dict containing data retrieved from api.php
+        """
+        return await self.simple_request(**kwargs).asubmit()
+
     def logged_in(self) -> bool:
         """Verify the bot is logged into the site as the expected user.
 
@@ -1626,6 +1643,9 @@ class APISite(
 
         .. version-added:: 9.3
            *ignore_section* parameter
+        .. version-changed:: 11.7
+           the section of a cached target is checked if
+           *ignore_section* is False.
 
         .. seealso:: :meth:`page.BasePage.getRedirectTarget`
 
@@ -1645,7 +1665,12 @@ class APISite(
         if not self.page_isredirect(page):
             raise IsNotRedirectPageError(page)
         if hasattr(page, '_redirtarget'):
-            return page._redirtarget
+            target = page._redirtarget
+            if not ignore_section and target.section():
+                # a cached target may have been loaded without checking
+                # the section; this raises SectionError if not found
+                target.text
+            return target
 
         title = page.title(with_section=False)
         query = self.simple_request(
@@ -21,7 +21,7 @@ from pywikibot.exceptions import (
     UnknownSiteError,
 )
 from pywikibot.site._namespace import Namespace, NamespacesDict
-from pywikibot.throttle import Throttle
+from pywikibot.throttle import THROTTLE_BACKENDS
 from pywikibot.tools import (
     ComparableMixin,
     cached,
@@ -130,9 +130,22 @@ class BaseSite(ComparableMixin):
     def throttle(self):
         """Return this Site's throttle.
 
-        Initialize a new one if needed.
+        Initialize a new one if needed. The throttle class is selected
+        by ``throttle_backend`` config variable.
+
+        .. version-changed:: 11.7
+           use :data:`throttle.THROTTLE_BACKENDS`.
+
+        :raises ValueError: unknown throttle backend
         """
-        return Throttle(self)
+        name = pywikibot.config.throttle_backend
+        try:
+            throttle_class = THROTTLE_BACKENDS[name]
+        except KeyError:
+            raise ValueError(
+                f'Unknown throttle backend {name!r}; use one of '
+                f'{", ".join(map(repr, THROTTLE_BACKENDS))}') from None
+        return throttle_class(self)
 
     @property
     def family(self):
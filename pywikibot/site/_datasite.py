@@ -9,7 +9,9 @@ from __future__ import annotations
 import datetime
 import json
 import uuid
+from collections import deque
 from collections.abc import Generator, Iterable
+from concurrent import futures
 from contextlib import suppress
 from typing import Any
 from warnings import warn
@@ -27,6 +29,7 @@ from pywikibot.exceptions import (
 from pywikibot.site._apisite import APISite
 from pywikibot.site._decorators import need_extension, need_right
 from pywikibot.tools import deprecated, merge_unique_dicts
+from pywikibot.tools.threading import BoundedPoolExecutor
 
 
 __all__ = ('DataSite', )
@@ -170,21 +173,37 @@ class DataSite(APISite):
 
         return None
 
-    def loadcontent(self, identification: dict[str, Any], *props):
+    def loadcontent(
+        self,
+        identification: dict[str, Any],
+        *props,
+        languages: Iterable[str] | None = None,
+        sitefilter: Iterable[str] | None = None,
+    ):
         """Fetch the current content of a Wikibase item.
 
         This is called loadcontent since wbgetentities does not support
         fetching old revisions. Eventually this will get replaced by an
         actual loadrevisions.
 
+        .. version-changed:: 11.7
+           *languages* and *sitefilter* parameters were added.
+
         :param identification: Parameters used to identify the page(s)
         :param props: The optional properties to fetch.
+        :param languages: Only fetch labels, descriptions and aliases of
+            these language codes
+        :param sitefilter: Only fetch sitelinks of these site dbNames
         """
         params = merge_unique_dicts(identification, action='wbgetentities',
                                     # TODO: When props is empty it results in
                                     # an empty string ('&props=') but it should
                                     # result in a missing entry.
                                     props=props or False)
+        if languages is not None:
+            params['languages'] = languages
+        if sitefilter is not None:
+            params['sitefilter'] = sitefilter
         req = self.simple_request(**params)
         data = req.submit()
         if 'success' not in data:
@@ -195,47 +214,171 @@ class DataSite(APISite):
         self,
         pagelist: Iterable[pywikibot.page.WikibaseEntity
                            | pywikibot.page.Page],
-        groupsize: int = 50
+        groupsize: int | None = None,
+        *,
+        props: str | Iterable[str] | None = None,
+        languages: str | Iterable[str] | None = None,
+        workers: int | None = None,
     ) -> Generator[pywikibot.page.WikibaseEntity]:
         """Yield subclasses of WikibaseEntity's with content prefilled.
 
-        .. note:: Pages will be iterated in a different order than in
-           the underlying pagelist.
+        Entities are iterated in the same order as in the underlying
+        pagelist. Missing entities are skipped and in case of duplicates
+        in a groupsize batch, only the first entry is returned.
+
+        If *workers* is greater than 1, up to *workers* batches are
+        requested concurrently by a :class:`BoundedPoolExecutor
+        <tools.threading.BoundedPoolExecutor>` like with
+        :meth:`APISite.preloadpages()
+        <pywikibot.site._generators.GeneratorsMixin.preloadpages>`.
+
+        .. version-changed:: 11.7
+           Entities are yielded in input order. *groupsize* is the
+           ``wbgetentities`` limit of the site by default. *props*,
+           *languages* and *workers* parameters were added.
+
+        Entity data which is not loaded due to *props* or *languages*
+        is fetched when it is accessed like with a filtered
+        :meth:`WikibaseEntity.get()
+        <pywikibot.page.WikibaseEntity.get>`.
 
         :param pagelist: An iterable that yields either WikibaseEntity
             objects, or Page objects linked to an ItemPage.
-        :param groupsize: How many pages to query at a time
+        :param groupsize: How many pages to query at a time. If None
+            (default), the limit of ``wbgetentities`` ids is used which
+            is 500 for bots and 50 otherwise.
+        :param props: ``wbgetentities`` props to be loaded like
+            'labels' or 'claims'; all data is loaded if None. 'sitelinks'
+            is added if entities are requested by linked pages.
+        :param languages: Only load labels, descriptions and aliases in
+            these languages
+        :param workers: Number of batches to be retrieved concurrently.
+            If None (default) or 1, batches are retrieved one after
+            another.
         """
         if not hasattr(self, '_entity_namespaces'):
             self._cache_entity_namespaces()
-        for batch in batched(pagelist, groupsize):
-            req: dict[str, list[str]] = {'ids': [], 'titles': [], 'sites': []}
-            for p in batch:
-                if isinstance(p, pywikibot.page.WikibaseEntity):
-                    ident = p._defined_by()
-                    for key in ident:
-                        req[key].append(ident[key])
-                elif (p.site == self
-                      and p.namespace() in self._entity_namespaces.values()):
-                    req['ids'].append(p.title(with_ns=False))
-                else:
-                    assert p.site.has_data_repository, \
-                        'Site must have a data repository'
-                    req['sites'].append(p.site.dbName())
-                    req['titles'].append(p._link._text)
 
-            req = self.simple_request(action='wbgetentities', **req)
-            data = req.submit()
-            for entity in data['entities']:
-                if 'missing' in data['entities'][entity]:
-                    continue
-                cls = self._type_to_class[data['entities'][entity]['type']]
-                page = cls(self, entity)
-                # No api call is made because item._content is given
-                page._content = data['entities'][entity]
-                with suppress(IsRedirectPageError):
-                    page.get()  # cannot provide get_redirect=True (T145971)
-                yield page
+        if groupsize is None:
+            parameter = self._paraminfo.parameter('wbgetentities', 'ids')
+            if parameter and 'limit' in parameter:
+                groupsize = int(parameter['limit'])
+                if self.logged_in() and self.has_right('apihighlimits'):
+                    groupsize = int(parameter.get('highlimit', groupsize))
+            else:
+                groupsize = self.maxlimit
+        if isinstance(props, str):
+            props = props.split('|')
+        if isinstance(languages, str):
+            languages = languages.split('|')
+
+        batches = batched(pagelist, groupsize)
+        if workers is None or workers <= 1:
+            for batch in batches:
+                yield from self._preload_entities_batch(batch, props,
+                                                        languages)
+            return
+
+        pending: deque[futures.Future] = deque()
+        with BoundedPoolExecutor('ThreadPoolExecutor', max_bound=workers,
+                                 max_workers=workers) as executor:
+            try:
+                for batch in batches:
+                    # wait for the oldest batch if all workers are busy
+                    # but submit the next batch before yielding its entities
+                    ready = (pending.popleft().result()
+                             if len(pending) >= workers else [])
+                    pending.append(executor.submit(
+                        self._preload_entities_batch, batch, props,
+                        languages))
+                    yield from ready
+
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _preload_entities_batch(
+        self,
+        batch: tuple[pywikibot.page.WikibaseEntity | pywikibot.page.Page,
+                     ...],
+        props: list[str] | None,
+        languages: list[str] | None,
+    ) -> list[pywikibot.page.WikibaseEntity]:
+        """Load a single batch for :meth:`preload_entities`.
+
+        .. version-added:: 11.7
+
+        :return: the loaded entities in the same order as in *batch*
+        """
+        req: dict[str, list[str]] = {'ids': [], 'titles': [], 'sites': []}
+        # keys to find the entity of each batch entry in the response
+        keys: list[tuple[str, ...]] = []
+        for p in batch:
+            if isinstance(p, pywikibot.page.WikibaseEntity):
+                ident = p._defined_by()
+                for key in ident:
+                    req[key].append(ident[key])
+                if 'ids' in ident:
+                    keys.append((ident['ids'].upper(), ))
+                else:
+                    # sitelink titles of the response are normalized
+                    page = pywikibot.Page(p._site, ident['titles'])
+                    keys.append((ident['sites'],
+                                 page.title(with_section=False)))
+            elif (p.site == self
+                  and p.namespace() in self._entity_namespaces.values()):
+                req['ids'].append(p.title(with_ns=False))
+                keys.append((p.title(with_ns=False).upper(), ))
+            else:
+                assert p.site.has_data_repository, \
+                    'Site must have a data repository'
+                req['sites'].append(p.site.dbName())
+                req['titles'].append(p._link._text)
+                keys.append((p.site.dbName(), p.title(with_section=False)))
+
+        params: dict[str, Any] = {'action': 'wbgetentities', **req}
+        if props is not None:
+            props = list(dict.fromkeys(
+                ['info', *props, *(['sitelinks'] if req['titles'] else [])]))
+            params['props'] = props
+        if languages is not None:
+            params['languages'] = languages
+        data = self.simple_request(**params).submit()
+        filtered = props is not None or languages is not None
+
+        entities: dict[tuple[str, ...], pywikibot.page.WikibaseEntity] = {}
+        unordered = []
+        for entity, content in data['entities'].items():
+            if 'missing' in content:
+                continue
+            cls = self._type_to_class[content['type']]
+            page = cls(self, entity)
+            # No api call is made because item._content is given
+            page._content = content
+            if filtered:
+                page._partial = page._get_partial(
+                    None if props is None else set(props), languages, None)
+            with suppress(IsRedirectPageError):
+                page.get()  # cannot provide get_redirect=True (T145971)
+
+            unordered.append(page)
+            entities[(entity.upper(), )] = page
+            if 'redirects' in content:
+                entities[(content['redirects']['from'].upper(), )] = page
+            for dbname, sitelink in content.get('sitelinks', {}).items():
+                entities[(dbname, sitelink['title'])] = page
+
+        result = []
+        seen = set()
+        for page in [entities.get(key) for key in keys] + unordered:
+            # entities which could not be assigned to an input entry
+            # are added at the end
+            if page is not None and id(page) not in seen:
+                seen.add(id(page))
+                result.append(page)
+        return result
 
     def get_property_type(self, prop: pywikibot.page.Property) -> str:
         """Obtain the type of a property.
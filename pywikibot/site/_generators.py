@@ -9,7 +9,9 @@ from __future__ import annotations
 import heapq
 import itertools
 import typing
+from collections import deque
 from collections.abc import Callable, Generator, Iterable
+from concurrent import futures
 from contextlib import suppress
 from itertools import zip_longest
 from typing import Any
@@ -27,7 +29,7 @@ from pywikibot.exceptions import (
     UserRightsError,
 )
 from pywikibot.site._decorators import need_right
-from pywikibot.site._namespace import NamespaceArgType
+from pywikibot.site._namespace import Namespace, NamespaceArgType
 from pywikibot.tools import (
     deprecate_arg,
     deprecated_args,
@@ -35,6 +37,7 @@ from pywikibot.tools import (
     is_ip_address,
 )
 from pywikibot.tools.itertools import filter_unique
+from pywikibot.tools.threading import BoundedPoolExecutor
 
 
 if typing.TYPE_CHECKING:
@@ -63,6 +66,7 @@ class GeneratorsMixin:
         namespaces: NamespacesDict
         protection_types: Callable[[], set[str]]
         sametitle: Callable[[str, str], bool]
+        simple_request: Callable[..., Request]
         tokens: TokenWallet
         user: Callable[[], str | None]
 
@@ -133,6 +137,7 @@ class GeneratorsMixin:
         categories: bool = False,
         content: bool = True,
         quiet: bool = True,
+        workers: int | None = None,
     ) -> Generator[pywikibot.Page]:
         """Return a generator to a list of preloaded pages.
 
@@ -140,6 +145,12 @@ class GeneratorsMixin:
         pagelist. In case of duplicates in a groupsize batch, return the
         first entry.
 
+        If *workers* is greater than 1, up to *workers* batches are
+        requested concurrently by a :class:`BoundedPoolExecutor
+        <tools.threading.BoundedPoolExecutor>`. Pages are still yielded
+        in input order. This reduces the impact of network latency if
+        the throttle allows parallel read requests.
+
         .. version-changed:: 7.6
            *content* parameter was added.
         .. version-changed:: 7.7
@@ -148,6 +159,8 @@ class GeneratorsMixin:
            *groupsize* is maxlimit by default. *quiet* parameter was
            added. No longer show the "Retrieving pages from site"
            message by default.
+        .. version-changed:: 11.7
+           *workers* parameter was added.
 
         :param pagelist: An iterable that returns Page objects
         :param groupsize: How many Pages to query at a time. If None
@@ -163,6 +176,9 @@ class GeneratorsMixin:
         :param content: Preload page content
         :param quiet: If True (default), do not show the "Retrieving
             pages" message
+        :param workers: Number of batches to be retrieved concurrently.
+            If None (default) or 1, batches are retrieved one after
+            another.
         """
         props = 'revisions|info|categoryinfo'
         if templates:
@@ -175,76 +191,228 @@ class GeneratorsMixin:
             props += '|categories'
 
         groupsize_ = min(groupsize or self.maxlimit, self.maxlimit)
-        for batch in batched(pagelist, groupsize_):
-            # Do not use p.pageid property as it will force page loading.
-            pageids = [str(p._pageid) for p in batch
-                       if hasattr(p, '_pageid') and p._pageid > 0]
-            cache: dict[str, tuple[int, pywikibot.Page]] = {}
-            # In case of duplicates, return the first entry.
-            for priority, page in enumerate(batch):
-                try:
-                    cache.setdefault(page.title(with_section=False),
-                                     (priority, page))
-                except InvalidTitleError:
-                    pywikibot.exception()
+        batches = batched(pagelist, groupsize_)
+        if workers is None or workers <= 1:
+            for batch in batches:
+                yield from self._preload_batch(batch, props, content, quiet)
+            return
 
-            prio_queue: list[tuple[int, pywikibot.Page]] = []
-            next_prio = 0
-            rvgen = api.PropertyGenerator(props, site=self)
-            rvgen.set_maximum_items(-1)  # suppress use of "rvlimit" parameter
+        pending: deque[futures.Future] = deque()
+        with BoundedPoolExecutor('ThreadPoolExecutor', max_bound=workers,
+                                 max_workers=workers) as executor:
+            try:
+                for batch in batches:
+                    # wait for the oldest batch if all workers are busy
+                    # but submit the next batch before yielding its pages
+                    ready = (pending.popleft().result()
+                             if len(pending) >= workers else [])
+                    pending.append(executor.submit(
+                        list,
+                        self._preload_batch(batch, props, content, quiet)))
+                    yield from ready
+
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _preload_batch(
+        self,
+        batch: tuple[pywikibot.Page, ...],
+        props: str,
+        content: bool,
+        quiet: bool,
+    ) -> Generator[pywikibot.Page]:
+        """Preload a single batch of pages for :meth:`preloadpages`.
 
-            if len(pageids) == len(batch) \
-               and len(set(pageids)) <= self.maxlimit:
-                # only use pageids if all pages have them
-                rvgen.request['pageids'] = set(pageids)
-            else:
-                rvgen.request['titles'] = list(cache.keys())
-            rvgen.request['rvprop'] = self._rvprops(content=content)
-            if not quiet:
-                pywikibot.info(f'Retrieving {len(cache)} pages from {self}.')
+        Pages are yielded in the same order as in *batch*.
 
-            for pagedata in rvgen:
-                pywikibot.debug(f'Preloading {pagedata}')
-                try:
-                    if (pd_title := pagedata['title']) not in cache:
-                        # API always returns a "normalized" title which is
-                        # usually the same as the canonical form returned by
-                        # page.title(), but sometimes not (e.g.,
-                        # gender-specific localizations of "User" namespace).
-                        # This checks to see if there is a normalized title in
-                        # the response that corresponds to the canonical form
-                        # used in the query.
-                        for key, value in cache.items():
-                            if self.sametitle(key, pd_title):
-                                cache[pd_title] = value
-                                break
-                        else:
-                            pywikibot.warning('preloadpages: Query returned '
-                                              f'unexpected title {pd_title!r}')
-                            continue
-
-                except KeyError:
-                    pywikibot.debug(f"No 'title' in {pagedata}\n"
-                                    f'{pageids=!s}\n'
-                                    f'titles={list(cache.keys())}')
-                    continue
+        .. version-added:: 11.7
+        """
+        # Do not use p.pageid property as it will force page loading.
+        pageids = [str(p._pageid) for p in batch
+                   if hasattr(p, '_pageid') and p._pageid > 0]
+        cache: dict[str, tuple[int, pywikibot.Page]] = {}
+        # In case of duplicates, return the first entry.
+        for priority, page in enumerate(batch):
+            try:
+                cache.setdefault(page.title(with_section=False),
+                                 (priority, page))
+            except InvalidTitleError:
+                pywikibot.exception()
+
+        prio_queue: list[tuple[int, pywikibot.Page]] = []
+        next_prio = 0
+        rvgen = api.PropertyGenerator(props, site=self)
+        rvgen.set_maximum_items(-1)  # suppress use of "rvlimit" parameter
+
+        if len(pageids) == len(batch) \
+           and len(set(pageids)) <= self.maxlimit:
+            # only use pageids if all pages have them
+            rvgen.request['pageids'] = set(pageids)
+        else:
+            rvgen.request['titles'] = list(cache.keys())
+        rvgen.request['rvprop'] = self._rvprops(content=content)
+        if not quiet:
+            pywikibot.info(f'Retrieving {len(cache)} pages from {self}.')
 
-                priority, page = cache[pagedata['title']]
-                api.update_page(page, pagedata, rvgen.props)
-                priority, page = heapq.heappushpop(prio_queue,
-                                                   (priority, page))
-                # Smallest priority matches expected one; yield.
-                if priority == next_prio:
-                    yield page
-                    next_prio += 1
-                else:
-                    # Push back onto the heap.
-                    heapq.heappush(prio_queue, (priority, page))
+        for pagedata in rvgen:
+            pywikibot.debug(f'Preloading {pagedata}')
+            try:
+                if (pd_title := pagedata['title']) not in cache:
+                    # API always returns a "normalized" title which is
+                    # usually the same as the canonical form returned by
+                    # page.title(), but sometimes not (e.g.,
+                    # gender-specific localizations of "User" namespace).
+                    # This checks to see if there is a normalized title in
+                    # the response that corresponds to the canonical form
+                    # used in the query.
+                    for key, value in cache.items():
+                        if self.sametitle(key, pd_title):
+                            cache[pd_title] = value
+                            break
+                    else:
+                        pywikibot.warning('preloadpages: Query returned '
+                                          f'unexpected title {pd_title!r}')
+                        continue
+
+            except KeyError:
+                pywikibot.debug(f"No 'title' in {pagedata}\n"
+                                f'{pageids=!s}\n'
+                                f'titles={list(cache.keys())}')
+                continue
 
-            # Empty the heap.
-            while prio_queue:
-                priority, page = heapq.heappop(prio_queue)
+            priority, page = cache[pagedata['title']]
+            api.update_page(page, pagedata, rvgen.props)
+            priority, page = heapq.heappushpop(prio_queue, (priority, page))
+            # Smallest priority matches expected one; yield.
+            if priority == next_prio:
                 yield page
+                next_prio += 1
+            else:
+                # Push back onto the heap.
+                heapq.heappush(prio_queue, (priority, page))
+
+        # Empty the heap.
+        while prio_queue:
+            priority, page = heapq.heappop(prio_queue)
+            yield page
+
+    def preloadpageinfo(
+        self,
+        pagelist: Iterable[pywikibot.page.BasePage],
+        *,
+        groupsize: int | None = None,
+        redirects: bool = True,
+    ) -> Generator[pywikibot.page.BasePage]:
+        """Load page info and redirect targets of pages.
+
+        Pages are queried by their titles in batches of *groupsize*.
+        Afterwards :meth:`page.BasePage.exists` and
+        :meth:`page.BasePage.isRedirectPage` need no further request.
+        With *redirects*, the targets of all redirects within a batch
+        are retrieved by one more request and
+        :meth:`page.BasePage.getRedirectTarget` returns them without
+        requesting the API again.
+
+        Pages are iterated in the same order as in the underlying
+        pagelist.
+
+        .. version-added:: 11.7
+
+        .. seealso:: :class:`page.LinkTable`
+
+        :param pagelist: An iterable that returns Page objects
+        :param groupsize: How many pages to query at a time. If None
+            (default), :attr:`maxlimit
+            <pywikibot.site._apisite.APISite.maxlimit>` is used.
+        :param redirects: Also load the targets of redirect pages
+        """
+        groupsize_ = min(groupsize or self.maxlimit, self.maxlimit)
+        for batch in batched(pagelist, groupsize_):
+            redirect_pages = self._load_info_batch(batch)
+            if redirects and redirect_pages:
+                self._load_redirect_targets(redirect_pages)
+            yield from batch
+
+    def _load_info_batch(
+        self,
+        batch: tuple[pywikibot.page.BasePage, ...],
+    ) -> dict[str, list[pywikibot.page.BasePage]]:
+        """Load page info of a single batch for :meth:`preloadpageinfo`.
+
+        .. version-added:: 11.7
+
+        :return: redirect pages of the batch by their title
+        """
+        titles: dict[str, list[pywikibot.page.BasePage]] = {}
+        for page in batch:
+            titles.setdefault(page.title(with_section=False), []).append(page)
+
+        query = self.simple_request(action='query', prop='info',
+                                    titles=list(titles))
+        result = query.submit().get('query', {})
+        for item in result.get('normalized', []):
+            if item['from'] in titles:
+                titles[item['to']] = titles.pop(item['from'])
+
+        redirect_pages = {}
+        for pagedata in result.get('pages', {}).values():
+            pages = titles.get(pagedata['title'], [])
+            if 'invalid' in pagedata or int(pagedata['ns']) < 0:
+                continue
+            for page in pages:
+                api.update_page(page, pagedata, ['info'])
+            if pages and 'redirect' in pagedata:
+                redirect_pages[pagedata['title']] = pages
+        return redirect_pages
+
+    def _load_redirect_targets(
+        self,
+        redirect_pages: dict[str, list[pywikibot.page.BasePage]],
+    ) -> None:
+        """Load redirect targets for :meth:`preloadpageinfo`.
+
+        Targets which need further checks like interwiki, special page
+        or circular redirects are left to :meth:`getredirtarget()
+        <pywikibot.site._apisite.APISite.getredirtarget>`.
+
+        .. version-added:: 11.7
+
+        :param redirect_pages: redirect pages by their normalized title
+        """
+        query = self.simple_request(action='query', prop='info',
+                                    titles=list(redirect_pages),
+                                    redirects=True)
+        result = query.submit().get('query', {})
+        targets = {pagedata['title']: pagedata
+                   for pagedata in result.get('pages', {}).values()}
+        for item in result.get('redirects', []):
+            pagedata = targets.get(item['to'])
+            if ('tointerwiki' in item or item['from'] not in redirect_pages
+                    or pagedata is None or 'invalid' in pagedata
+                    or int(pagedata['ns']) < 0
+                    or self.sametitle(item['from'], item['to'])):
+                continue
+
+            target_title = item['to']
+            if item.get('tofragment'):
+                target_title += '#' + item['tofragment']
+            target = pywikibot.Page(self, target_title)
+            api.update_page(target, pagedata, ['info'])
+
+            # Upcast to proper Page subclass.
+            ns = target.namespace()
+            if ns == Namespace.USER:
+                target = pywikibot.User(target)
+            elif ns == Namespace.FILE:
+                target = pywikibot.FilePage(target)
+            elif ns == Namespace.CATEGORY:
+                target = pywikibot.Category(target)
+
+            for page in redirect_pages[item['from']]:
+                page._redirtarget = target
 
     def pagebacklinks(
         self,
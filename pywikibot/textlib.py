@@ -6,15 +6,19 @@
 """Functions for manipulating wiki-text."""
 from __future__ import annotations
 
+import hashlib
 import itertools
 import re
 import sys
+import threading
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict
 from collections.abc import Callable, Container, Iterable, Mapping, Sequence
 from contextlib import closing, suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from html.parser import HTMLParser
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 import pywikibot
 from pywikibot.backports import pairwise
@@ -38,6 +42,13 @@ except ModuleNotFoundError:
 # cache for replaceExcept to avoid recompile or regexes each call
 _regex_cache: dict[str, re.Pattern[str]] = {}
 
+# Maximum number of regexes kept by get_combined_regex
+COMBINED_REGEX_CACHE_SIZE = 128
+
+_combined_regex_cache: OrderedDict[tuple[Any, ...],
+                                   re.Pattern[str] | None] = OrderedDict()
+_combined_regex_cache_lock = threading.Lock()
+
 # The regex below collects nested templates, providing simpler
 # identification of templates used at the top-level of wikitext.
 # It doesn't match {{{1|...}}}, however it also does not match templates
@@ -108,6 +119,29 @@ FILE_LINK_REGEX = r"""
     \]\]
 """
 
+# Maximum number of parse trees and template lists kept by
+# parse_wikitext and extract_templates_and_params
+PARSE_CACHE_SIZE = 64
+
+# Maximum total length of the texts of these parse trees and template
+# lists; a tree of a long text uses many times the memory of the text
+PARSE_CACHE_MAX_LENGTH = 5_000_000
+
+
+class _ParseCache(OrderedDict):
+
+    """Cached results by key with the length of their texts.
+
+    Values are tuples of the text length and the cached result.
+    """
+
+    #: total length of the texts
+    length = 0
+
+
+_parse_cache = _ParseCache()
+_parse_cache_lock = threading.Lock()
+
 # Used in TimeStripper. When a timestamp-like line has longer gaps
 # than this between year, month, etc in it, then the line will not be
 # considered to contain a timestamp.
@@ -322,6 +356,10 @@ def get_regexes(
        ``_get_regexes`` becomes a public function.
        *keys* may be a single string; *site* is optional.
 
+    .. version-changed:: 11.7
+       site specific regexes are cached by the family name and code of
+       the site instead of the site object.
+
     :param keys: A single key or an iterable of keys whose regex pattern
         should be given
     :param site: A BaseSite object needed for ``category``, ``file``,
@@ -355,12 +393,13 @@ def get_regexes(
                                     'category', 'file'):
                 raise ValueError(f'site cannot be None for the {exc!r} regex')
 
-            if (exc, site) not in _regex_cache:
+            key = exc, site.family.name, site.code
+            if key not in _regex_cache:
                 re_text, re_var = _regex_cache[exc]
-                _regex_cache[(exc, site)] = re.compile(
-                    re_text % re_var(site), re.VERBOSE)
+                _regex_cache[key] = re.compile(re_text % re_var(site),
+                                               re.VERBOSE)
 
-            result.append(_regex_cache[(exc, site)])
+            result.append(_regex_cache[key])
 
         # handle aliases
         if exc == 'source':
@@ -376,6 +415,99 @@ def get_regexes(
     return result
 
 
+#: Global inline flags at the start of a pattern
+_GLOBAL_FLAGS = re.compile(r'\(\?[aiLmsux]+\)')
+
+#: Numbered group references which are broken by combining patterns
+_GROUP_REFERENCE = re.compile(r'\\[1-9]|\(\?\(\d')
+
+
+def get_combined_regex(
+    keys: str | Iterable[str | re.Pattern[str]],
+    site: pywikibot.site.BaseSite | None = None
+) -> re.Pattern[str] | None:
+    """Return a single regex which matches any of the given regexes.
+
+    The regexes of :func:`get_regexes` are combined into one alternation
+    and every alternative is enclosed in a named group. The group name
+    is the key, or ``regex`` for compiled regexes, followed by a counter
+    if it is used more than once. :attr:`re.Match.lastgroup` tells which
+    regex has matched. A search finds the same match as searching all
+    regexes and taking the first of those which start first:
+
+    .. code-block:: python
+
+       regex = textlib.get_combined_regex(['comment', 'nowiki'])
+       match = regex.search(text)
+       if match:
+           print(match.lastgroup, match.span())
+
+    The combined regexes of the last :data:`COMBINED_REGEX_CACHE_SIZE`
+    keys and sites are cached.
+
+    .. version-added:: 11.7
+
+    :param keys: A single key or an iterable of keys or compiled regexes
+    :param site: A BaseSite object needed for site specific keys; see
+        :func:`get_regexes`
+    :return: the combined regex or None if the regexes cannot be
+        combined, e.g. if they use backreferences to numbered groups
+    """
+    if isinstance(keys, str):
+        keys = [keys]
+    keys = tuple(keys)
+    cache_key = keys, (site.family.name, site.code) if site else None
+    with _combined_regex_cache_lock:
+        if cache_key in _combined_regex_cache:
+            _combined_regex_cache.move_to_end(cache_key)
+            return _combined_regex_cache[cache_key]
+
+    names: dict[str, int] = {}
+    alternatives = []
+    for key in keys:
+        name = re.sub(r'\W', '_', key) if isinstance(key, str) else 'regex'
+        if not name.isidentifier():
+            name = '_' + name
+        for regex in get_regexes([key], site):
+            names[name] = count = names.get(name, 0) + 1
+            group = f'{name}_{count}' if count > 1 else name
+            alternatives.append(_named_alternative(group, regex))
+
+    combined = None
+    if alternatives and None not in alternatives:
+        with suppress(re.error):
+            combined = re.compile('|'.join(alternatives))
+
+    with _combined_regex_cache_lock:
+        _combined_regex_cache[cache_key] = combined
+        while len(_combined_regex_cache) > COMBINED_REGEX_CACHE_SIZE:
+            _combined_regex_cache.popitem(last=False)
+    return combined
+
+
+def _named_alternative(name: str, regex: re.Pattern[str]) -> str | None:
+    """Return the pattern of regex as named group with scoped flags.
+
+    :return: the group pattern or None if the regex uses numbered
+        group references which would be broken in a combined regex
+    """
+    pattern = regex.pattern
+    if _GROUP_REFERENCE.search(pattern):
+        return None
+
+    if _GLOBAL_FLAGS.match(pattern):
+        # the flags are applied by the scoped group below
+        pattern = _GLOBAL_FLAGS.sub('', pattern, count=1)
+    flags = ''.join(flag for flag, value in (
+        ('a', re.ASCII), ('i', re.IGNORECASE), ('m', re.MULTILINE),
+        ('s', re.DOTALL), ('x', re.VERBOSE)) if regex.flags & value)
+    if flags:
+        # a newline ends a trailing comment of a verbose pattern
+        end = '\n' if regex.flags & re.VERBOSE else ''
+        pattern = f'(?{flags}:{pattern}{end})'
+    return f'(?P<{name}>{pattern})'
+
+
 def replaceExcept(text: str,
                   old: str | re.Pattern[str],
                   new: str | Callable[[re.Match[str]], str],
@@ -395,6 +527,14 @@ def replaceExcept(text: str,
     .. caution:: Watch out when using *allowoverlap*, it might lead to
        infinite loops!
 
+    .. version-changed:: 11.7
+       The next exception is found by a single
+       :func:`get_combined_regex` search and reused until it is passed.
+       The replacements are collected and joined once; a function given
+       as *new* gets match objects of the text before the replacements.
+       Use :class:`ExceptionSpans` to share the exception search
+       results between several replacements.
+
     :param text: Text to be modified
     :param old: A compiled or uncompiled regular expression
     :param new: A string (which can contain regular expression
@@ -417,86 +557,493 @@ def replaceExcept(text: str,
         return text + marker
 
     dontTouchRegexes = get_regexes(exceptions, site)
+    combined = get_combined_regex(exceptions, site) if exceptions else None
+
+    def next_exception(text: str, index: int) -> tuple[int, int] | None:
+        """Return the span of the exception which will occur next."""
+        if combined is not None:
+            match = combined.search(text, index)
+            return match.span() if match else None
+
+        nextExceptionMatch = None
+        for dontTouchR in dontTouchRegexes:
+            excMatch = dontTouchR.search(text, index)
+            if excMatch and (
+                    nextExceptionMatch is None
+                    or excMatch.start() < nextExceptionMatch.start()):
+                nextExceptionMatch = excMatch
+        return nextExceptionMatch.span() if nextExceptionMatch else None
+
+    return _replace_except(text, old, new, next_exception,
+                           _lookback([old, *dontTouchRegexes]),
+                           allowoverlap, marker, count)
+
+
+class _Lookback(NamedTuple):
+
+    """Characters before a search position which regexes may read.
+
+    .. version-added:: 11.7
+    """
+
+    #: maximum number of characters or None if it is not known
+    width: int | None
+
+    #: Regexes of single characters. Two characters are read alike if
+    #: each of these regexes matches both or none of them. None if the
+    #: characters must be equal.
+    classes: tuple[re.Pattern[str], ...] | None = None
+
+    def same(self, text: str, other: str) -> bool:
+        """Return whether the regexes read both strings alike.
+
+        :param text: The characters before a search position
+        :param other: The characters before the corresponding position
+            of another text
+        """
+        if text == other:
+            return True
+
+        if self.classes is None or len(text) != 1 or len(other) != 1:
+            return False
+
+        return all(bool(cls.fullmatch(text)) == bool(cls.fullmatch(other))
+                   for cls in self.classes)
+
+
+#: Escaped characters, starts of character classes and line starts
+_BACKWARD_TOKEN = re.compile(r'\\(.)|\[\^?|\^', re.DOTALL)
+
+#: A pattern item which matches exactly one character
+_ATOM = r'\\[^1-9gN]|\[\^?\]?(?:\\.|[^\]\\])*\]|[^\\()\[\]|?*+{}]'
+_ATOM_REGEX = re.compile(_ATOM, re.DOTALL)
+
+#: Lookbehind assertions which consist of single character items
+_LOOKBEHIND = re.compile(rf'\(\?<[=!]((?:{_ATOM})*)\)', re.DOTALL)
+
+#: Groups with inline flags
+_SCOPED_FLAGS = re.compile(r'\(\?[aiLmsux-]+:')
+
+#: Classes of characters read by word boundaries and line starts
+_CHARACTER_CLASSES = (re.compile(r'\w'), re.compile(r'\w', re.ASCII),
+                      re.compile('\n'))
+
+
+@lru_cache(maxsize=256)
+def _regex_lookback(regex: re.Pattern[str]) -> _Lookback:
+    """Return the characters before a search position read by a regex.
+
+    Word boundaries and line starts read one character. The width of
+    lookbehind assertions is estimated by the number of their items;
+    it is not known if they use repetitions or alternatives.
+
+    .. version-added:: 11.7
+    """
+    pattern = getattr(regex, 'pattern', None)
+    if not isinstance(pattern, str):
+        return _Lookback(None)
+
+    width = 0
+    for token in _BACKWARD_TOKEN.finditer(pattern):
+        if token[0] == '^' or token[1] in ('b', 'B'):
+            width = 1
+            break
+
+    lookbehinds = _LOOKBEHIND.findall(pattern)
+    if len(lookbehinds) != pattern.count('(?<=') + pattern.count('(?<!'):
+        return _Lookback(None)
+
+    classes = list(_CHARACTER_CLASSES)
+    for content in lookbehinds:
+        items = len(_ATOM_REGEX.findall(content))
+        width = max(width, items)
+        if items == 1:
+            try:
+                classes.append(re.compile(content, regex.flags))
+            except re.error:
+                return _Lookback(width)
+
+    if width > 1 or _SCOPED_FLAGS.search(pattern):
+        return _Lookback(width)
+    return _Lookback(width, tuple(classes))
+
+
+def _lookback(regexes: Iterable[re.Pattern[str]]) -> _Lookback:
+    """Return the characters before a search position read by regexes.
+
+    .. version-added:: 11.7
+    """
+    width = 0
+    classes: dict[re.Pattern[str], None] | None = {}
+    for regex in regexes:
+        lookback = _regex_lookback(regex)
+        if lookback.width is None:
+            return lookback
+
+        width = max(width, lookback.width)
+        if lookback.classes is None:
+            classes = None
+        elif classes is not None:
+            classes.update(dict.fromkeys(lookback.classes))
+
+    return _Lookback(width, None if classes is None else tuple(classes))
+
+
+def _tail(pieces: list[str], size: int) -> str:
+    """Return the last *size* characters of the joined pieces."""
+    tail = ''
+    for piece in reversed(pieces):
+        if len(tail) >= size:
+            break
+        tail = piece[-size:] + tail
+    return tail[-size:]
+
+
+def _replace_except(
+    text: str,
+    old: re.Pattern[str],
+    new: str | Callable[[re.Match[str]], str],
+    next_exception: Callable[[str, int], tuple[int, int] | None],
+    lookback: _Lookback,
+    allowoverlap: bool,
+    marker: str,
+    count: int,
+    rebase: Callable[[str, list[tuple[int, int, int]]], None] | None = None
+) -> str:
+    """Replace *old* by *new* in *text* and skip the exceptions.
+
+    The result is the same as if the text were rewritten after each
+    replacement and the next matches of *old* and of the exceptions
+    were searched in the rewritten text. A search only reads the text
+    behind its start position and the *lookback* characters before it.
+    As long as they are read alike in the rewritten text, the text
+    given is searched instead and the replacements are joined once at
+    the end. Each search result is reused until the search position
+    has passed it.
+
+    Otherwise, and after each replacement if *allowoverlap* is set, the
+    rewritten text is built and searched from then on.
+
+    .. version-added:: 11.7
+
+    :param next_exception: A function which returns the span of the
+        first exception in the given text starting at the given index
+    :param lookback: The characters before a search position read by
+        *old* and the exception regexes
+    :param rebase: A function which is called with the rewritten text
+        and the replacements of the previously searched text as start,
+        end and length of the replacement whenever the searched text
+        changes
+    """
+    base = text  # the searched text
+    pieces: list[str] = []  # the rewritten text up to *last* of base
+    last = 0
+    edits: list[tuple[int, int, int]] = []
+    markerpos: int | None = len(text)  # None: after the last piece
+
+    # search positions and results which are reused
+    match_from: int | None = None
+    match = None
+    exception_from: int | None = None
+    exception = None
 
     index = 0
     replaced = 0
-    markerpos = len(text)
     while not count or replaced < count:
-        if index > len(text):
+        if index > len(base):
             break
 
-        match = old.search(text, index)
+        if match_from is None or index > match.start():
+            match = old.search(base, index)
+            match_from = index
         if not match:
             # nothing left to replace
             break
 
         # check which exception will occur next.
-        nextExceptionMatch = None
-        for dontTouchR in dontTouchRegexes:
-            excMatch = dontTouchR.search(text, index)
-            if excMatch and (
-                    nextExceptionMatch is None
-                    or excMatch.start() < nextExceptionMatch.start()):
-                nextExceptionMatch = excMatch
-
-        if nextExceptionMatch is not None \
-                and nextExceptionMatch.start() <= match.start():
+        if exception_from is None or exception and index > exception[0]:
+            exception = next_exception(base, index)
+            exception_from = index
+        if exception is not None and exception[0] <= match.start():
             # an HTML comment or text in nowiki tags stands before the next
             # valid match. Skip.
-            index = nextExceptionMatch.end()
+            index = exception[1]
             continue
 
         # We found a valid match. Replace it.
-        if callable(new):
-            # the parameter new can be a function which takes the match
-            # as a parameter.
-            replacement = new(match)
-        else:
-            # it is not a function, but a string.
-
-            # it is a little hack to make \n work. It would be better
-            # to fix it previously, but better than nothing.
-            new = new.replace('\\n', '\n')
-
-            # We cannot just insert the new string, as it may contain regex
-            # group references such as \2 or \g<name>.
-            # On the other hand, this approach does not work because it
-            # can't handle lookahead or lookbehind (see bug T123185).
-            # So we have to process the group references manually.
-            replacement = ''
-
-            group_regex = re.compile(r'\\(\d+)|\\g<(.+?)>')
-            last = 0
-            for group_match in group_regex.finditer(new):
-                group_id = group_match[1] or group_match[2]
-                with suppress(ValueError):
-                    group_id = int(group_id)
+        replacement = _expand_replacement(new, match)
+        start, end = match.span()
+        pieces += base[last:start], replacement
+        last = end
+        edits.append((start, end, len(replacement)))
+        markerpos = None
+        replaced += 1
 
-                try:
-                    replacement += new[last:group_match.start()]
-                    replacement += match[group_id] or ''
-                except IndexError:
-                    raise IndexError(f'Invalid group reference: {group_id}\n'
-                                     f'Groups found: {match.groups()}')
-                last = group_match.end()
-            replacement += new[last:]
+        # continue the search on the remaining text
+        index = end
+        if not match.group():
+            # When the regex allows to match nothing, shift by one char
+            index += 1
 
-        text = text[:match.start()] + replacement + text[match.end():]
+        width = lookback.width
+        if width is not None and not allowoverlap and (
+                index - last >= width
+                or lookback.same(
+                    (_tail(pieces, width) + base[last:index])[-width:],
+                    base[max(index - width, 0):index])):
+            continue
 
-        # continue the search on the remaining text
+        # search the rewritten text
+        rewritten = ''.join(pieces)
         if allowoverlap:
-            index = match.start() + 1
+            index = len(rewritten) - len(replacement) + 1
+            if not match.group():
+                index += 1
         else:
-            index = match.start() + len(replacement)
+            index += len(rewritten) - last
+        base = rewritten + base[last:]
+        if rebase:
+            rebase(base, edits)
+        pieces, last, edits = [], 0, []
+        markerpos = len(rewritten)
+        match_from = exception_from = None
+
+    if markerpos is None:
+        # the marker is added to the last replacement
+        text = ''.join(pieces) + marker + base[last:]
+        markerpos = last
+    else:
+        text = base[:markerpos] + marker + base[markerpos:]
+    if marker:
+        edits.append((markerpos, markerpos, len(marker)))
+    if rebase:
+        rebase(text, edits)
+    return text
 
-        if not match.group():
-            # When the regex allows to match nothing, shift by one char
-            index += 1
 
-        markerpos = match.start() + len(replacement)
-        replaced += 1
+_GROUP_REGEX = re.compile(r'\\(\d+)|\\g<(.+?)>')
+
+
+def _expand_replacement(new: str | Callable[[re.Match[str]], str],
+                        match: re.Match[str]) -> str:
+    """Return the replacement string for a match of :func:`replaceExcept`.
+
+    .. version-added:: 11.7
+    """
+    if callable(new):
+        # the parameter new can be a function which takes the match
+        # as a parameter.
+        return new(match)
+
+    # it is not a function, but a string.
+
+    # it is a little hack to make \n work. It would be better
+    # to fix it previously, but better than nothing.
+    new = new.replace('\\n', '\n')
+
+    # We cannot just insert the new string, as it may contain regex
+    # group references such as \2 or \g<name>.
+    # On the other hand, this approach does not work because it
+    # can't handle lookahead or lookbehind (see bug T123185).
+    # So we have to process the group references manually.
+    replacement = ''
+    last = 0
+    for group_match in _GROUP_REGEX.finditer(new):
+        group_id = group_match[1] or group_match[2]
+        with suppress(ValueError):
+            group_id = int(group_id)
+
+        try:
+            replacement += new[last:group_match.start()]
+            replacement += match[group_id] or ''
+        except IndexError:
+            raise IndexError(f'Invalid group reference: {group_id}\n'
+                             f'Groups found: {match.groups()}')
+        last = group_match.end()
+    return replacement + new[last:]
+
+
+def _changed_span(old: str, new: str) -> tuple[int, int, int]:
+    """Return the part of *old* which was replaced in *new*.
+
+    The common prefix and suffix are found by a binary search which
+    compares slices instead of single characters.
+
+    .. version-added:: 11.7
+
+    :return: start and end of the changed part of *old* and the length
+        of its replacement in *new*
+    """
+    size = min(len(old), len(new))
+    low, high = 0, size
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old[:mid] == new[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    prefix = low
+
+    low, high = 0, size - prefix
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old[len(old) - mid:] == new[len(new) - mid:]:
+            low = mid
+        else:
+            high = mid - 1
+    return prefix, len(old) - low, len(new) - low - prefix
+
+
+class ExceptionSpans:
+
+    """Shared exception search results for replacements in a text.
+
+    :func:`replaceExcept` searches every exception regex again after
+    each match. This class keeps the span of each search result: the
+    leftmost match of a regex found from one position is also the
+    leftmost match from every later position up to its start, so most
+    searches are answered from the collected results. They may be
+    shared by several replacements with common exceptions, e.g. all
+    :class:`replace.Replacement<scripts.replace.Replacement>` objects
+    applied to a page:
+
+    .. code-block:: python
+
+       spans = textlib.ExceptionSpans(page.text, site=page.site)
+       spans.replace(r'colour', 'color', ['comment', 'nowiki'])
+       spans.replace(r'harbour', 'harbor', ['comment', 'nowiki', 'link'])
+       page.text = spans.text
+
+    A search only reads the text behind its start position and a few
+    characters before it. If the text is changed, the results of
+    searches which started behind the last change are shifted by the
+    length difference and kept; the others are dropped.
+
+    :meth:`replace` gives the same result as :func:`replaceExcept`.
+
+    .. version-added:: 11.7
+
+    :param text: The text to be modified
+    :param site: A BaseSite object needed for site specific exceptions;
+        see :func:`get_regexes`
+    """
+
+    def __init__(self, text: str,
+                 site: pywikibot.site.BaseSite | None = None) -> None:
+        """Initializer."""
+        self.site = site
+        self._found: dict[re.Pattern[str],
+                          tuple[list[int], list[tuple[int, int] | None]]] = {}
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        """The current text.
+
+        Setting it keeps the search results behind the changed part.
+        """
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        if value != self._text:
+            self._rebase(value, [_changed_span(self._text, value)])
+
+    def _rebase(self, text: str, edits: list[tuple[int, int, int]]) -> None:
+        """Set the text which was changed by the given replacements.
+
+        :param edits: The replaced parts of the previous text as start,
+            end and length of the replacement, sorted by start
+        """
+        if edits:
+            end = edits[-1][1]
+            delta = sum(length - (stop - start)
+                        for start, stop, length in edits)
+            for regex, (positions, spans) in list(self._found.items()):
+                width = _regex_lookback(regex).width
+                if width is None:
+                    del self._found[regex]
+                    continue
+
+                i = bisect_left(positions, end + width)
+                self._found[regex] = (
+                    [pos + delta for pos in positions[i:]],
+                    [span and (span[0] + delta, span[1] + delta)
+                     for span in spans[i:]])
+        self._text = text
+
+    def search(self, regex: re.Pattern[str],
+               index: int = 0) -> tuple[int, int] | None:
+        """Return the span of the first match of *regex* from *index*.
+
+        This is the span of ``regex.search(text, index)`` but the
+        result may be taken from a previous search.
+        """
+        positions, spans = self._found.setdefault(regex, ([], []))
+        i = bisect_right(positions, index) - 1
+        if i >= 0:
+            span = spans[i]
+            if span is None or index <= span[0]:
+                return span
+
+        match = regex.search(self._text, index)
+        span = match.span() if match else None
+        positions.insert(i + 1, index)
+        spans.insert(i + 1, span)
+        return span
+
+    def next_exception(
+        self,
+        exceptions: Sequence[str | re.Pattern[str]],
+        index: int = 0
+    ) -> tuple[int, int] | None:
+        """Return the span of the exception which will occur next.
+
+        :param exceptions: A list of strings or already compiled regex
+            objects; see :func:`replaceExcept`
+        :param index: The position in the text to search from
+        :return: the first of the earliest matches of all exception
+            regexes or None if there is none
+        """
+        next_span = None
+        for regex in get_regexes(exceptions, self.site):
+            span = self.search(regex, index)
+            if span and (next_span is None or span[0] < next_span[0]):
+                next_span = span
+        return next_span
+
+    def replace(self,
+                old: str | re.Pattern[str],
+                new: str | Callable[[re.Match[str]], str],
+                exceptions: Sequence[str | re.Pattern[str]], *,
+                caseInsensitive: bool = False,
+                allowoverlap: bool = False,
+                marker: str = '',
+                count: int = 0) -> str:
+        """Replace *old* by *new* outside *exceptions* and return the text.
+
+        The replaced text becomes the new :attr:`text`. All parameters
+        are the same as for :func:`replaceExcept`.
+        """
+        if isinstance(old, str):
+            old = re.compile(old,
+                             flags=re.IGNORECASE if caseInsensitive else 0)
 
-    return text[:markerpos] + marker + text[markerpos:]
+        if not old.search(self._text):
+            if marker:
+                end = len(self._text)
+                self._rebase(self._text + marker, [(end, end, len(marker))])
+            return self._text
+
+        regexes = get_regexes(exceptions, self.site)
+
+        def next_exception(text: str, index: int) -> tuple[int, int] | None:
+            return self.next_exception(regexes, index)
+
+        _replace_except(self._text, old, new, next_exception,
+                        _lookback([old, *regexes]), allowoverlap, marker,
+                        count, rebase=self._rebase)
+        return self._text
 
 
 def removeDisabledParts(text: str,
@@ -1246,13 +1793,7 @@ class Content(NamedTuple):
 
 def _extract_headings(text: str) -> list[_Heading]:
     """Return _Heading objects."""
-    headings = []
-    heading_regex = get_regexes('header')[0]
-    for match in heading_regex.finditer(text):
-        start, end = match.span(1)
-        if not isDisabled(text, start) and not isDisabled(text, end):
-            headings.append(_Heading(match[1], start, end))
-    return headings
+    return SectionIndex(text).headings
 
 
 def _extract_sections(text: str, headings) -> list[Section]:
@@ -1346,27 +1887,242 @@ def extract_sections(
     .. version-changed:: 10.4
        Added custom ``index()``, ``count()`` and ``in`` operator support
        for :attr:`Content.sections`.
+    .. version-changed:: 11.7
+       The text is parsed by :class:`SectionIndex`.
 
     :return: The parsed namedtuple.
     """  # noqa: D300, D301
-    headings = _extract_headings(text)
-    sections = _extract_sections(text, headings)
-    # Find header and footer contents
-    header = text[:headings[0].start] if headings else text
-    cat_regex, interwiki_regex = get_regexes(['category', 'interwiki'], site)
-    langlink_pattern = interwiki_regex.pattern.replace(':?', '')
-    last_section_content = sections[-1].content if sections else header
-    footer = re.search(fr'({langlink_pattern}|{cat_regex.pattern}|\s)*\Z',
-                       last_section_content).group().lstrip()
-
-    if footer:
-        if sections:
-            sections[-1] = Section(
-                sections[-1].title, last_section_content[:-len(footer)])
-        else:
-            header = header[:-len(footer)]
+    return SectionIndex(text, site).content()
+
+
+class SectionIndex:
+
+    """Index of the section headings of a wikitext.
+
+    The index holds the titles and offsets of all headings found in the
+    text. Headings inside disabled parts like comments or nowiki tags
+    are ignored; these parts are located once for the whole text instead
+    of once per heading. :meth:`replace` changes the content of a single
+    section and rescans only the replaced part of the text; offsets of
+    subsequent headings are shifted:
+
+    .. code-block:: python
+
+       index = textlib.SectionIndex(page.text, page.site)
+       i = index.sections.index('History')
+       index.replace(i, '\nNew content\n\n')
+       page.text = index.text
+
+    .. version-added:: 11.7
+
+    :param text: The wikitext to be indexed
+    :param site: A BaseSite object used to find the footer of the page
+    """
+
+    #: Parts removed by :func:`removeDisabledParts` by default
+    DISABLED_TAGS = ('comment', 'includeonly', 'nowiki', 'pre',
+                     'syntaxhighlight')
+
+    #: Start of a disabled part which may be closed by subsequent text;
+    #: the group number is the position of its regex in
+    #: ``get_regexes(DISABLED_TAGS)`` plus one
+    OPENING_TAG = re.compile(
+        r'<(?:(!--)|(?:(includeonly)|(nowiki)|(pre)|(syntaxhighlight)'
+        r'|(source))(?=[>\s])(?![^>\n]*/>))', re.IGNORECASE)
+
+    #: Incomplete tag at the end of a replaced section
+    PARTIAL_TAG = re.compile(r'<[!\w-]*\Z')
 
-    return Content(header, sections, footer)
+    def __init__(self, text: str,
+                 site: pywikibot.site.BaseSite | None = None) -> None:
+        """Initializer."""
+        self.site = site
+        self._build(text)
+
+    def _build(self, text: str) -> None:
+        """Index the whole text."""
+        self.text = text
+        self._starts, self._ends, self._unclosed = self._disabled_parts(text)
+        self.headings = self._scan(0)
+        self._sections: SectionList[Section] | None = None
+
+    @classmethod
+    def _disabled_parts(
+        cls, text: str
+    ) -> tuple[list[int], list[int], list[int]]:
+        """Return disabled parts and unclosed opening tags of text.
+
+        Like :func:`removeDisabledParts` each kind of disabled part is
+        searched in the text left by the previous removals.
+
+        :return: sorted starts and ends of merged disabled parts and the
+            positions of opening tags which were neither removed before
+            nor closed by their own kind
+        """
+        regexes = get_regexes(cls.DISABLED_TAGS)
+        openers: list[list[int]] = [[] for _ in regexes]
+        for match in cls.OPENING_TAG.finditer(text):
+            openers[match.lastindex - 1].append(match.start())
+
+        starts: list[int] = []
+        ends: list[int] = []
+        unclosed = []
+        for kind, regex in enumerate(regexes):
+            # removed length in front of each part of the reduced text
+            shifts = list(itertools.accumulate(
+                (end - start for start, end in zip(starts, ends)),
+                initial=0))
+            kept = [start - shift for start, shift in zip(starts, shifts)]
+            reduced = ''.join(
+                text[begin:end] for begin, end in zip([0, *ends],
+                                                      [*starts, len(text)]))
+            spans = []
+            for match in regex.finditer(reduced):
+                start, end = match.span()
+                start += shifts[bisect_right(kept, start)]
+                end += shifts[bisect_right(kept, end - 1)]
+                spans.append((start, end))
+
+            closed = {start for start, _ in spans}
+            for pos in openers[kind]:
+                i = bisect_right(starts, pos) - 1
+                if (i < 0 or pos >= ends[i]) and pos not in closed:
+                    unclosed.append(pos)
+
+            merged_starts: list[int] = []
+            merged_ends: list[int] = []
+            for start, end in sorted([*zip(starts, ends), *spans]):
+                if merged_ends and start < merged_ends[-1]:
+                    merged_ends[-1] = max(merged_ends[-1], end)
+                else:
+                    merged_starts.append(start)
+                    merged_ends.append(end)
+            starts, ends = merged_starts, merged_ends
+
+        return starts, ends, sorted(unclosed)
+
+    def _is_disabled(self, index: int) -> bool:
+        """Return True if text[index] is disabled like :func:`isDisabled`."""
+        i = bisect_left(self._starts, index) - 1
+        return i >= 0 and index < self._ends[i]
+
+    def _scan(self, pos: int, stop: int | None = None) -> list[_Heading]:
+        """Return the headings found from pos until stop."""
+        headings = []
+        for match in get_regexes('header')[0].finditer(self.text, pos):
+            start, end = match.span(1)
+            if stop is not None and start >= stop:
+                break
+            if not self._is_disabled(start) and not self._is_disabled(end):
+                headings.append(_Heading(match[1], start, end))
+        return headings
+
+    def __len__(self) -> int:
+        """Return the number of sections."""
+        return len(self.headings)
+
+    @property
+    def sections(self) -> SectionList[Section]:
+        """The sections of the text like :attr:`Content.sections`.
+
+        The footer is not separated from the last section.
+        """
+        if self._sections is None:
+            self._sections = _extract_sections(self.text, self.headings)
+        return self._sections
+
+    def span(self, i: int) -> tuple[int, int]:
+        """Return start and end offset of a section including its title."""
+        i = range(len(self.headings))[i]
+        if i + 1 < len(self.headings):
+            return self.headings[i].start, self.headings[i + 1].start
+        return self.headings[i].start, len(self.text)
+
+    def size(self, i: int) -> int:
+        """Return the size of a section in bytes including its title."""
+        start, end = self.span(i)
+        return len(self.text[start:end].encode('utf-8'))
+
+    def content(self) -> Content:
+        """Return the header, sections and footer of the text.
+
+        The result is the same as of :func:`extract_sections`.
+        """
+        text = self.text
+        sections = SectionList(self.sections)
+        header = text[:self.headings[0].start] if self.headings else text
+        cat_regex, interwiki_regex = get_regexes(['category', 'interwiki'],
+                                                 self.site)
+        langlink_pattern = interwiki_regex.pattern.replace(':?', '')
+        last_section_content = sections[-1].content if sections else header
+        footer = re.search(
+            fr'({langlink_pattern}|{cat_regex.pattern}|\s)*\Z',
+            last_section_content).group().lstrip()
+
+        if footer:
+            if sections:
+                sections[-1] = Section(
+                    sections[-1].title, last_section_content[:-len(footer)])
+            else:
+                header = header[:-len(footer)]
+
+        return Content(header, sections, footer)
+
+    def replace(self, i: int, content: str) -> str:
+        """Replace the content of section *i* and return the new text.
+
+        Only the replaced section is scanned again unless the change
+        may affect headings outside of it, e.g. by an unclosed tag or
+        by a comment in front of the section end; then the whole text
+        is indexed again.
+
+        :param i: index of the section
+        :param content: new content of the section without its title
+        """
+        i = range(len(self.headings))[i]
+        heading = self.headings[i]
+        _, stop = self.span(i)
+        text = self.text[:heading.end] + content + self.text[stop:]
+        delta = len(text) - len(self.text)
+
+        line_start = text.rfind('\n', 0, heading.start) + 1
+        new_starts, new_ends, new_unclosed = self._disabled_parts(content)
+        first = bisect_right(self._ends, heading.end)
+        last = bisect_left(self._starts, stop)
+        crossing = any(
+            start < heading.end or end > stop
+            for start, end in zip(self._starts[first:last],
+                                  self._ends[first:last]))
+        # the heading regex may match across lines through comments
+        if crossing or new_unclosed or self.PARTIAL_TAG.search(content) \
+           or self._unclosed and self._unclosed[0] < stop \
+           or '<!--' in content or self.text.find('<!--', 0, stop) >= 0 \
+           or self.text.find('<', line_start, heading.end) >= 0:
+            self._build(text)
+            return text
+
+        self.text = text
+        self._starts[first:last] = [start + heading.end
+                                    for start in new_starts]
+        self._ends[first:last] = [end + heading.end for end in new_ends]
+        for j in range(first + len(new_starts), len(self._starts)):
+            self._starts[j] += delta
+            self._ends[j] += delta
+        self._unclosed = [pos + delta for pos in self._unclosed]
+        self._sections = None
+
+        following = [
+            _Heading(h.text, h.start + delta, h.end + delta)
+            for h in self.headings[i + 1:]]
+        found = self._scan(line_start,
+                           following[0].start + 1 if following else None)
+        if following and found[-1:] != following[:1]:
+            # the next heading has changed
+            self._build(text)
+            return text
+
+        self.headings[i:] = found + following[1:]
+        return text
 
 
 # -----------------------------------------------
@@ -2024,6 +2780,93 @@ def compileLinkR(withoutBracketed: bool = False, onlyBracketed: bool = False):
 # Functions dealing with templates
 # --------------------------------
 
+def _text_key(text: str) -> bytes:
+    """Return a digest of text used as key of the parse cache."""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'),
+                           digest_size=16).digest()
+
+
+def _cached(key: tuple[Any, ...], length: int,
+            func: Callable[[], Any]) -> Any:
+    """Return a cached value of the parse cache or call func to set it.
+
+    Least recently used values are removed if the cache holds more than
+    :data:`PARSE_CACHE_SIZE` values or their texts are longer than
+    :data:`PARSE_CACHE_MAX_LENGTH` in total. A value of a longer text
+    is not cached.
+
+    :param length: The length of the text of the value
+    """
+    with _parse_cache_lock:
+        if key in _parse_cache:
+            _parse_cache.move_to_end(key)
+            return _parse_cache[key][1]
+
+    value = func()
+    if length > PARSE_CACHE_MAX_LENGTH:
+        return value
+
+    with _parse_cache_lock:
+        if key in _parse_cache:
+            _parse_cache.length -= _parse_cache[key][0]
+        _parse_cache[key] = length, value
+        _parse_cache.length += length
+        while (len(_parse_cache) > PARSE_CACHE_SIZE
+               or _parse_cache.length > PARSE_CACHE_MAX_LENGTH):
+            _parse_cache.length -= _parse_cache.popitem(last=False)[1][0]
+    return value
+
+
+def parse_wikitext(text: str):
+    """Return the parse tree of wikitext.
+
+    The text is parsed with :py:obj:`mwparserfromhell` or
+    :py:obj:`wikitextparser` like :func:`extract_templates_and_params`
+    does. Parse trees of the last :data:`PARSE_CACHE_SIZE` texts are
+    kept as long as the texts are not longer than
+    :data:`PARSE_CACHE_MAX_LENGTH` in total, so identical wikitext is
+    parsed only once.
+
+    .. caution:: The tree is shared by all callers and must not be
+       modified. Parse the text with the parser package directly if
+       you want to change it.
+
+    .. version-added:: 11.7
+
+    :param text: The wikitext to be parsed
+    :return: ``mwparserfromhell.wikicode.Wikicode`` or
+        ``wikitextparser.WikiText`` object
+    :raises ModuleNotFoundError: No wikitext parser is installed.
+    """
+    if isinstance(wikitextparser, Exception):
+        raise wikitextparser
+
+    key = ('tree', wikitextparser.__name__, _text_key(text))
+    return _cached(key, len(text), lambda: wikitextparser.parse(text))
+
+
+def clear_parse_cache(text: str | None = None) -> None:
+    """Remove cached results of :func:`parse_wikitext`.
+
+    :attr:`page.BasePage.text` calls this function when the text of a
+    page is changed.
+
+    .. version-added:: 11.7
+
+    :param text: Remove parse tree and templates of this text only;
+        clear the whole cache if None.
+    """
+    with _parse_cache_lock:
+        if text is None:
+            _parse_cache.clear()
+            _parse_cache.length = 0
+            return
+
+        digest = _text_key(text)
+        for key in [key for key in _parse_cache if key[2] == digest]:
+            _parse_cache.length -= _parse_cache.pop(key)[0]
+
+
 def extract_templates_and_params(
     text: str,
     remove_disabled_parts: bool = False,
@@ -2059,6 +2902,9 @@ def extract_templates_and_params(
        *mwparserfromhell* is strictly recommended.
     .. version-changed:: 11.1
        Raise ModuleNotFoundError if no wikitext parser is installed.
+    .. version-changed:: 11.7
+       The result is cached by :func:`parse_wikitext`; the same text is
+       parsed only once.
 
     :param text: The wikitext from which templates are extracted
     :param remove_disabled_parts: If enabled, remove disabled wikitext
@@ -2067,6 +2913,26 @@ def extract_templates_and_params(
     :return: List of template name and params
     :raises ModuleNotFoundError: No wikitext parser is installed.
     """
+    if isinstance(wikitextparser, Exception):
+        raise wikitextparser
+
+    key = ('templates', wikitextparser.__name__, _text_key(text),
+           remove_disabled_parts, strip)
+    result = _cached(key, len(text), lambda: _extract_templates_and_params(
+        text, remove_disabled_parts, strip))
+    # the params may be modified by the caller
+    return [(name, params.copy()) for name, params in result]
+
+
+def _extract_templates_and_params(
+    text: str,
+    remove_disabled_parts: bool,
+    strip: bool,
+) -> list[tuple[str, OrderedDict[str, str]]]:
+    """Parse text for :func:`extract_templates_and_params`.
+
+    .. version-added:: 11.7
+    """
     def explicit(param):
         try:
             attr = param.showkey
@@ -2074,9 +2940,6 @@ def extract_templates_and_params(
             attr = not param.positional
         return attr
 
-    if isinstance(wikitextparser, Exception):
-        raise wikitextparser
-
     if remove_disabled_parts:
         text = removeDisabledParts(text)
 
@@ -2084,7 +2947,7 @@ def extract_templates_and_params(
     pywikibot.debug(f'Using {parser_name!r} wikitext parser')
 
     result = []
-    parsed = wikitextparser.parse(text)
+    parsed = parse_wikitext(text)
     if parser_name == 'wikitextparser':
         templates = parsed.templates
         arguments = 'arguments'
@@ -2208,6 +3071,10 @@ def reformat_ISBNs(text: str, match_func) -> str:
 
 TIMEGROUPS = ('time', 'tzinfo', 'year', 'month', 'day', 'hour', 'minute')
 
+# Maximum number of sites whose month names and patterns are kept by
+# TimeStripper
+TIMESTRIPPER_CACHE_SIZE = 32
+
 
 class TimeStripperPatterns(NamedTuple):
 
@@ -2243,11 +3110,70 @@ class TimeStripper:
     Timestamp(2013, 5, 15, 20, 34, tzinfo=TZoneFixedOffset(3600, Europe/Paris))
     """
 
+    #: Lines without any of these parts cannot contain a timestamp;
+    #: tags and character references may join or create digits
+    _CANDIDATE = re.compile(r'[<&]|\d[:.h]\d')
+
+    #: Line boundaries of :meth:`str.splitlines` and the parts of a
+    #: timestamp searched by :meth:`find_timestamps`; the parts are
+    #: looked ahead to find overlapping ones like a time and a year.
+    #: ``{month}`` is replaced by the month names of the site.
+    _SCANNER = (r'(?P<line_break>\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029])'
+                r'|(?=(?P<time>\d[:.h]\d)|(?P<year>\d{{4}})'
+                r'|(?P<open>\()|(?P<close>\))|(?P<markup>[<&]){month})')
+
+    #: Bits of the timestamp parts found on a line
+    _PARTS = {'time': 1, 'year': 2, 'month': 4, 'open': 8, 'close': 16,
+              'markup': 32}
+
+    #: Month names, patterns and scanner by family name and site code
+    _site_patterns: OrderedDict[
+        tuple[str, str],
+        tuple[dict[str, int], bool, TimeStripperPatterns, re.Pattern[str]]
+    ] = OrderedDict()
+    _site_patterns_lock = threading.Lock()
+
     def __init__(self, site=None) -> None:
-        """Initializer."""
+        """Initializer.
+
+        .. version-changed:: 11.7
+           month names and patterns are built once per site; those of
+           the last :data:`TIMESTRIPPER_CACHE_SIZE` sites are cached.
+        """
         self.site = pywikibot.Site() if site is None else site
 
-        self.origNames2monthNum = {}
+        key = self.site.family.name, self.site.code
+        with self._site_patterns_lock:
+            cached = self._site_patterns.get(key)
+            if cached is not None:
+                self._site_patterns.move_to_end(key)
+
+        if cached is None:
+            cached = self._build_patterns()
+            with self._site_patterns_lock:
+                self._site_patterns[key] = cached
+                while len(self._site_patterns) > TIMESTRIPPER_CACHE_SIZE:
+                    self._site_patterns.popitem(last=False)
+
+        (self.origNames2monthNum, self.is_digit_month,
+         self.patterns, self._scanner) = cached
+
+        self._hyperlink_pat = re.compile(r'\[\s*?http[s]?://[^\]]*?\]')
+        self._comment_pat = re.compile(r'<!--(.*?)-->')
+        self._wikilink_pat = re.compile(
+            r'\[\[(?P<link>[^\]\|]*?)(?P<anchor>\|[^\]]*)?\]\]')
+
+        self.tzinfo = TZoneFixedOffset(self.site.siteinfo['timeoffset'],
+                                       self.site.siteinfo['timezone'])
+
+    def _build_patterns(
+        self
+    ) -> tuple[dict[str, int], bool, TimeStripperPatterns, re.Pattern[str]]:
+        """Return month names, digit month flag, patterns and scanner.
+
+        .. version-added:: 11.7
+        """
+        origNames2monthNum = {}
         # use first_lower/first_upper for those language where month names
         # were changed: T324310, T356175, T415880
         if self.site.lang in ('hy', 'it', 'vi'):
@@ -2257,12 +3183,12 @@ class TimeStripper:
 
         for n, (long, short) in enumerate(self.site.months_names, start=1):
             for func in functions:
-                self.origNames2monthNum[func(long)] = n
-                self.origNames2monthNum[func(short)] = n
+                origNames2monthNum[func(long)] = n
+                origNames2monthNum[func(short)] = n
                 # in some cases month in ~~~~ might end without dot even if
                 # site.months_names do not.
                 if short.endswith('.'):
-                    self.origNames2monthNum[func(short[:-1])] = n
+                    origNames2monthNum[func(short[:-1])] = n
 
         timeR = (r'(?P<time>(?P<hour>([0-1]\d|2[0-3]))[:\.h]'
                  r'(?P<minute>[0-5]\d))')
@@ -2270,7 +3196,7 @@ class TimeStripper:
         yearR = r'(?P<year>(19|20)\d\d)(?:{})?'.format('\ub144')
         # if months have 'digits' as names, they need to be
         # removed; will be handled as digits in regex, adding d+{1,2}\.?
-        escaped_months = [month for month in self.origNames2monthNum if
+        escaped_months = [month for month in origNames2monthNum if
                           not month.strip('.').isdigit()]
         # match longest names first.
         escaped_months = [re.escape(month) for
@@ -2278,18 +3204,18 @@ class TimeStripper:
         # work around for cs wiki: if month are in digits, we assume
         # that format is dd. mm. (with dot and spaces optional)
         # the last one is workaround for Korean
-        if any(month.isdigit() for month in self.origNames2monthNum):
-            self.is_digit_month = True
+        if any(month.isdigit() for month in origNames2monthNum):
+            is_digit_month = True
             monthR = r'(?P<month>({})|(?:1[012]|0?[1-9])\.)' \
                      .format('|'.join(escaped_months))
             dayR = r'(?P<day>(3[01]|[12]\d|0?[1-9]))(?:{})' \
                    r'?\.?\s*(?:[01]?\d\.)?'.format('\uc77c')
         else:
-            self.is_digit_month = False
+            is_digit_month = False
             monthR = r'(?P<month>({}))'.format('|'.join(escaped_months))
             dayR = r'(?P<day>(3[01]|[12]\d|0?[1-9]))\.?'
 
-        self.patterns = TimeStripperPatterns(
+        patterns = TimeStripperPatterns(
             re.compile(timeR),
             re.compile(timeznR),
             re.compile(yearR),
@@ -2297,13 +3223,15 @@ class TimeStripper:
             re.compile(dayR),
         )
 
-        self._hyperlink_pat = re.compile(r'\[\s*?http[s]?://[^\]]*?\]')
-        self._comment_pat = re.compile(r'<!--(.*?)-->')
-        self._wikilink_pat = re.compile(
-            r'\[\[(?P<link>[^\]\|]*?)(?P<anchor>\|[^\]]*)?\]\]')
-
-        self.tzinfo = TZoneFixedOffset(self.site.siteinfo['timeoffset'],
-                                       self.site.siteinfo['timezone'])
+        # digits of month names may be written with non-ascii digits
+        if is_digit_month or any(char.isdigit()
+                                 for month in origNames2monthNum
+                                 for char in month):
+            month_scanner = ''
+        else:
+            month_scanner = '|(?P<month>{})'.format('|'.join(escaped_months))
+        scanner = re.compile(self._SCANNER.format(month=month_scanner))
+        return origNames2monthNum, is_digit_month, patterns, scanner
 
     def _last_match_and_replace(self,
                                 txt: str,
@@ -2370,9 +3298,14 @@ class TimeStripper:
 
         .. version-changed:: 7.6
            HTML parts are removed from line
+        .. version-changed:: 11.7
+           lines which cannot hold a time are skipped without parsing.
 
         :return: A timestamp found on the given line
         """
+        if not self._CANDIDATE.search(line):
+            return None
+
         # Try to maintain gaps that are used in _valid_date_dict_positions()
         def censor_match(match):
             return '_' * (match.end() - match.start())
@@ -2413,8 +3346,9 @@ class TimeStripper:
 
         # Remove parts that are not supposed to contain the timestamp, in order
         # to reduce false positives.
-        line = removeDisabledParts(line)
-        line = removeHTMLParts(line)
+        if '<' in line or '&' in line:
+            line = removeDisabledParts(line)
+            line = removeHTMLParts(line)
 
         line = to_ascii_digits(line)
         for pat in self.patterns:
@@ -2472,6 +3406,50 @@ class TimeStripper:
 
         return timestamp
 
+    def find_timestamps(
+        self,
+        text: str
+    ) -> list[tuple[int, pywikibot.Timestamp]]:
+        """Find the timestamps of all lines in a text.
+
+        The text is split into lines like :meth:`str.splitlines` does.
+        A single scan with a combined pattern of the site locates the
+        line breaks and the parts of a timestamp: time, year, month name
+        and parentheses of the time zone. Only lines which hold all of
+        these parts, or markup which may join or create them, are passed
+        to :meth:`timestripper`.
+
+        .. version-added:: 11.7
+
+        :param text: text to be scanned, e.g. a talk page
+        :return: offset of the line and its timestamp for every line
+            where a timestamp was found, in text order
+        """
+        parts = self._PARTS
+        required = parts['time'] | parts['year'] | parts['close']
+        if 'month' in self._scanner.groupindex:
+            required |= parts['month']
+
+        starts, ends, found = [0], [], [0]
+        for match in self._scanner.finditer(text):
+            group = match.lastgroup
+            if group == 'line_break':
+                ends.append(match.start())
+                starts.append(match.end())
+                found.append(0)
+            elif group != 'close' or found[-1] & parts['open']:
+                # a closing parenthesis counts behind an opening one only
+                found[-1] |= parts[group]
+        ends.append(len(text))
+
+        result = []
+        for start, end, mask in zip(starts, ends, found):
+            if mask & parts['markup'] or mask & required == required:
+                timestamp = self.timestripper(text[start:end])
+                if timestamp:
+                    result.append((start, timestamp))
+        return result
+
 
 wrapper = ModuleDeprecationWrapper(__name__)
 wrapper.add_deprecated_attr('to_latin_digits', to_ascii_digits, since='10.3.0')
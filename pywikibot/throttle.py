@@ -13,11 +13,21 @@ shared control file ``throttle.ctrl``.
 
 It supports both read and write throttling, automatic adjustment based
 on the number of concurrent bot instances, and optional lag-aware delays.
+
+With ``throttle_backend = 'sqlite'`` in your
+:ref:`user-config.py<Settings to Avoid Server Overload>`, the
+:class:`SharedThrottle` is used instead. It allocates a real shared
+request budget per site to all bot processes on the host by a
+:class:`TokenBucket` stored in a SQLite database file.
+
+.. version-changed:: 11.7
+   :class:`SharedThrottle` and :class:`TokenBucket` were added.
 """
 from __future__ import annotations
 
 import hashlib
 import itertools
+import sqlite3
 import threading
 import time
 from collections import Counter
@@ -73,6 +83,17 @@ class Throttle:
     # The number of seconds entries of a process need to be counted
     expiry: int = 600
 
+    #: Adaptive mode: requests per second added to the read rate after
+    #: each successful response
+    adaptive_increase: float = 0.05
+    #: Adaptive mode: factor of the read rate after a congestion signal
+    adaptive_decrease: float = 0.5
+    #: Adaptive mode: response times above this multiple of the usual
+    #: response time are taken as congestion signal
+    adaptive_latency_factor: float = 2.0
+    #: Adaptive mode: weight of the latest response time in its average
+    adaptive_smoothing: float = 0.2
+
     def __init__(self, site: pywikibot.site.BaseSite | str, *,
                  mindelay: int | None = None,
                  maxdelay: int | None = None,
@@ -97,6 +118,11 @@ class Throttle:
         self.checktime = 0.0
         self.modules: Counter[str] = Counter()
 
+        #: adapt the read delay to the server load, see :meth:`adapt`
+        self.adaptive: bool = config.throttle_adaptive
+        self.latency: float | None = None
+        self.base_latency: float | None = None
+
         self.checkMultiplicity()
         self.set_delays()
 
@@ -301,6 +327,53 @@ class Throttle:
 
         return current_delay * self.process_multiplicity
 
+    def adapt(self, latency: float | None = None, *,
+              congested: bool = False) -> None:
+        """Adjust the read delay to the server load in adaptive mode.
+
+        This is an additive increase, multiplicative decrease (AIMD)
+        controller. The read rate is increased by
+        :attr:`adaptive_increase` after a successful response and
+        multiplied by :attr:`adaptive_decrease` on congestion. Responses
+        slower than :attr:`adaptive_latency_factor` times the usual
+        response time are taken as congestion too. The delay is kept
+        between :attr:`mindelay` and :attr:`maxdelay`.
+
+        Nothing is done unless :attr:`adaptive` is True. The method is
+        called by :func:`comms.http.request` for every response and by
+        :meth:`lag`.
+
+        .. version-added:: 11.7
+
+        :param latency: response time of the last request in seconds
+        :param congested: the server reported maxlag, asked to retry
+            later or failed
+        """
+        if not self.adaptive:
+            return
+
+        with self.lock:
+            if latency is not None:
+                if self.latency is None:
+                    self.latency = self.base_latency = latency
+                else:
+                    self.latency += self.adaptive_smoothing * (
+                        latency - self.latency)
+                    # the usual response time follows a slower server
+                    self.base_latency = min(
+                        latency, self.base_latency + 0.01 * (
+                            self.latency - self.base_latency))
+                if self.latency > (self.base_latency
+                                   * self.adaptive_latency_factor):
+                    congested = True
+
+            rate = 1 / max(self.delay, 0.01)
+            if congested:
+                rate *= self.adaptive_decrease
+            else:
+                rate += self.adaptive_increase
+            self.delay = min(max(1 / rate, self.mindelay), self.maxdelay)
+
     def waittime(self, write: bool = False):
         """Return waiting time in seconds.
 
@@ -400,21 +473,199 @@ class Throttle:
         This method is used by `api.request`. It will prevent any thread
         from accessing this site.
 
+        .. version-changed:: 11.7
+           slow down the read rate in adaptive mode.
+
         :param lagtime: The time to wait for the next request which is
             the last `maxlag` time from api warning. This is only used
             as a fallback if `self.retry_after` isn't set.
         """
+        self.adapt(congested=True)
         started = time.time()
         with self.lock:
-            waittime = lagtime or config.retry_wait
-            if self.retry_after:
-                waittime = max(self.retry_after, waittime / 5)
-            # wait not more than retry_max seconds
-            delay = min(waittime, config.retry_max)
+            delay = self.lag_delay(lagtime)
             # account for any time we waited while acquiring the lock
             wait = delay - (time.time() - started)
             self.wait(wait)
 
+    def lag_delay(self, lagtime: float | None = None) -> float:
+        """Return the time to wait due to server lag.
+
+        .. version-added:: 11.7
+
+        :param lagtime: the last `maxlag` time from api warning
+        """
+        waittime = lagtime or config.retry_wait
+        if self.retry_after:
+            waittime = max(self.retry_after, waittime / 5)
+        # wait not more than retry_max seconds
+        return min(waittime, config.retry_max)
+
     def get_pid(self, module: str) -> int:
         """Get the global pid if the module is running multiple times."""
         return pid if self.modules[self._module_hash(module)] > 1 else 0
+
+
+class TokenBucket:
+
+    """Request budgets shared by processes via a SQLite database file.
+
+    Every bucket is identified by a key and holds the time when its next
+    token becomes available. A token is reserved by moving this time
+    forward by the interval of the bucket within a single write
+    transaction; concurrent processes are serialized by the database
+    lock and never get the same token. The result is a token bucket
+    with the given burst capacity whose rate is the reciprocal of the
+    interval.
+
+    .. version-added:: 11.7
+
+    :param path: the database file name
+    :param timeout: seconds to wait for the database lock
+    """
+
+    def __init__(self, path: str, timeout: float = 30) -> None:
+        """Initializer."""
+        self.path = path
+        self.timeout = timeout
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS bucket ('
+                         'key TEXT PRIMARY KEY, next REAL NOT NULL)')
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return a new database connection.
+
+        A connection is used for a single transaction only; this is
+        safe for threads and forked processes.
+        """
+        conn = sqlite3.connect(self.path, timeout=self.timeout,
+                               isolation_level=None)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _update(self, key: str, func) -> float:
+        """Update the next token time of a bucket atomically.
+
+        :param func: callable with the current time and the stored next
+            token time as parameters, returning the new next token time
+            and the result of this method.
+        """
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT next FROM bucket WHERE key = ?',
+                               (key, )).fetchone()
+            now = time.time()
+            nxt, result = func(now, row[0] if row else 0.0)
+            conn.execute('INSERT OR REPLACE INTO bucket (key, next) '
+                         'VALUES (?, ?)', (key, nxt))
+            conn.execute('COMMIT')
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return result
+
+    def reserve(self, key: str, interval: float,
+                capacity: int = 1) -> float:
+        """Reserve a token and return the seconds to wait for it.
+
+        :param key: the bucket identifier
+        :param interval: the seconds between two tokens
+        :param capacity: number of tokens which may be used at once
+            after the bucket was idle
+        """
+        def take(now: float, nxt: float) -> tuple[float, float]:
+            nxt = max(nxt, now - (capacity - 1) * interval)
+            return nxt + interval, max(0.0, nxt - now)
+
+        return self._update(key, take)
+
+    def block(self, key: str, seconds: float) -> None:
+        """Make no tokens available for the given seconds.
+
+        :param key: the bucket identifier
+        """
+        def hold(now: float, nxt: float) -> tuple[float, None]:
+            return max(nxt, now + seconds), None
+
+        self._update(key, hold)
+
+    def clear(self) -> None:
+        """Remove all buckets."""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM bucket')
+
+
+class SharedThrottle(Throttle):
+
+    """Throttle which shares the request rate with other processes.
+
+    All bot processes on the host share one read and one write
+    :class:`TokenBucket` per site. Their intervals are given by the
+    read and write delays of :class:`Throttle` but are not multiplied by
+    the number of processes; together the processes do not exceed the
+    configured rate and a single process may use the full rate if it
+    runs alone. Lag and *Retry-After* responses block the buckets and
+    pause all processes for the site.
+
+    Select it with ``throttle_backend = 'sqlite'`` in your
+    :ref:`user-config.py<Settings to Avoid Server Overload>`.
+
+    .. version-added:: 11.7
+    """
+
+    #: the database file name inside the base directory
+    bucket_filename = 'throttle.sqlite3'
+
+    def __init__(self, site: pywikibot.site.BaseSite | str,
+                 **kwargs) -> None:
+        """Initializer."""
+        self.bucket = TokenBucket(config.datafilepath(self.bucket_filename))
+        super().__init__(site, **kwargs)
+
+    def checkMultiplicity(self) -> None:
+        """Register the process; the delays are not multiplied."""
+        super().checkMultiplicity()
+        self.process_multiplicity = 1
+
+    def _key(self, write: bool) -> str:
+        """Return the bucket key for read or write access."""
+        return f"{self.mysite}|{'write' if write else 'read'}"
+
+    @deprecated_args(requestsize=None)  # since: 10.3.0
+    @deprecated_signature(since='10.3.0')
+    def __call__(self, *, requestsize: int = 1, write: bool = False) -> None:
+        """Reserve a token of the shared bucket and wait for it.
+
+        :param requestsize: Deprecated, no longer affects throttling.
+        :param write: Whether the operation involves writing to the site.
+        """
+        lock = self.lock_write if write else self.lock_read
+        with lock:
+            wait = self.bucket.reserve(self._key(write),
+                                       self.get_delay(write=write))
+            self.wait(wait)
+
+            now = time.time()
+            if write:
+                self.last_write = now
+            else:
+                self.last_read = now
+
+    def lag(self, lagtime: float | None = None) -> None:
+        """Pause all processes of this site due to server lag."""
+        delay = self.lag_delay(lagtime)
+        for write in (False, True):
+            self.bucket.block(self._key(write), delay)
+        super().lag(lagtime)
+
+
+#: Throttle classes selectable by ``throttle_backend`` config variable.
+THROTTLE_BACKENDS: dict[str, type[Throttle]] = {
+    'file': Throttle,
+    'sqlite': SharedThrottle,
+}
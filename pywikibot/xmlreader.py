@@ -14,47 +14,186 @@ XmlEntry objects which can be used by other bots.
 .. version-changed:: 7.7
    *defusedxml* is used in favour of *xml.etree* if present to prevent
    vulnerable XML attacks. *defusedxml* 0.7.1 or higher is recommended.
+.. version-changed:: 11.7
+   multistream bz2 dumps can be parsed by several processes;
+   :meth:`XmlDump.map_entries` runs a callable in these processes.
 """
 from __future__ import annotations
 
+import bz2
+import html
+import os
 import re
-from dataclasses import dataclass
-from typing import NamedTuple
+from collections import deque
+from concurrent import futures
+from typing import Any, NamedTuple, TypeVar
 from xml.etree.ElementTree import Element
 
 
 try:
-    from defusedxml.ElementTree import ParseError, iterparse
+    from defusedxml.ElementTree import ParseError, fromstring, iterparse
 except ImportError:
-    from xml.etree.ElementTree import iterparse, ParseError
+    from xml.etree.ElementTree import fromstring, iterparse, ParseError
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 
 from pywikibot.tools import (
     ModuleDeprecationWrapper,
     issue_deprecation_warning,
     open_archive,
 )
+from pywikibot.tools.threading import BoundedPoolExecutor
+
+
+#: Pattern of a bz2 stream header: magic, block size and block magic
+BZ2_STREAM_HEADER = re.compile(rb'BZh[1-9]1AY&SY')
+
+#: Pattern of a page start with its title and page id
+PAGE_HEADER = re.compile(
+    rb'<page>\s*<title>(?P<title>[^<]*)</title>.*?<id>(?P<pageid>\d+)</id>',
+    re.DOTALL)
+
+#: Suffix of the page index file written by :meth:`XmlDump.build_index`
+INDEX_SUFFIX = '.index.bz2'
+
+
+_UNSET = object()
+_T = TypeVar('_T')
+
+
+def _lazy_field(name: str, decode: Callable[[XmlEntry], object]) -> property:
+    """Return a property which decodes its value on first access."""
+    slot = '_' + name
+
+    def getter(self):
+        value = getattr(self, slot)
+        if value is _UNSET:
+            value = decode(self)
+            setattr(self, slot, value)
+        return value
+
+    def setter(self, value) -> None:
+        setattr(self, slot, value)
+
+    return property(getter, setter, doc=f'The {name} of the revision.')
+
+
+def _contributor_ip(entry: XmlEntry) -> str | None:
+    """Return the ip of an anonymous contributor."""
+    contributor = entry._revision.find(f'{entry._uri}contributor')
+    return contributor.findtext(f'{entry._uri}ip')
+
+
+def _contributor_name(entry: XmlEntry) -> str:
+    """Return the ip or user name of the contributor."""
+    contributor = entry._revision.find(f'{entry._uri}contributor')
+    username = (contributor.findtext(f'{entry._uri}ip')
+                or contributor.findtext(f'{entry._uri}username'))
+    return username or ''  # username might be deleted
+
+
+def _revision_text(tag: str) -> Callable[[XmlEntry], str | None]:
+    """Return a decoder for the text of a revision subelement."""
+    return lambda entry: entry._revision.findtext(f'{entry._uri}{tag}')
 
 
-@dataclass
 class XmlEntry:
 
-    """Represent a page."""
+    """Represent a page revision.
+
+    The revision fields :attr:`text`, :attr:`username`, :attr:`ipedit`,
+    :attr:`timestamp`, :attr:`revisionid` and :attr:`comment` of entries
+    created by :class:`XmlDump` are decoded from the revision element on
+    first access. Consumers which reject a page by its title or
+    namespace never pay for decoding them.
+
+    .. version-changed:: 11.7
+       ``XmlEntry`` is a ``__slots__`` class instead of a dataclass
+       and revision fields are decoded lazily. Use :meth:`asdict`
+       instead of ``__dict__``.
+    """
+
+    #: names of all fields in initializer order
+    fields = ('title', 'ns', 'id', 'text', 'username', 'ipedit',
+              'timestamp', 'editRestriction', 'moveRestriction',
+              'revisionid', 'comment', 'isredirect')
+
+    __slots__ = ('title', 'ns', 'id', 'editRestriction', 'moveRestriction',
+                 'isredirect', '_text', '_username', '_ipedit', '_timestamp',
+                 '_revisionid', '_comment', '_revision', '_uri')
 
     # TODO: there are more tags we can read.
-    title: str
-    ns: str
-    id: str
-    text: str
-    username: str
-    ipedit: bool
-    timestamp: str
-    editRestriction: str  # noqa: N815
-    moveRestriction: str  # noqa: N815
-    revisionid: str
-    comment: str
-    isredirect: bool
+    text = _lazy_field('text', _revision_text('text'))
+    username = _lazy_field('username', _contributor_name)
+    ipedit = _lazy_field('ipedit', lambda entry: bool(_contributor_ip(entry)))
+    timestamp = _lazy_field('timestamp', _revision_text('timestamp'))
+    revisionid = _lazy_field('revisionid', _revision_text('id'))
+    comment = _lazy_field('comment', _revision_text('comment'))
+
+    def __init__(self, title: str, ns: str, id: str, text: str,
+                 username: str, ipedit: bool, timestamp: str,
+                 editRestriction: str,  # noqa: N803
+                 moveRestriction: str,  # noqa: N803
+                 revisionid: str, comment: str, isredirect: bool) -> None:
+        """Initializer."""
+        self.title = title
+        self.ns = ns
+        self.id = id
+        self.editRestriction = editRestriction
+        self.moveRestriction = moveRestriction
+        self.isredirect = isredirect
+        self._text = text
+        self._username = username
+        self._ipedit = ipedit
+        self._timestamp = timestamp
+        self._revisionid = revisionid
+        self._comment = comment
+        self._revision = None
+        self._uri = ''
+
+    @classmethod
+    def from_revision(cls, headers: Headers, revision: Element,
+                      uri: str = '') -> XmlEntry:
+        """Create an entry whose revision fields are decoded lazily.
+
+        .. version-added:: 11.7
+
+        :param headers: the page headers
+        :param revision: the revision element
+        :param uri: the namespace uri of the dump in braces
+        """
+        entry = cls(headers.title, headers.ns, headers.pageid, _UNSET,
+                    _UNSET, _UNSET, _UNSET, headers.edit_restriction,
+                    headers.move_restriction, _UNSET, _UNSET,
+                    headers.isredirect)
+        entry._revision = revision
+        entry._uri = uri
+        return entry
+
+    def asdict(self) -> dict[str, object]:
+        """Return the fields as dict; all lazy fields are decoded.
+
+        .. version-added:: 11.7
+        """
+        return {name: getattr(self, name) for name in self.fields}
+
+    def __eq__(self, other: object) -> bool:
+        """Compare all fields with another entry."""
+        if not isinstance(other, XmlEntry):
+            return NotImplemented
+        return self.asdict() == other.asdict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the representation of the entry."""
+        fields = ', '.join(f'{name}={getattr(self, name)!r}'
+                           for name in self.fields)
+        return f'{type(self).__name__}({fields})'
+
+    def __reduce__(self):
+        """Pickle the decoded fields but not the revision element."""
+        return type(self), tuple(getattr(self, name) for name in self.fields)
 
 
 class Headers(NamedTuple):
@@ -84,6 +223,19 @@ class RawRev(NamedTuple):
     revid: int
 
 
+class IndexEntry(NamedTuple):
+
+    """Location of a page within a dump.
+
+    .. version-added:: 11.7
+    """
+
+    stream: int | None
+    offset: int | None
+    pageid: int
+    title: str
+
+
 class XmlDump:
 
     """Represents an XML dump file.
@@ -115,12 +267,20 @@ class XmlDump:
     Pear 188924
     >>>
 
+    .. version-changed:: 11.7
+       the *index* parameter was added.
+
     :param allrevisions: boolean
         If True, parse all revisions instead of only the latest one.
         Default: False.
     :param on_error: a callable which is invoked within :meth:`parse`
         method when a ParseError occurs. The exception is passed to this
         callable. Otherwise the exception is raised.
+    :param index: the index file of a multistream bz2 dump which
+        holds the stream offsets. If None, an index file named like the
+        dump ``*-multistream-index.txt.bz2`` is used if present;
+        otherwise the offsets are found by scanning the dump for bz2
+        stream headers. Only used for parallel parsing.
     :param revisions: which of four methods to use to parse the dump:
         * `first_found` (whichever revision is the first element)
         * `latest` (most recent revision, by largest `revisionid`)
@@ -137,10 +297,12 @@ class XmlDump:
         # when allrevisions removed, revisions can default to 'latest'
         revisions: str = 'first_found',
         on_error: Callable[[ParseError], None] | None = None,
+        index: str | None = None,
     ) -> None:
         """Initializer."""
         self.filename = filename
         self.on_error = on_error
+        self.index = index
 
         self.rev_actions = {
             'first_found': self._parse_only_first_found,
@@ -167,19 +329,90 @@ class XmlDump:
             actions = str(list(self.rev_actions.keys())).strip('[]')
             raise ValueError(f"'revisions' must be one of {actions}.")
 
+        self.revisions = revisions
         self._parse = self.rev_actions[revisions]
         self.uri = None
+        self._lookup_index = None
+
+    def __getstate__(self) -> dict:
+        """Return the picklable state for worker processes.
+
+        .. version-added:: 11.7
+        """
+        state = self.__dict__.copy()
+        for attr in ('rev_actions', '_parse', 'on_error'):
+            del state[attr]
+        state['_lookup_index'] = None
+        return state
 
-    def parse(self) -> Iterator[XmlEntry]:
+    def __setstate__(self, state: dict) -> None:
+        """Restore the state in a worker process.
+
+        .. version-added:: 11.7
+        """
+        self.__dict__.update(state)
+        self.on_error = None
+        self.rev_actions = {
+            'first_found': self._parse_only_first_found,
+            'latest': self._parse_only_latest,
+            'earliest': self._parse_only_earliest,
+            'all': self._parse_all,
+        }
+        self._parse = self.rev_actions[self.revisions]
+
+    def parse(self, *,
+              processes: int | None = None,
+              ordered: bool = True,
+              headers_only: bool = False,
+              namespaces: Iterable[int] | None = None,
+              title_filter: Callable[[str], bool] | None = None,
+              ) -> Iterator[XmlEntry | Headers]:
         """Generator using ElementTree iterparse function.
 
+        If *processes* is greater than 1 and the dump is a multistream
+        bz2 file, the streams are decompressed and parsed by a pool of
+        worker processes. Other dumps are parsed by a single stream in
+        the current process.
+
+        Pages can be filtered by *namespaces* and *title_filter*. They
+        are checked as soon as the page title and namespace are read;
+        the revisions of rejected pages are dropped while parsing and no
+        entries are created for them.
+
         .. version-changed:: 7.2
            if a ParseError occurs it can be handled by the callable
            given with `on_error` parameter of this instance.
+        .. version-changed:: 11.7
+           *processes*, *ordered*, *headers_only*, *namespaces* and
+           *title_filter* parameters were added.
+
+        :param processes: number of worker processes. If None (default)
+            or 1, the dump is parsed in the current process.
+        :param ordered: If True (default), entries are yielded in dump
+            order when parsing in parallel. Otherwise entries of every
+            stream are yielded as soon as the stream is parsed.
+        :param headers_only: If True, yield a :class:`Headers` tuple for
+            every page instead of its revision entries.
+        :param namespaces: only yield pages of these namespace numbers.
+            Pages without a namespace element are not filtered.
+        :param title_filter: a callable with the page title as parameter
+            and boolean as result to indicate whether the page should be
+            yielded or not.
         """
+        accept = self._page_filter(namespaces, title_filter)
+        if processes is not None and processes > 1:
+            offsets = self.stream_offsets()
+            if len(offsets) > 1:
+                for entry in self._parse_parallel(offsets, processes, ordered,
+                                                  headers_only):
+                    if accept is None or accept(entry.title, entry.ns):
+                        yield entry
+                return
+
         with open_archive(self.filename) as source:
             context = iterparse(source, events=('start', 'end', 'start-ns'))
             root = None
+            title = ns = skip = None
 
             while True:
                 try:
@@ -200,15 +433,507 @@ class XmlDump:
                 if event == 'start' and root is None:
                     root = elem
 
-                if not (event == 'end' and elem.tag == f'{self.uri}page'):
+                if event != 'end':
+                    continue
+
+                tag = elem.tag
+                if accept is not None:
+                    if tag == f'{self.uri}title':
+                        title, ns, skip = elem.text or '', None, None
+                    elif tag == f'{self.uri}ns':
+                        ns = elem.text
+                        skip = not accept(title, ns)
+                    elif skip and tag == f'{self.uri}revision':
+                        # drop the revisions of a rejected page early
+                        elem.clear()
+
+                if tag != f'{self.uri}page':
                     continue
 
-                yield from self._parse(elem)
+                if accept is not None and skip is None:
+                    skip = not accept(title, ns)
+
+                if not skip:
+                    yield from self._page_entries(elem, headers_only)
 
                 # clear references in the root, to allow garbage collection.
                 elem.clear()
                 root.clear()
 
+    def map_entries(self, func: Callable[[XmlEntry], _T | None], *,
+                    processes: int | None = None,
+                    ordered: bool = True) -> Iterator[_T]:
+        """Call *func* for every entry and yield its results.
+
+        If *processes* is greater than 1 and the dump is a multistream
+        bz2 file, *func* is called by the worker processes which parse
+        the streams. Only its results are sent back to the current
+        process, not the entries. *func* must be picklable then, e.g.
+        a module level function or a bound method of a picklable
+        object; it is sent once to each worker process. Results which
+        are None are dropped.
+
+        .. code-block:: python
+
+           def redirect_title(entry):
+               return entry.title if entry.isredirect else None
+
+           dump = xmlreader.XmlDump(filename, revisions='latest')
+           for title in dump.map_entries(redirect_title, processes=4):
+               print(title)
+
+        .. version-added:: 11.7
+
+        :param func: a callable with the :class:`XmlEntry` as parameter
+        :param processes: number of worker processes. If None (default)
+            or 1, *func* is called in the current process.
+        :param ordered: If True (default), results are yielded in dump
+            order when parsing in parallel.
+        """
+        if processes is not None and processes > 1:
+            offsets = self.stream_offsets()
+            if len(offsets) > 1:
+                yield from self._parse_parallel(offsets, processes, ordered,
+                                                False, func)
+                return
+
+        for entry in self.parse():
+            result = func(entry)
+            if result is not None:
+                yield result
+
+    @staticmethod
+    def _page_filter(
+        namespaces: Iterable[int] | None,
+        title_filter: Callable[[str], bool] | None,
+    ) -> Callable[[str, str | None], bool] | None:
+        """Return a callable to check page title and namespace.
+
+        .. version-added:: 11.7
+        """
+        if namespaces is None and title_filter is None:
+            return None
+
+        nss = None if namespaces is None else {int(ns) for ns in namespaces}
+
+        def accept(title: str, ns: str | None) -> bool:
+            if nss is not None and ns is not None and int(ns) not in nss:
+                return False
+            return title_filter is None or title_filter(title)
+
+        return accept
+
+    def _page_entries(self, elem: Element,
+                      headers_only: bool) -> Iterable[XmlEntry | Headers]:
+        """Return the entries of a page element.
+
+        .. version-added:: 11.7
+        """
+        if headers_only:
+            return [self._headers(elem)]
+        return self._parse(elem)
+
+    def stream_offsets(self) -> list[int]:
+        """Return the offsets of the bz2 streams of a multistream dump.
+
+        The offsets are read from the multistream index file if present.
+        Otherwise the dump is scanned for bz2 stream headers. An empty
+        list is returned if the dump is not a bz2 file.
+
+        .. version-added:: 11.7
+        """
+        filename = str(self.filename)
+        if not filename.endswith('.bz2'):
+            return []
+
+        index = self._multistream_index()
+        if index is not None:
+            offsets = {0}
+            with open_archive(index) as f:
+                for line in f:
+                    offset, _, _ = line.partition(b':')
+                    offsets.add(int(offset))
+            return sorted(offsets)
+
+        offsets = []
+        chunksize = 1 << 24
+        overlap = 9
+        with open(filename, 'rb') as f:
+            pos = 0
+            data = f.read(chunksize)
+            while data:
+                for match in BZ2_STREAM_HEADER.finditer(data):
+                    offsets.append(pos + match.start())
+                tail = data[-overlap:]
+                pos += len(data) - len(tail)
+                chunk = f.read(chunksize)
+                data = tail + chunk if chunk else b''
+        return offsets
+
+    def _multistream_index(self) -> str | None:
+        """Return the multistream index file name if there is one.
+
+        .. version-added:: 11.7
+        """
+        if self.index is not None:
+            return self.index
+
+        filename = str(self.filename)
+        if filename.endswith('-multistream.xml.bz2'):
+            index = filename[:-len('.xml.bz2')] + '-index.txt.bz2'
+            if os.path.exists(index):
+                return index
+        return None
+
+    def _read_stream(self, offset: int, length: int | None = None) -> bytes:
+        """Read and decompress a single bz2 stream of the dump.
+
+        .. version-added:: 11.7
+
+        :param offset: the offset of the stream
+        :param length: the length of the compressed stream. If None,
+            the stream is read until its end is found.
+        """
+        decompressor = bz2.BZ2Decompressor()
+        chunks = []
+        with open(self.filename, 'rb') as f:
+            f.seek(offset)
+            while not decompressor.eof and (
+                    chunk := f.read(length or 1 << 20)):
+                chunks.append(decompressor.decompress(chunk))
+        return b''.join(chunks)
+
+    def _parse_stream(self, offset: int, length: int | None,
+                      headers_only: bool = False) -> list[XmlEntry | Headers]:
+        """Parse all pages of a single bz2 stream.
+
+        The pages of a stream are not enclosed by a root element. They
+        are wrapped into a ``mediawiki`` element with the namespace of
+        the dump to parse them like a regular dump.
+
+        .. version-added:: 11.7
+        """
+        return self._parse_pages(self._read_stream(offset, length),
+                                 headers_only)
+
+    def _map_stream(self, func: Callable[[XmlEntry], _T | None],
+                    offset: int, length: int | None) -> list[_T]:
+        """Call *func* for all entries of a single bz2 stream.
+
+        .. version-added:: 11.7
+        """
+        return [result for entry in self._parse_stream(offset, length)
+                if (result := func(entry)) is not None]
+
+    def _parse_pages(self, data: bytes,
+                     headers_only: bool = False) -> list[XmlEntry | Headers]:
+        """Parse all complete ``page`` elements of a dump fragment.
+
+        .. version-added:: 11.7
+        """
+        start = data.find(b'<page>')
+        end = data.rfind(b'</page>')
+        if start < 0 or end < 0:
+            return []
+
+        xmlns = self.uri[1:-1] if self.uri else ''
+        root = fromstring(b'<mediawiki xmlns="' + xmlns.encode() + b'">'
+                          + data[start:end + len(b'</page>')]
+                          + b'</mediawiki>')
+        entries = []
+        for elem in root.iterfind(f'{self.uri or ""}page'):
+            entries.extend(self._page_entries(elem, headers_only))
+        return entries
+
+    def _read_header(self) -> bytes:
+        """Return the beginning of the uncompressed dump.
+
+        .. version-added:: 11.7
+        """
+        with open_archive(str(self.filename)) as f:
+            return f.read(1 << 16)
+
+    def _detect_uri(self) -> None:
+        """Set the namespace :attr:`uri` from the dump header.
+
+        .. version-added:: 11.7
+        """
+        header = self._read_header()
+        match = re.search(rb'<mediawiki[^>]*\sxmlns="([^"]*)"', header)
+        self.uri = f'{{{match[1].decode()}}}' if match else ''
+
+    def _parse_parallel(self, offsets: list[int], processes: int,
+                        ordered: bool,
+                        headers_only: bool,
+                        func: Callable[[XmlEntry], Any] | None = None
+                        ) -> Iterator[Any]:
+        """Parse the streams of a multistream dump by worker processes.
+
+        .. version-added:: 11.7
+
+        :param func: If given, yield the results of this callable for
+            the entries instead of the entries; see :meth:`map_entries`.
+        """
+        self._detect_uri()
+
+        streams = [(offset, end - offset)
+                   for offset, end in zip(offsets, offsets[1:])]
+        streams.append((offsets[-1], None))
+
+        pending: deque[futures.Future] = deque()
+        max_pending = 2 * processes
+        # the dump and func are sent once to each worker; the tasks
+        # only hold the stream positions
+        with BoundedPoolExecutor('ProcessPoolExecutor', max_bound=max_pending,
+                                 max_workers=processes,
+                                 initializer=_init_worker,
+                                 initargs=(self, func)) as executor:
+            try:
+                for stream in streams:
+                    if len(pending) >= max_pending:
+                        yield from self._stream_result(pending, ordered)
+                    pending.append(executor.submit(
+                        _worker_stream, *stream, headers_only))
+
+                while pending:
+                    yield from self._stream_result(pending, ordered)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _stream_result(self, pending: deque[futures.Future],
+                       ordered: bool) -> list[Any]:
+        """Remove a parsed stream from pending futures and return entries.
+
+        .. version-added:: 11.7
+        """
+        if ordered:
+            future = pending.popleft()
+        else:
+            future = next(futures.as_completed(pending))
+            pending.remove(future)
+
+        try:
+            return future.result()
+        except ParseError as e:
+            if self.on_error:
+                self.on_error(e)
+                return []
+            raise
+
+    @property
+    def index_filename(self) -> str:
+        """The file name of the page index written by :meth:`build_index`.
+
+        .. version-added:: 11.7
+        """
+        return str(self.filename) + INDEX_SUFFIX
+
+    @staticmethod
+    def _scan_pages(data: bytes,
+                    base: int = 0) -> Iterator[tuple[int, int, str]]:
+        """Yield offset, page id and title of pages in a dump fragment.
+
+        .. version-added:: 11.7
+        """
+        for match in PAGE_HEADER.finditer(data):
+            yield (base + match.start(), int(match['pageid']),
+                   html.unescape(match['title'].decode()))
+
+    def build_index(self, filename: str | None = None) -> str:
+        """Write a page index of the dump for :meth:`lookup`.
+
+        The index holds the offset of every page and is written as a
+        bz2 compressed text file with one ``stream:offset:pageid:title``
+        line per page. *stream* is the offset of the bz2 stream of a
+        multistream dump which holds the page and *offset* is the
+        position of the page inside the uncompressed stream. For other
+        dumps *stream* is empty and *offset* is the position inside the
+        uncompressed dump.
+
+        .. version-added:: 11.7
+
+        :param filename: the index file name. Default is
+            :attr:`index_filename`.
+        :return: the index file name
+        :raises ValueError: the dump is not UTF-8 encoded
+        """
+        # UTF-16 and UTF-32 encode '<' with null bytes
+        if b'\x00' in self._read_header()[:4]:
+            raise ValueError(f'Only UTF-8 dumps can be indexed: '
+                             f'{self.filename}')
+
+        if filename is None:
+            filename = self.index_filename
+
+        with open_archive(filename, 'wb') as index:
+            for stream, offset, pageid, title in self._index_pages():
+                stream = '' if stream is None else stream
+                index.write(f'{stream}:{offset}:{pageid}:{title}\n'.encode())
+        return filename
+
+    def _index_pages(self) -> Iterator[IndexEntry]:
+        """Scan the dump for pages and yield their index entries.
+
+        .. version-added:: 11.7
+        """
+        offsets = self.stream_offsets()
+        if len(offsets) > 1:
+            for stream, end in zip(offsets, offsets[1:] + [None]):
+                data = self._read_stream(stream,
+                                         end and end - stream)
+                for offset, pageid, title in self._scan_pages(data):
+                    yield IndexEntry(stream, offset, pageid, title)
+            return
+
+        chunksize = 1 << 24
+        with open_archive(str(self.filename)) as f:
+            pos = 0
+            data = b''
+            while chunk := f.read(chunksize):
+                data += chunk
+                # the last page might be incomplete
+                end = data.rfind(b'<page>')
+                if end <= 0:
+                    continue
+                for offset, pageid, title in self._scan_pages(data[:end],
+                                                              pos):
+                    yield IndexEntry(None, offset, pageid, title)
+                pos += end
+                data = data[end:]
+
+            for offset, pageid, title in self._scan_pages(data, pos):
+                yield IndexEntry(None, offset, pageid, title)
+
+    def _load_index(self) -> tuple[dict[str, IndexEntry],
+                                   dict[int, IndexEntry]]:
+        """Load the page index by title and by page id.
+
+        The index written by :meth:`build_index` is used if present.
+        Otherwise the multistream index is used if there is one.
+        If neither is found, the index is built first.
+
+        .. version-added:: 11.7
+        """
+        if self._lookup_index is not None:
+            return self._lookup_index
+
+        titles: dict[str, IndexEntry] = {}
+        pageids: dict[int, IndexEntry] = {}
+        if os.path.exists(self.index_filename):
+            filename, fields = self.index_filename, 4
+        elif (filename := self._multistream_index()) is not None:
+            fields = 3
+        else:
+            filename, fields = self.build_index(), 4
+
+        with open_archive(filename) as f:
+            for line in f:
+                items = line.decode().rstrip('\n').split(':', fields - 1)
+                if fields == 3:
+                    entry = IndexEntry(int(items[0]), None, int(items[1]),
+                                       items[2])
+                else:
+                    entry = IndexEntry(int(items[0]) if items[0] else None,
+                                       int(items[1]), int(items[2]),
+                                       items[3])
+                titles[entry.title] = entry
+                pageids[entry.pageid] = entry
+
+        self._lookup_index = titles, pageids
+        return self._lookup_index
+
+    def lookup(self, key: str | int) -> XmlEntry | None:
+        """Return the dump entry of a single page.
+
+        Only the page itself is read from the dump using a page index;
+        see :meth:`build_index`. The index is loaded on first call.
+
+        .. version-added:: 11.7
+
+        :param key: page title or page id
+        :return: the entry of the page as given by the *revisions*
+            parameter or None if the page is not found. If all
+            revisions are parsed, the first revision is returned.
+        """
+        return next(self.lookup_pages([key]), None)
+
+    def lookup_pages(self,
+                     keys: Iterable[str | int]) -> Iterator[XmlEntry]:
+        """Yield dump entries of the given pages using the page index.
+
+        Pages are yielded in dump order to read every bz2 stream or the
+        dump only once. Pages which are not found are skipped.
+
+        .. version-added:: 11.7
+
+        :param keys: page titles or page ids
+        """
+        titles, pageids = self._load_index()
+        entries = set()
+        for key in keys:
+            entry = pageids.get(key) if isinstance(key, int) \
+                else titles.get(key)
+            if entry is not None:
+                entries.add(entry)
+
+        if not entries:
+            return
+
+        if self.uri is None:
+            self._detect_uri()
+
+        entries = sorted(entries, key=lambda e: (e.stream or 0,
+                                                 e.offset or 0))
+        if entries[0].stream is None:
+            yield from self._lookup_single_stream(entries)
+            return
+
+        stream, data = None, b''
+        for entry in entries:
+            if entry.stream != stream:
+                stream = entry.stream
+                data = self._read_stream(stream)
+            offset = entry.offset
+            if offset is None:
+                offset = next((offset for offset, pageid, _
+                               in self._scan_pages(data)
+                               if pageid == entry.pageid), None)
+                if offset is None:
+                    continue
+            end = data.find(b'</page>', offset)
+            yield from self._parse_pages(data[offset:end + len(b'</page>')])
+
+    def _lookup_single_stream(
+        self,
+        entries: list[IndexEntry]
+    ) -> Iterator[XmlEntry]:
+        """Read pages by their offsets from a plain or single stream dump.
+
+        .. version-added:: 11.7
+        """
+        chunksize = 1 << 16
+        with open_archive(str(self.filename)) as f:
+            pos = 0
+            for entry in entries:
+                if f.seekable():
+                    f.seek(entry.offset)
+                else:
+                    while pos < entry.offset and (
+                            chunk := f.read(min(chunksize,
+                                                entry.offset - pos))):
+                        pos += len(chunk)
+
+                data = b''
+                while (end := data.find(b'</page>')) < 0:
+                    chunk = f.read(chunksize)
+                    if not chunk:
+                        break
+                    data += chunk
+                pos = entry.offset + len(data)
+                if end >= 0:
+                    yield from self._parse_pages(data[:end + len(b'</page>')])
+
     def _parse_only_first_found(self, elem: Element) -> Iterator[XmlEntry]:
         """Parser that yields the first revision found.
 
@@ -303,28 +1028,40 @@ class XmlDump:
     def _create_revision(
             self, headers: Headers, revision: Element
     ) -> XmlEntry:
-        """Create a Single revision."""
-        uri = self.uri
-        contributor = revision.find(f'{uri}contributor')
-        ip_editor = contributor.findtext(f'{uri}ip')
-        username = ip_editor or contributor.findtext(f'{uri}username')
-        username = username or ''  # username might be deleted
-
-        return XmlEntry(
-            title=headers.title,
-            ns=headers.ns,
-            id=headers.pageid,
-            editRestriction=headers.edit_restriction,
-            moveRestriction=headers.move_restriction,
-            isredirect=headers.isredirect,
-            text=revision.findtext(f'{uri}text'),
-            username=username,
-            ipedit=bool(ip_editor),
-            timestamp=revision.findtext(f'{uri}timestamp'),
-            revisionid=revision.findtext(f'{uri}id'),
-            comment=revision.findtext(f'{uri}comment'),
-            # could get comment, minor as well
-        )
+        """Create a Single revision.
+
+        .. version-changed:: 11.7
+           the revision fields are decoded lazily.
+        """
+        return XmlEntry.from_revision(headers, revision, self.uri)
+
+
+#: The dump and the function to be called by a worker process of
+#: :meth:`XmlDump._parse_parallel`
+_worker: tuple[XmlDump, Callable[[XmlEntry], Any] | None] | None = None
+
+
+def _init_worker(dump: XmlDump,
+                 func: Callable[[XmlEntry], Any] | None) -> None:
+    """Keep the dump and the function in a worker process.
+
+    .. version-added:: 11.7
+    """
+    global _worker
+    _worker = dump, func
+
+
+def _worker_stream(offset: int, length: int | None,
+                   headers_only: bool) -> list[Any]:
+    """Parse a stream in a worker process or call the function.
+
+    .. version-added:: 11.7
+    """
+    assert _worker is not None
+    dump, func = _worker
+    if func is None:
+        return dump._parse_stream(offset, length, headers_only)
+    return dump._map_stream(func, offset, length)
 
 
 wrapper = ModuleDeprecationWrapper(__name__)
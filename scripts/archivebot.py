@@ -204,6 +204,7 @@ import time
 from collections import OrderedDict, defaultdict
 from contextlib import nullcontext
 from hashlib import md5
+from itertools import dropwhile
 from math import ceil
 from textwrap import fill
 from typing import Any
@@ -350,14 +351,31 @@ class DiscussionThread:
     def __repr__(self) -> str:
         """Return a string representation."""
         return '{}("{}",{} bytes)'.format(self.__class__.__name__, self.title,
-                                          len(self.content.encode('utf-8')))
+                                          self._content_size)
+
+    @property
+    def content(self) -> str:
+        """The content of the thread without its title.
+
+        .. version-added:: 11.7
+           Assigning the content resets its byte size which is updated
+           by :meth:`feed_line` and :meth:`feed_lines` afterwards.
+        """
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._content_size = len(value.encode('utf-8'))
 
     def feed_line(self, line: str) -> None:
         """Add a line to the content and find the newest timestamp."""
         if not self.content and not line:
             return
 
-        self.content += line + '\n'
+        self._content += line + '\n'
+        self._content_size += len(line.encode('utf-8')) + 1
+
         timestamp = self.ts.timestripper(line)
 
         if not self.timestamp:  # first time
@@ -366,6 +384,33 @@ class DiscussionThread:
         if timestamp:
             self.timestamp = max(self.timestamp, timestamp)
 
+    def feed_lines(self, lines: list[str]) -> None:
+        """Add lines to the content and find the newest timestamp.
+
+        Same as calling :meth:`feed_line` for each line but the
+        timestamps are found by a single scan over all lines with
+        :meth:`TimeStripper.find_timestamps()
+        <pywikibot.textlib.TimeStripper.find_timestamps>`.
+
+        .. version-added:: 11.7
+
+        :param lines: lines without line breaks
+        """
+        if not self.content:
+            lines = list(dropwhile(lambda line: not line, lines))
+        if not lines:
+            return
+
+        text = '\n'.join(lines) + '\n'
+        self._content += text
+        self._content_size += len(text.encode('utf-8'))
+
+        for _, timestamp in self.ts.find_timestamps(text):
+            if not self.timestamp:
+                self.timestamp = timestamp
+            else:
+                self.timestamp = max(self.timestamp, timestamp)
+
     def size(self) -> int:
         """Return size of discussion thread.
 
@@ -373,9 +418,12 @@ class DiscussionThread:
         len(self.to_text()). This method counts bytes, rather than
         codepoints (characters). This corresponds to MediaWiki's
         definition of page size.
+
+        .. version-changed:: 11.7
+           the size of the content is updated by :meth:`feed_line`
+           instead of being counted again on each call.
         """
-        return len(self.title.encode('utf-8')) + len(
-            self.content.encode('utf-8')) + 12
+        return len(self.title.encode('utf-8')) + self._content_size + 12
 
     def to_text(self) -> str:
         """Return wikitext discussion thread."""
@@ -511,8 +559,7 @@ class DiscussionPage(pywikibot.Page):
             cur_thread = DiscussionThread(thread.heading, self.timestripper)
             # remove heading line
             _, *lines = thread.content.replace(marker, '').splitlines()
-            for line in lines:
-                cur_thread.feed_line(line)
+            cur_thread.feed_lines(lines)
             self.threads.append(cur_thread)
 
         # add latter timestamp to predecessor if it is None
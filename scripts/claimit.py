@@ -89,12 +89,17 @@ class ClaimRobot(WikidataBot):
         :type page: pywikibot.page.BasePage
         :param item: The item to treat
         :type item: pywikibot.page.ItemPage
+
+        .. version-changed:: 11.7
+           all claims are saved with a single edit.
         """
+        batch = pywikibot.page.EntityEditBatch()
         for claim in self.claims:
             # The generator might yield pages from multiple sites
             site = page.site if page is not None else None
             self.user_add_claim_unless_exists(
-                item, claim.copy(), self.exists_arg, site)
+                item, claim.copy(), self.exists_arg, site, batch=batch)
+        self.user_save_batch(batch)
 
 
 def main(*args: str) -> None:
@@ -123,6 +123,11 @@ class CoordImportRobot(ConfigParserBot, WikidataBot):
     def try_import_coordinates_from_page(self, page, item) -> bool:
         """Try import coordinate from the given page to the given item.
 
+        .. version-changed:: 11.7
+           the claim is saved by :meth:`user_save_batch()
+           <pywikibot.bot.WikidataBot.user_save_batch>` with user
+           confirmation and error handling of the bot.
+
         :return: whether any coordinates were found and the import was
             successful
         """
@@ -130,6 +135,13 @@ class CoordImportRobot(ConfigParserBot, WikidataBot):
         if not coordinate:
             return False
 
+        try:
+            # the globe must be known to save the coordinate
+            coordinate.toWikibase()
+        except CoordinateGlobeUnknownError as e:
+            pywikibot.info(f'Skipping unsupported globe: {e.args}')
+            return False
+
         newclaim = pywikibot.Claim(self.repo, self.prop)
         newclaim.setTarget(coordinate)
         source = self.getSource(page.site)
@@ -138,14 +150,9 @@ class CoordImportRobot(ConfigParserBot, WikidataBot):
         pywikibot.info(
             f'Adding {coordinate.lat}, {coordinate.lon} to {item.title()}')
 
-        # TODO: handle exceptions using self.user_add_claim
-        try:
-            item.addClaim(newclaim)
-        except CoordinateGlobeUnknownError as e:
-            pywikibot.info(f'Skipping unsupported globe: {e.args}')
-            return False
-
-        return True
+        batch = pywikibot.page.EntityEditBatch()
+        batch.add_claim(item, newclaim)
+        return self.user_save_batch(batch)
 
 
 def main(*args: str) -> None:
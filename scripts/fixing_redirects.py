@@ -42,6 +42,7 @@ from pywikibot.exceptions import (
     NoMoveTargetError,
     SectionError,
 )
+from pywikibot.page import LinkTable
 from pywikibot.textlib import isDisabled
 from pywikibot.tools import first_lower
 from pywikibot.tools import first_upper as firstcap
@@ -188,9 +189,14 @@ class FixingRedirectBot(SingleSiteBot, ExistingPageBot, AutomaticTWSummaryBot):
             pywikibot.error(e)
             return
 
+        # load existence and redirect targets of all links at once
+        table = LinkTable(self.current_page.site)
+        table.add(self.current_page, newtext)
+        table.resolve()
+
         with BoundedPoolExecutor('ThreadPoolExecutor') as executor:
             futures = {executor.submit(self.get_target, p)
-                       for p in self.current_page.linkedPages()}
+                       for p in table.links[self.current_page]}
             for future in as_completed(futures):
                 page, target = future.result()
                 if target:
@@ -290,7 +290,11 @@ class HarvestRobot(ConfigParserBot, WikidataBot):
     def treat_page_and_item(self,
                             page: pywikibot.page.BasePage | None,
                             item: pywikibot.page.ItemPage | None) -> None:
-        """Process a single page/item."""
+        """Process a single page/item.
+
+        .. version-changed:: 11.7
+           claims are saved with a single edit per item.
+        """
         if willstop:
             raise KeyboardInterrupt
 
@@ -299,6 +303,7 @@ class HarvestRobot(ConfigParserBot, WikidataBot):
 
         assert page is self.current_page
 
+        batch = pywikibot.page.EntityEditBatch()
         templates = page.raw_extracted_templates
         for template, fielddict in templates:
             # Clean up template
@@ -315,15 +320,24 @@ class HarvestRobot(ConfigParserBot, WikidataBot):
 
             # We found the template we were looking for
             for field_item in fielddict.items():
-                self.treat_field(item, page.site, field_item)
+                self.treat_field(item, page.site, field_item, batch=batch)
+
+        self.user_save_batch(batch)
 
     def treat_field(self,
                     item: pywikibot.page.ItemPage,
                     site: pywikibot.site.BaseSite,
-                    field_item: tuple[str, str]) -> None:
+                    field_item: tuple[str, str], *,
+                    batch: pywikibot.page.EntityEditBatch | None = None
+                    ) -> None:
         """Process a single field of template fielddict.
 
         .. version-added:: 7.5
+        .. version-changed:: 11.7
+           *batch* parameter was added.
+
+        :param batch: Collect the claims in this edit batch instead of
+            saving them immediately
         """
         field, value = field_item
         field = field.strip()
@@ -356,7 +370,7 @@ class HarvestRobot(ConfigParserBot, WikidataBot):
             claim.setTarget(target)
             # A generator might yield pages from multiple sites
             added = self.user_add_claim_unless_exists(
-                item, claim, exists_arg, site, pywikibot.info)
+                item, claim, exists_arg, site, pywikibot.info, batch=batch)
 
             if (added and inverse_prop
                     and isinstance(target, pywikibot.ItemPage)):
@@ -367,7 +381,8 @@ class HarvestRobot(ConfigParserBot, WikidataBot):
                 inverse_claim = inverse_ppage.newClaim()
                 inverse_claim.setTarget(item)
                 self.user_add_claim_unless_exists(
-                    target, inverse_claim, exists_arg, site, pywikibot.info)
+                    target, inverse_claim, exists_arg, site, pywikibot.info,
+                    batch=batch)
 
             # Stop after the first match if not supposed to add
             # multiple values
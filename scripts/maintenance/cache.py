@@ -8,9 +8,13 @@
 
 Syntax:
 
-    python pwb.py cache [-password] [-delete] [-c "..."] [-o "..."] [dir ...]
+    python pwb.py cache [-password] [-delete] [-purge] [-c "..."] [-o "..."] \
+        [dir ...]
 
-If no directory are specified, it will detect the API caches.
+If no directory are specified, it will detect the API caches. A SQLite
+cache database file like ``apicache.sqlite3`` may be given instead of a
+directory; its entries are queried without unpickling the response data
+unless a command needs them.
 
 If no command is specified, it will print the filename of all entries.
 If only -delete is specified, it will delete all entries.
@@ -20,6 +24,8 @@ The following parameters are supported:
 -delete           Delete each command filtered. If that option is set the
                   default output will be nothing.
 
+-purge            Delete all expired entries.
+
 -c                Filter command in python syntax. It must evaluate to True to
                   output anything.
 
@@ -74,8 +80,10 @@ import hashlib
 import os
 import pickle
 import sys
+from functools import cached_property
 from pathlib import Path
 from random import sample
+from types import SimpleNamespace
 
 import pywikibot
 from pywikibot.data import api
@@ -218,6 +226,95 @@ class CacheEntry(api.CachedRequest):
         self._cachefile_path().unlink()
 
 
+class SQLiteCacheEntry(CacheEntry):
+
+    """A Request cache entry of a SQLite cache database.
+
+    The response data are only unpickled if the ``_data`` attribute is
+    accessed.
+
+    .. version-added:: 11.7
+    """
+
+    def __init__(self, backend: api.SQLiteCacheBackend,
+                 record: api.CacheRecord) -> None:
+        """Initializer."""
+        super().__init__(str(backend.path), record.key)
+        self.backend = backend
+        self.record = record
+
+    def __repr__(self) -> str:
+        """Representation of object."""
+        return f'{self.directory}:{self.filename}'
+
+    def _load_cache(self) -> bool:
+        """Load the cache entry metadata."""
+        self.key = self.record.description
+        self._cachetime = self.record.created
+        self.stinfo = SimpleNamespace(
+            st_atime=self.record.accessed.timestamp(),
+            st_mtime=self.record.created.timestamp())
+        return True
+
+    @cached_property
+    def _data(self):
+        """Load the response data from the database."""
+        return self.backend.load_data(self.filename)
+
+    def _delete(self) -> None:
+        """Delete the cache entry."""
+        self.backend.delete(self.filename)
+
+
+def is_sqlite_file(path) -> bool:
+    """Return whether the given path is a SQLite database file.
+
+    .. version-added:: 11.7
+    """
+    if not os.path.isfile(path):
+        return False
+    with open(path, 'rb') as f:
+        return f.read(16) == b'SQLite format 3\x00'
+
+
+def process_sqlite_entries(cache_path, func, output_func=None,
+                           action_func=None, *,
+                           tests: int | None = None) -> None:
+    """Check the contents of a SQLite cache database.
+
+    Entries are filtered by their metadata; the response data are only
+    loaded if *func* or *output_func* needs them.
+
+    .. version-added:: 11.7
+
+    :param tests: Only process a test sample of entries
+    """
+    if action_func == CacheEntry._delete:
+        action_func = SQLiteCacheEntry._delete
+
+    backend = api.SQLiteCacheBackend(cache_path)
+    records = list(backend.entries())
+    if tests:
+        records = sample(records, min(len(records), tests))
+
+    for record in records:
+        entry = SQLiteCacheEntry(backend, record)
+
+        # Deletion is chosen only, abbreviate this request
+        if func is None and output_func is None \
+           and action_func == SQLiteCacheEntry._delete:
+            action_func(entry)
+            continue
+
+        entry._load_cache()
+        if not _prepare_entry(entry):
+            continue
+
+        _apply_commands(entry, func, output_func, action_func)
+
+    backend.close()
+
+
 def process_entries(cache_path, func, use_accesstime: bool | None = None,
                     output_func=None, action_func=None, *,
                     tests: int | None = None) -> None:
@@ -231,6 +328,8 @@ def process_entries(cache_path, func, use_accesstime: bool | None = None,
 
     .. version-changed:: 9.0
        default cache path to 'apicache' without Python main version.
+    .. version-changed:: 11.7
+       SQLite cache database files are supported.
 
     :param use_accesstime: Whether access times should be used. `None`
         for detect, `False` for don't use and `True` for always use.
@@ -243,6 +342,11 @@ def process_entries(cache_path, func, use_accesstime: bool | None = None,
         pywikibot.error(f'{cache_path}: no such file or directory')
         return
 
+    if is_sqlite_file(cache_path):
+        process_sqlite_entries(cache_path, func, output_func, action_func,
+                               tests=tests)
+        return
+
     if os.path.isdir(cache_path):
         filenames = [os.path.join(cache_path, filename)
                      for filename in os.listdir(cache_path)]
@@ -289,29 +393,58 @@ def process_entries(cache_path, func, use_accesstime: bool | None = None,
             os.utime(filepath, (stinfo.st_atime, stinfo.st_mtime))
             entry.stinfo = stinfo
 
-        try:
-            entry.parse_key()
-        except ParseError as e:
-            pywikibot.error(
-                f'Problems parsing {entry.filename} with key {entry.key}')
-            pywikibot.error(e)
+        if not _prepare_entry(entry):
             continue
 
-        try:
-            entry._rebuild()
-        except Exception:
-            pywikibot.error(f'Problems loading {entry.filename} with key '
-                            f'{entry.key}, {entry._parsed_key!r}')
-            pywikibot.exception()
-            continue
+        _apply_commands(entry, func, output_func, action_func)
 
-        if func is None or func(entry):
-            if output_func or action_func is None:
-                output = entry if output_func is None else output_func(entry)
-                if output is not None:
-                    pywikibot.info(output)
-            if action_func:
-                action_func(entry)
+
+def _prepare_entry(entry) -> bool:
+    """Parse the key of a loaded entry and rebuild the request.
+
+    :return: whether the entry could be rebuilt
+    """
+    try:
+        entry.parse_key()
+    except ParseError as e:
+        pywikibot.error(
+            f'Problems parsing {entry.filename} with key {entry.key}')
+        pywikibot.error(e)
+        return False
+
+    try:
+        entry._rebuild()
+    except Exception:
+        pywikibot.error(f'Problems loading {entry.filename} with key '
+                        f'{entry.key}, {entry._parsed_key!r}')
+        pywikibot.exception()
+        return False
+
+    return True
+
+
+def _apply_commands(entry, func, output_func, action_func) -> None:
+    """Apply filter, output and action commands to an entry."""
+    if func is None or func(entry):
+        if output_func or action_func is None:
+            output = entry if output_func is None else output_func(entry)
+            if output is not None:
+                pywikibot.info(output)
+        if action_func:
+            action_func(entry)
+
+
+def purge_entries(cache_path) -> None:
+    """Delete all expired entries of a cache directory or database.
+
+    .. version-added:: 11.7
+    """
+    if is_sqlite_file(cache_path):
+        backend: api.CacheBackend = api.SQLiteCacheBackend(cache_path)
+    else:
+        backend = api.PickleCacheBackend(cache_path)
+    count = backend.purge()
+    pywikibot.info(f'{count} expired entries deleted from {cache_path}')
 
 
 def _parse_command(command, name):
@@ -424,6 +557,7 @@ def main() -> None:
     local_args = pywikibot.handle_args()
     cache_paths = None
     delete = False
+    purge = False
     command = None
     output = None
 
@@ -434,6 +568,8 @@ def main() -> None:
             output = arg
         elif arg == '-delete':
             delete = True
+        elif arg == '-purge':
+            purge = True
         elif arg == '-password':
             command = 'has_password(entry)'
         elif arg == '-c':
@@ -450,7 +586,8 @@ def main() -> None:
             cache_paths.append(arg)
 
     if not cache_paths:
-        folders = ('apicache', 'apicache-py2', 'apicache-py3')
+        folders = ('apicache', 'apicache-py2', 'apicache-py3',
+                   'apicache.sqlite3')
         cache_paths = list(folders)
         # Add tests folders
         cache_paths += [os.path.join('tests', f) for f in folders]
@@ -485,6 +622,10 @@ def main() -> None:
     for cache_path in cache_paths:
         if len(cache_paths) > 1:
             pywikibot.info(f'Processing {cache_path}')
+        if purge:
+            if os.path.exists(cache_path):
+                purge_entries(cache_path)
+            continue
         process_entries(cache_path, filter_func, output_func=output_func,
                         action_func=action_func)
 
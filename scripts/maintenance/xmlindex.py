@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""This script builds a page index of a local XML dump.
+
+The index holds the offset of every page of the dump and is used by
+:meth:`xmlreader.XmlDump.lookup` to read single pages without scanning
+the whole dump. It is written next to the dump as
+``<dumpname>.index.bz2``. Multistream dumps are indexed stream by
+stream; the pages of other dumps are found by scanning the uncompressed
+dump once.
+
+Syntax:
+
+    python pwb.py xmlindex [-index:filename] [-lookup:title] dump
+
+The following parameters are supported:
+
+-index:filename   Write the index to the given file instead of the default
+                  file name.
+
+-lookup:title     Print the latest text of the given page from the dump
+                  instead of building the index. A page id may be given
+                  instead of a title. The index is built if not present.
+
+.. version-added:: 11.7
+"""
+from __future__ import annotations
+
+import pywikibot
+from pywikibot import xmlreader
+
+
+def main(*args: str) -> None:
+    """Process command line arguments and invoke the index builder.
+
+    If args is an empty list, sys.argv is used.
+
+    :param args: command line arguments
+    """
+    filename = None
+    index = None
+    lookup = None
+
+    for arg in pywikibot.handle_args(args):
+        opt, _, value = arg.partition(':')
+        if opt == '-index':
+            index = value or pywikibot.input(
+                'Please enter the index file name:')
+        elif opt == '-lookup':
+            lookup = value or pywikibot.input(
+                'Please enter the page title to look up:')
+        elif not filename:
+            filename = arg
+
+    if not filename:
+        pywikibot.bot.suggest_help(missing_parameters=['dump'])
+        return
+
+    dump = xmlreader.XmlDump(filename, revisions='latest')
+    if lookup is None:
+        pywikibot.info(f'Building page index of {filename}...')
+        index = dump.build_index(index)
+        pywikibot.info(f'Page index written to {index}')
+        return
+
+    entry = dump.lookup(int(lookup) if lookup.isdigit() else lookup)
+    if entry is None:
+        pywikibot.error(f'{lookup} not found in {filename}')
+    else:
+        pywikibot.info(entry.text)
+
+
+if __name__ == '__main__':
+    main()
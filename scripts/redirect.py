@@ -163,7 +163,7 @@ class RedirectGenerator(OptionHandler):
         redirR = self.site.redirect_regex
         readPagesCount = 0
         pageTitles = set()
-        for entry in dump.parse():
+        for entry in dump.parse(namespaces=self.opt.namespaces or None):
             readPagesCount += 1
             # always print status message after 10000 pages
             if readPagesCount % 10000 == 0:
@@ -38,6 +38,16 @@ Furthermore, the following command line parameters are supported:
                   before the one specified (may also be given as
                   -xmlstart:Article).
 
+-xmltitles        (Only works with -xml) Only read the pages listed in the
+                  given text file, one title per line, from the XML dump.
+                  The pages are looked up in the dump's page index which is
+                  built on first use (may also be given as
+                  -xmltitles:filename).
+
+-xmlprocesses:n   (Only works with -xml) Parse a multistream bz2 dump by n
+                  worker processes which also check the replacements.
+                  Only titles of matching pages are sent back to the bot.
+
 -addcat:cat_name  Adds "cat_name" category to every altered page.
 
 -excepttitle:XYZ  Skip pages with titles that contain XYZ. If the -regex
@@ -167,8 +177,9 @@ talk about HTTP, where the typo has become part of the standard:
 """
 from __future__ import annotations
 
+import pickle
 import re
-from collections.abc import Generator, Sequence
+from collections.abc import Generator, Iterable, Sequence
 from contextlib import suppress
 from pathlib import Path
 from typing import Any
@@ -411,6 +422,127 @@ class ReplacementListEntry(ReplacementBase):
         return _get_text_exceptions(self.fix_set.exceptions or {})
 
 
+class ReplacementSet:
+
+    """Find the replacements which may change a text in a single scan.
+
+    Most rules of large fix sets are plain strings or regexes which
+    consist of a literal text only, optionally enclosed by word
+    boundaries. These literals are merged into a trie shaped lookahead
+    pattern; a single scan of the text yields every position where a
+    literal starts, and the rules of all literals found there are
+    candidates. Other rules are always candidates. Replacements are
+    still applied one after another with their own exceptions and
+    summaries; the set only tells which of them may change the text:
+
+    .. code-block:: python
+
+       rules = ReplacementSet(replacements)
+       for i in sorted(rules.candidates(text)):
+           ...
+
+    .. version-added:: 11.7
+
+    :param replacements: compiled replacements
+    """
+
+    #: Leading global inline flags of a pattern
+    GLOBAL_FLAGS = re.compile(r'\A\(\?[aiLmsux]+\)')
+
+    #: A literal pattern, optionally enclosed by word boundaries
+    LITERAL = re.compile(
+        r'(?:\\b)?((?:[^.^$*+?{}\[\]\\|()]|\\[^A-Za-z0-9])+)(?:\\b)?')
+
+    #: Non-ASCII characters which match ASCII letters ignoring case
+    _FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i',
+                           '\u017f': 's', '\u212a': 'k'})
+
+    def __init__(self, replacements: Sequence[ReplacementBase]) -> None:
+        """Initializer."""
+        self.replacements = list(replacements)
+        self.unbatched: set[int] = set()
+        literals: dict[bool, dict[str, list[int]]] = {False: {}, True: {}}
+
+        for i, replacement in enumerate(self.replacements):
+            literal = self._literal(replacement.old_regex)
+            if literal is None:
+                self.unbatched.add(i)
+            else:
+                text, ignore_case = literal
+                literals[ignore_case].setdefault(text, []).append(i)
+
+        self.scanners = []
+        for ignore_case, found in literals.items():
+            if found:
+                pattern = re.compile(f'(?={self._trie(found)})',
+                                     re.IGNORECASE if ignore_case else 0)
+                lengths = sorted({len(text) for text in found})
+                self.scanners.append((pattern, ignore_case, found, lengths))
+
+    @classmethod
+    def _literal(cls, regex: re.Pattern[str]) -> tuple[str, bool] | None:
+        """Return the literal text of a regex and whether to ignore case.
+
+        Return None if the regex is not a plain literal.
+        """
+        if not isinstance(regex, re.Pattern) \
+           or not isinstance(regex.pattern, str) \
+           or regex.flags & re.VERBOSE:
+            return None
+
+        pattern = cls.GLOBAL_FLAGS.sub('', regex.pattern)
+        match = cls.LITERAL.fullmatch(pattern)
+        if not match:
+            return None
+
+        text = re.sub(r'\\(.)', r'\1', match[1], flags=re.DOTALL)
+        if not regex.flags & re.IGNORECASE:
+            return text, False
+        if not text.isascii():
+            return None
+        return text.lower(), True
+
+    @staticmethod
+    def _trie(literals: Iterable[str]) -> str:
+        """Return a trie shaped pattern which matches all literals."""
+        trie: dict[str, dict] = {}
+        for text in literals:
+            node = trie
+            for char in text:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def pattern(node: dict[str, dict]) -> str:
+            alternatives = [re.escape(char) + pattern(child)
+                            for char, child in sorted(node.items()) if char]
+            if not alternatives:
+                return ''
+            if len(alternatives) == 1 and '' not in node:
+                return alternatives[0]
+            group = '(?:{})'.format('|'.join(alternatives))
+            return group + '?' if '' in node else group
+
+        return pattern(trie)
+
+    def candidates(self, text: str, start: int = 0) -> set[int]:
+        """Return indexes of replacements which may change the text.
+
+        :param text: the text to be scanned
+        :param start: only replacements from this index are returned
+        """
+        found = {i for i in self.unbatched if i >= start}
+        for pattern, ignore_case, literals, lengths in self.scanners:
+            for match in pattern.finditer(text):
+                pos = match.start()
+                for length in lengths:
+                    key = text[pos:pos + length]
+                    if ignore_case:
+                        key = key.translate(self._FOLD).lower()
+                    found.update(i for i in literals.get(key, ())
+                                 if i >= start)
+        return found
+
+
 class XmlDumpReplacePageGenerator:
 
     """Iterator that will yield Pages that might contain text to replace.
@@ -424,6 +556,15 @@ class XmlDumpReplacePageGenerator:
     :param exceptions: A dictionary which defines when to ignore an
         occurrence. See docu of the ReplaceRobot initializer below.
     :type exceptions: dict
+    :param titles: If given, only these pages are read from the dump
+        using its page index.
+    :param processes: If greater than 1, the streams of a multistream
+        bz2 dump are parsed and checked for replacements by this number
+        of worker processes; only titles of matching pages are sent
+        back. Not used with *titles*.
+
+    .. version-changed:: 11.7
+       *titles* and *processes* parameters were added.
     """
 
     def __init__(self,
@@ -431,10 +572,13 @@ class XmlDumpReplacePageGenerator:
                  xmlStart: str,
                  replacements: list[tuple[Any, str]],
                  exceptions: dict[str, Any],
-                 site) -> None:
+                 site,
+                 titles: Iterable[str] | None = None,
+                 processes: int | None = None) -> None:
         """Initializer."""
         self.xmlFilename = xmlFilename
         self.replacements = replacements
+        self.replacement_set = ReplacementSet(replacements)
         self.exceptions = exceptions
         self.xmlStart = xmlStart
         self.skipping = bool(xmlStart)
@@ -449,37 +593,104 @@ class XmlDumpReplacePageGenerator:
             self.site = site
         else:
             self.site = pywikibot.Site()
+
+        # resolve site dependent exceptions once; worker processes of a
+        # parallel scan have no site
+        self.excsInside = textlib.get_regexes(self.excsInside, self.site)
+        self.inside_exceptions = [
+            textlib.get_regexes(replacement.get_inside_exceptions(),
+                                self.site)
+            for replacement in self.replacements]
+
+        if titles is not None:
+            processes = None
+        elif processes is not None and processes > 1:
+            try:
+                pickle.dumps(self)
+            except (AttributeError, TypeError, pickle.PicklingError) as e:
+                pywikibot.warning(
+                    f'Replacements cannot be checked by worker processes '
+                    f'({e}); the dump is scanned by a single process.')
+                processes = None
+        self.processes = processes
+
         dump = xmlreader.XmlDump(self.xmlFilename, on_error=pywikibot.error)
-        self.parser = dump.parse()
+        if processes is not None and processes > 1:
+            self.parser = dump.map_entries(self._scan, processes=processes)
+        elif titles is None:
+            # title exceptions are checked before revisions are decoded;
+            # the start page must be found even if it is excepted
+            self.parser = dump.parse(
+                title_filter=lambda title: (
+                    self.skipping or not self.isTitleExcepted(title)))
+        else:
+            self.parser = dump.lookup_pages(titles)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the picklable state for worker processes.
+
+        .. version-added:: 11.7
+        """
+        state = self.__dict__.copy()
+        state['parser'] = state['site'] = None
+        return state
 
     def __iter__(self):
         """Iterator method."""
         try:
-            for entry in self.parser:
-                if self.skipping:
-                    if entry.title != self.xmlStart:
-                        continue
-                    self.skipping = False
-                if self.isTitleExcepted(entry.title) \
-                        or self.isTextExcepted(entry.text):
-                    continue
-                new_text = entry.text
-                for replacement in self.replacements:
-                    # This doesn't do an actual replacement but just
-                    # checks if at least one does apply
-                    new_text = textlib.replaceExcept(
-                        new_text, replacement.old_regex, replacement.new,
-                        self.excsInside + replacement.get_inside_exceptions(),
-                        site=self.site)
-                if new_text != entry.text:
-                    yield pywikibot.Page(self.site, entry.title)
+            if self.processes is not None and self.processes > 1:
+                for title, matched in self.parser:
+                    if self._started(title) and matched:
+                        yield pywikibot.Page(self.site, title)
+            else:
+                for entry in self.parser:
+                    title = entry.title
+                    if self._started(title) and self._matches(entry):
+                        yield pywikibot.Page(self.site, title)
 
         except KeyboardInterrupt:
             with suppress(NameError):
                 if not self.skipping:
-                    pywikibot.info(f'To resume, use "-xmlstart:{entry.title}"'
+                    pywikibot.info(f'To resume, use "-xmlstart:{title}"'
                                    ' on the command line.')
 
+    def _started(self, title: str) -> bool:
+        """Return True if the start page of the dump was reached."""
+        if self.skipping and title == self.xmlStart:
+            self.skipping = False
+        return not self.skipping
+
+    def _matches(self, entry) -> bool:
+        """Return True if a replacement applies to the entry text."""
+        if self.isTitleExcepted(entry.title) \
+                or self.isTextExcepted(entry.text):
+            return False
+        spans = textlib.ExceptionSpans(entry.text, site=self.site)
+        candidates = self.replacement_set.candidates(entry.text)
+        for i, replacement in enumerate(self.replacements):
+            if i not in candidates:
+                continue
+            # This doesn't do an actual replacement but just
+            # checks if at least one does apply
+            old_text = spans.text
+            spans.replace(replacement.old_regex, replacement.new,
+                          self.excsInside + self.inside_exceptions[i])
+            if spans.text != old_text:
+                candidates = self.replacement_set.candidates(
+                    spans.text, start=i + 1)
+        return spans.text != entry.text
+
+    def _scan(self, entry) -> tuple[str, bool] | None:
+        """Check an entry in a worker process.
+
+        :return: the title and whether a replacement applies if it does
+            or if the entry is the start page; None otherwise
+        """
+        matched = self._matches(entry)
+        if matched or entry.title == self.xmlStart:
+            return entry.title, matched
+        return None
+
     def isTitleExcepted(self, title) -> bool:
         """Return True if one of the exceptions applies for the given title."""
         if 'title' in self.exceptions:
@@ -575,6 +786,7 @@ class ReplaceRobot(SingleSiteBot, ExistingPageBot):
                 replacements[i] = Replacement.from_compiled(replacement[0],
                                                             replacement[1])
         self.replacements = replacements
+        self.replacement_set = ReplacementSet(replacements)
         self.exceptions = exceptions or {}
 
         if self.opt.addcat and isinstance(self.opt.addcat, str):
@@ -606,10 +818,13 @@ class ReplaceRobot(SingleSiteBot, ExistingPageBot):
 
     def apply_replacements(self, original_text, applied, page) -> str:
         """Apply all replacements to the given text."""
-        new_text = original_text
+        # exception matches are shared by all replacements; only those
+        # before a change of the text are searched again
+        spans = textlib.ExceptionSpans(original_text, site=self.site)
+        candidates = self.replacement_set.candidates(original_text)
         exceptions = _get_text_exceptions(self.exceptions)
         skipped_containers = set()
-        for replacement in self.replacements:
+        for i, replacement in enumerate(self.replacements):
             if self.opt.sleep:
                 pywikibot.sleep(self.opt.sleep)
             if (replacement.container
@@ -633,18 +848,21 @@ class ReplaceRobot(SingleSiteBot, ExistingPageBot):
                     )
                 continue
 
-            if self.isTextExcepted(original_text, replacement.exceptions):
+            if i not in candidates \
+               or self.isTextExcepted(original_text, replacement.exceptions):
                 continue
 
-            old_text = new_text
-            new_text = textlib.replaceExcept(
-                new_text, replacement.old_regex, replacement.new,
-                exceptions + replacement.get_inside_exceptions(),
-                allowoverlap=self.opt.allowoverlap, site=self.site)
-            if old_text != new_text:
+            old_text = spans.text
+            spans.replace(replacement.old_regex, replacement.new,
+                          exceptions + replacement.get_inside_exceptions(),
+                          allowoverlap=self.opt.allowoverlap)
+            if old_text != spans.text:
                 applied.add(replacement)
+                # the changed text may be matched by subsequent rules
+                candidates = self.replacement_set.candidates(spans.text,
+                                                             start=i + 1)
 
-        return new_text
+        return spans.text
 
     def generate_summary(self, applied_replacements):
         """Generate a summary message for the replacements."""
@@ -941,6 +1159,8 @@ def main(*args: str) -> None:
     # if -xml flag is present
     xmlFilename = None
     xmlStart = None
+    xml_titles = None
+    xml_processes = None
     sql_query: str | None = None
     # Set the default regular expression flags
     flags = 0
@@ -963,6 +1183,12 @@ def main(*args: str) -> None:
                 'Please enter the dumped article to start with:')
         elif opt == '-xml':
             xmlFilename = value or i18n.input('pywikibot-enter-xml-filename')
+        elif opt == '-xmltitles':
+            xml_titles = value or pywikibot.input(
+                'Please enter the file name of the title list:')
+        elif opt == '-xmlprocesses':
+            xml_processes = int(value or pywikibot.input(
+                'Please enter the number of worker processes:'))
         elif opt == '-mysqlquery':
             sql_query = value
         elif opt == '-fix':
@@ -1130,8 +1356,15 @@ def main(*args: str) -> None:
     precompile_exceptions(exceptions, regex, flags)
 
     if xmlFilename:
+        titles = None
+        if xml_titles:
+            content = Path(xml_titles).read_text(encoding='utf-8-sig')
+            titles = [title.strip() for title in content.splitlines()
+                      if title.strip()]
         gen = XmlDumpReplacePageGenerator(xmlFilename, xmlStart,
-                                          replacements, exceptions, site)
+                                          replacements, exceptions, site,
+                                          titles=titles,
+                                          processes=xml_processes)
     elif sql_query is not None:
         # Only -excepttext option is considered by the query. Other
         # exceptions are taken into account by the ReplaceRobot
@@ -145,6 +145,7 @@ library_test_modules = {
     'tests',
     'textlib',
     'thanks',
+    'throttle',
     'time',
     'timestripper',
     'titletranslate',
@@ -163,6 +164,7 @@ library_test_modules = {
     'wbtypes',
     'wikibase',
     'wikibase_edit',
+    'wikibase_memory',
     'wikiblame',
     'wikistats',
     'wikiwho',
@@ -10,12 +10,13 @@ from __future__ import annotations
 import unittest
 from contextlib import suppress
 from datetime import datetime
+from unittest.mock import Mock
 
 import pywikibot
 from pywikibot.exceptions import Error
 from pywikibot.textlib import TimeStripper
 from scripts import archivebot
-from tests.aspects import TestCase
+from tests.aspects import DefaultDrySiteTestCase, TestCase
 
 
 THREADS = {
@@ -113,6 +114,54 @@ class TestArchiveBotFunctions(TestCase):
             archivebot.str2size('1234 567')
 
 
+class TestDiscussionThread(DefaultDrySiteTestCase):
+
+    """Test DiscussionThread object."""
+
+    def test_size(self) -> None:
+        """Test that the size follows the content."""
+        timestripper = Mock(site=self.site, timestripper=lambda line: None,
+                            find_timestamps=lambda text: [])
+        thread = archivebot.DiscussionThread('Tïtle', timestripper)
+        for line in ('', 'foo', 'bär', ''):
+            thread.feed_line(line)
+        self.assertEqual(thread.content, 'foo\nbär\n\n')
+        self.assertEqual(thread.size(), 6 + 10 + 12)
+        thread.content = 'x'
+        self.assertEqual(thread.size(), 6 + 1 + 12)
+        thread.feed_line('ü')
+        self.assertEqual(thread.size(), 6 + 4 + 12)
+        thread.content += 'ä'
+        self.assertEqual(thread.size(), 6 + 6 + 12)
+        thread.feed_lines(['', 'ö'])
+        self.assertEqual(thread.content, 'xü\nä\nö\n')
+        self.assertEqual(thread.size(), 6 + 10 + 12)
+
+    def test_feed_lines(self) -> None:
+        """Test that feed_lines is equal to feed_line for each line."""
+        stamps = {'a': datetime(2020, 1, 1), 'b': datetime(2021, 1, 1)}
+
+        def find_timestamps(text):
+            return [(0, stamps[line]) for line in text.splitlines()
+                    if line in stamps]
+
+        timestripper = Mock(site=self.site, timestripper=stamps.get,
+                            find_timestamps=find_timestamps)
+        lines = ['', '', 'b', 'x', '', 'a']
+        single = archivebot.DiscussionThread('Title', timestripper)
+        for line in lines:
+            single.feed_line(line)
+        thread = archivebot.DiscussionThread('Title', timestripper)
+        thread.feed_lines(lines)
+        self.assertEqual(thread.content, 'b\nx\n\na\n')
+        self.assertEqual(thread.content, single.content)
+        self.assertEqual(thread.timestamp, stamps['b'])
+        self.assertEqual(thread.timestamp, single.timestamp)
+        self.assertEqual(thread.size(), single.size())
+        thread.feed_lines(['', ''])
+        self.assertEqual(thread.content, 'b\nx\n\na\n\n\n')
+
+
 class TestArchiveBot(TestCase):
 
     """Test archivebot script on 40+ Wikipedia sites."""
@@ -22,6 +22,8 @@ from collections.abc import Iterable, Iterator, Sized
 from contextlib import contextmanager, suppress
 from functools import wraps
 from http import HTTPStatus
+from typing import Any
+from unittest import mock
 from unittest.util import safe_repr
 
 import pywikibot
@@ -528,15 +530,12 @@ class DisableSiteMixin(TestCaseBase):
         self.old_Site_lookup_method = pywikibot.Site
         pywikibot.Site = lambda *args: self.fail(
             f'{self.__class__.__name__}: Site() not permitted')
+        # restore Site also if setUp is skipped or fails
+        self.addCleanup(setattr, pywikibot, 'Site',
+                        self.old_Site_lookup_method)
 
         super().setUp()
 
-    def tearDown(self) -> None:
-        """Tear down test."""
-        super().tearDown()
-
-        pywikibot.Site = self.old_Site_lookup_method
-
 
 class ForceCacheMixin(TestCaseBase):
 
@@ -1336,6 +1335,40 @@ class DefaultDrySiteTestCase(DefaultSiteTestCase):
     dry = True
 
 
+class DrySimpleRequestTestCase(DefaultDrySiteTestCase):
+
+    """Answer simple requests of dry sites by the :meth:`submit` method.
+
+    :meth:`APISite.simple_request()
+    <pywikibot.site._apisite.APISite.simple_request>` is patched for
+    the dry site and its data repository. The parameters of each
+    request are collected in the ``requests`` list.
+
+    .. version-added:: 11.7
+    """
+
+    def submit(self, **params) -> dict[str, Any]:
+        """Return the response data of a request.
+
+        :param params: The parameters of the request
+        """
+        raise NotImplementedError
+
+    def _simple_request(self, **params) -> mock.Mock:
+        """Collect the request parameters and return a request mock."""
+        self.requests.append(params)
+        return mock.Mock(submit=mock.Mock(return_value=self.submit(**params)))
+
+    def setUp(self) -> None:
+        """Patch simple requests of the dry sites."""
+        super().setUp()
+        self.requests: list[dict[str, Any]] = []
+        patcher = mock.patch('pywikibot.site._apisite.APISite.simple_request',
+                             side_effect=self._simple_request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
 class WikimediaDefaultSiteTestCase(DefaultSiteTestCase):
 
     """Test class to run against a WMF site, preferring the default site."""
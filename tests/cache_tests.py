@@ -7,9 +7,15 @@
 """API Request cache tests."""
 from __future__ import annotations
 
+import datetime
 import re
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
+from pywikibot import Timestamp
+from pywikibot.data.api import SQLiteCacheBackend
 from pywikibot.login import LoginStatus
 from pywikibot.site import BaseSite
 from scripts.maintenance import cache
@@ -43,5 +49,59 @@ class RequestCacheTests(TestCase):
                               tests=25)
 
 
+class SQLiteCacheTests(TestCase):
+
+    """Test processing entries of a SQLite cache database."""
+
+    net = False
+
+    key = "APISite('en', 'wikipedia')LoginStatus(-1)[('action', 'query'), "
+
+    def setUp(self) -> None:
+        """Create a cache database with two entries."""
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name, 'apicache.sqlite3')
+        self.backend = SQLiteCacheBackend(self.path)
+        self.addCleanup(self.backend.close)
+
+        now = Timestamp.nowutc()
+        self.backend.store('a' * 64, self.key + "('meta', 'siteinfo')]",
+                           {'query': {}}, now,
+                           expires=now + datetime.timedelta(days=1),
+                           site='wikipedia:en')
+        self.backend.store('b' * 64, self.key + "('lgpassword', 'secret')]",
+                           {}, now - datetime.timedelta(days=2),
+                           expires=now - datetime.timedelta(days=1),
+                           site='wikipedia:en')
+
+    @patch.object(cache.CacheEntry, '_rebuild')
+    def test_process_entries(self, rebuild) -> None:
+        """Test filtering and deleting entries."""
+        entries = []
+        cache.process_entries(self.path, entries.append)
+        self.assertCountEqual([str(entry) for entry in entries],
+                              ['a' * 64, 'b' * 64])
+        for entry in entries:
+            self.assertEqual(entry._parsed_key[0],
+                             "APISite('en', 'wikipedia')")
+            self.assertNotIn('_data', vars(entry))
+
+        cache.process_entries(
+            self.path, lambda entry: 'lgpassword' in entry.key,
+            action_func=cache.CacheEntry._delete)
+        record, = self.backend.entries()
+        self.assertEqual(record.key, 'a' * 64)
+
+    def test_purge(self) -> None:
+        """Test purging expired entries."""
+        self.assertTrue(cache.is_sqlite_file(self.path))
+        cache.purge_entries(self.path)
+        record, = self.backend.entries()
+        self.assertEqual(record.key, 'a' * 64)
+        self.assertEqual(self.backend.load_data(record.key), {'query': {}})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import unittest
 from contextlib import suppress
+from copy import deepcopy
 
 from pywikibot.page._collections import (
     AliasesDict,
@@ -245,6 +246,72 @@ class TestClaimCollection(DataCollectionTestCase):
         self._test_new_empty()
 
 
+class TestClaimCollectionLazy(DataCollectionTestCase):
+
+    """Test lazy decoding of ClaimCollection."""
+
+    family = 'wikipedia'
+    code = 'en'
+
+    dry = True
+
+    @staticmethod
+    def statement(prop: str, num: int, value: str) -> dict:
+        """Return the JSON of a string statement."""
+        return {
+            'id': f'Q1${prop}-{num}', 'rank': 'normal', 'type': 'statement',
+            'mainsnak': {'snaktype': 'value', 'property': prop,
+                         'datatype': 'string',
+                         'datavalue': {'value': value, 'type': 'string'}},
+        }
+
+    def setUp(self) -> None:
+        """Set up tests."""
+        super().setUp()
+        self.repo = self.get_site().data_repository()
+        self.data = {
+            'P1': [self.statement('P1', 1, 'foo')],
+            'P2': [self.statement('P2', 1, 'bar'),
+                   self.statement('P2', 2, 'baz')],
+        }
+
+    def test_lazy(self) -> None:
+        """Test that claims are decoded when a property is accessed."""
+        claims = ClaimCollection.fromJSON(self.data, self.repo)
+        item = object()
+        claims.set_on_item(item)
+        self.assertEqual(list(claims), ['P1', 'P2'])
+        self.assertIn('P2', claims)
+        self.assertEqual(claims._undecoded, {'P1', 'P2'})
+        self.assertEqual([claim.target for claim in claims['P2']],
+                         ['bar', 'baz'])
+        self.assertIs(claims['P2'][0].on_item, item)
+        self.assertEqual(claims._undecoded, {'P1'})
+        del claims['P1']
+        self.assertEqual(claims._undecoded, set())
+        self.assertLength(claims, 1)
+
+    def test_diff(self) -> None:
+        """Test toJSON with diffto for accessed properties only."""
+        claims = ClaimCollection.fromJSON(self.data, self.repo)
+        self.assertEqual(claims.toJSON(diffto=self.data), {})
+        self.assertEqual(claims._undecoded, {'P1', 'P2'})
+
+        claims['P2'][1].setTarget('changed')
+        diff = claims.toJSON(diffto=self.data)
+        self.assertEqual(list(diff), ['P2'])
+        self.assertLength(diff['P2'], 1)
+        self.assertEqual(diff['P2'][0]['id'], 'Q1$P2-2')
+        self.assertEqual(claims._undecoded, {'P1'})
+
+        changed = deepcopy(self.data)
+        changed['P1'][0]['rank'] = 'preferred'
+        diff = claims.toJSON(diffto=changed)
+        self.assertEqual(diff['P1'], [claims['P1'][0].toJSON()])
+
+        self.assertEqual(set(claims.toJSON()), {'P1', 'P2'})
+
+
 class TestSiteLinkCollection(DataCollectionTestCase):
 
     """Test cases covering SiteLinkCollection methods."""
@@ -10,7 +10,7 @@ from __future__ import annotations
 import unittest
 from contextlib import suppress
 
-from pywikibot import Page
+from pywikibot import Page, textlib
 from pywikibot.cosmetic_changes import CANCEL, CosmeticChangesToolkit
 from pywikibot.site import NamespacesDict
 from tests.aspects import TestCase, require_modules
@@ -182,6 +182,41 @@ class TestDryCosmeticChanges(TestCosmeticChanges):
         # fixArabicLetters must not change text when site is not fa or ckb
         self.assertEqual(text, self.cct.fixArabicLetters(text))
 
+    def test_shared_spans(self) -> None:
+        """Test that methods share the spans of exceptions."""
+        cct = CosmeticChangesToolkit(Page(self.site, 'Test'))
+        text = '<!-- <b>x</b> --> <ref>y</ref> 42 ccm'
+        self.assertEqual(cct.fixHtml(text), text)
+        spans = dict(cct.spans._found)
+        self.assertIsNotEmpty(spans)
+        self.assertEqual(cct.fixReferences(text), text)
+        for regex, found in spans.items():
+            self.assertIs(cct.spans._found[regex], found)
+
+        new_text = cct.fixTypo(text)
+        self.assertEqual(new_text,
+                         '<!-- <b>x</b> --> <ref>y</ref> 42&nbsp;cm³')
+        self.assertEqual(cct.spans.text, new_text)
+        start = new_text.index('42')
+        for positions, _ in cct.spans._found.values():
+            self.assertTrue(all(pos > start for pos in positions))
+
+    def test_shifted_spans(self) -> None:
+        """Test that spans behind a change are kept."""
+        cct = CosmeticChangesToolkit(Page(self.site, 'Test'))
+        regex = textlib.get_regexes('comment')[0]
+        text = '42 ccm <!--a--> x <!-- <b>x</b> -->'
+        self.assertEqual(cct.fixHtml(text), text)
+        self.assertEqual(cct.spans._found[regex],
+                         ([0, 15], [(7, 15), (18, 35)]))
+
+        new_text = cct.fixTypo(text)
+        self.assertEqual(new_text, '42&nbsp;cm³ <!--a--> x <!-- <b>x</b> -->')
+        self.assertEqual(cct.spans._found[regex], ([20], [(23, 40)]))
+        self.assertEqual(cct.fixHtml(new_text), new_text)
+        self.assertEqual(cct.spans._found[regex],
+                         ([0, 20], [(12, 20), (23, 40)]))
+
 
 class TestDryFixSyntaxSave(TestCosmeticChanges):
 
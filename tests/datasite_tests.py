@@ -9,9 +9,14 @@ from __future__ import annotations
 
 import unittest
 from contextlib import suppress
+from unittest.mock import patch
 
 import pywikibot
-from tests.aspects import DefaultWikidataClientTestCase, WikidataTestCase
+from tests.aspects import (
+    DefaultWikidataClientTestCase,
+    DrySimpleRequestTestCase,
+    WikidataTestCase,
+)
 
 
 class TestDataSitePreloading(WikidataTestCase):
@@ -71,6 +76,79 @@ class TestDataSiteClientPreloading(DefaultWikidataClientTestCase):
         self.assertEqual(item.id, 'Q5296')
 
 
+class TestDataSitePreloadingDry(DrySimpleRequestTestCase):
+
+    """Test DataSite.preload_entities with a dry site."""
+
+    def submit(self, **params):
+        """Return entities of a wbgetentities request in reversed order."""
+        entities = {}
+        for ident in reversed(params['ids']):
+            if ident == 'Q3':
+                entities[ident] = {'id': ident, 'missing': ''}
+            else:
+                entities[ident.upper()] = {
+                    'id': ident.upper(), 'type': 'item',
+                    'labels': {'en': {'language': 'en', 'value': ident}}}
+        titles = list(zip(params.get('sites', []), params.get('titles', [])))
+        for num, (dbname, title) in reversed(list(enumerate(titles, 100))):
+            # the repository normalizes the titles of sitelinks
+            title = title.partition('#')[0].replace('_', ' ')
+            entities[f'Q{num}'] = {
+                'id': f'Q{num}', 'type': 'item',
+                'sitelinks': {dbname: {'site': dbname,
+                                       'title': title[0].upper() + title[1:]}}}
+        return {'entities': entities}
+
+    def setUp(self) -> None:
+        """Set up the dry data repository."""
+        super().setUp()
+        self.repo = self.site.data_repository()
+
+    def test_order(self) -> None:
+        """Test that entities are yielded in input order."""
+        items = [pywikibot.ItemPage(self.repo, f'q{num}')
+                 for num in range(1, 11)]
+        expected = [f'Q{num}' for num in range(1, 11) if num != 3]
+        for workers in (None, 3):
+            with self.subTest(workers=workers):
+                self.requests.clear()
+                entities = list(self.repo.preload_entities(
+                    items, 4, workers=workers))
+                self.assertEqual([item.id for item in entities], expected)
+                self.assertEqual(entities[0].labels['en'], 'Q1')
+                self.assertLength(self.requests, 3)
+
+    def test_order_titles(self) -> None:
+        """Test that entities given by non-normalized titles keep order."""
+        item = pywikibot.ItemPage.fromPage(
+            pywikibot.Page(self.site, 'baz_qux'), lazy_load=True)
+        item._title = 'baz_qux'
+        pages = [item, pywikibot.Page(self.site, 'foo_bar#Section'),
+                 pywikibot.ItemPage(self.repo, 'Q1')]
+        with patch.object(self.site, 'dbName', return_value='enwiki'):
+            entities = list(self.repo.preload_entities(pages, 4))
+        self.assertEqual(self.requests[0]['titles'],
+                         ['baz_qux', 'foo bar#Section'])
+        self.assertEqual([entity.id for entity in entities],
+                         ['Q100', 'Q101', 'Q1'])
+
+    def test_props(self) -> None:
+        """Test props and languages parameters."""
+        items = [pywikibot.ItemPage(self.repo, 'Q1')]
+        item = next(self.repo.preload_entities(
+            items, 4, props='labels|claims', languages=['en', 'de']))
+        self.assertEqual(item._partial, {'aliases': None,
+                                         'descriptions': None,
+                                         'labels': frozenset({'en', 'de'}),
+                                         'sitelinks': None})
+        self.assertEqual(self.requests[0]['props'],
+                         ['info', 'labels', 'claims'])
+        self.assertEqual(self.requests[0]['languages'], ['en', 'de'])
+        list(self.repo.preload_entities(items, 4))
+        self.assertNotIn('props', self.requests[1])
+
+
 class TestDataSiteSearchEntities(WikidataTestCase):
 
     """Test DataSite.search_entities."""
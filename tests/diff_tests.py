@@ -6,6 +6,8 @@
 """Test diff module."""
 from __future__ import annotations
 
+import itertools
+import time
 import unittest
 from contextlib import suppress
 from unittest.mock import patch
@@ -193,6 +195,69 @@ class TestPatchManager(TestCase):
                 self.assertIsEmpty(p.hunks)
 
 
+class TestPatienceDiff(TestCase):
+
+    """Test PatchManager with the patience algorithm."""
+
+    net = False
+
+    a = ''.join(f'row {i}\n|-\n' for i in range(50))
+    b = a.replace('row 3\n', 'row three\n').replace('row 40\n', '')
+
+    def test_cases(self) -> None:
+        """Test that hunks are equal to those of difflib."""
+        for before, after, _ in TestPatchManager.cases:
+            with self.subTest(case=before.strip()):
+                hunks = PatchManager(before, after, algorithm='patience').hunks
+                expected = PatchManager(before, after).hunks
+                self.assertEqual([h.diff_plain_text for h in hunks],
+                                 [h.diff_plain_text for h in expected])
+
+    def test_hunks(self) -> None:
+        """Test hunks of a multi-line text."""
+        p = PatchManager(self.a, self.b, algorithm='patience')
+        self.assertFalse(p.summary)
+        self.assertEqual([h.diff_plain_text for h in p.hunks], [
+            '@@ -7 +7 @@\n\n- row 3\n+ row three\n',
+            '@@ -81 +80,0 @@\n\n- row 40\n',
+        ])
+        for hunk in p.hunks:
+            hunk.reviewed = hunk.APPR
+        self.assertEqual(''.join(p.apply()), self.b)
+
+    def test_timeout(self) -> None:
+        """Test summary hunk if the diff takes too long."""
+        with patch('pywikibot.diff.time.process_time',
+                   side_effect=itertools.count()):
+            p = PatchManager(self.a, self.b, algorithm='patience', timeout=1)
+        self.assertTrue(p.summary)
+        self.assertLength(p.hunks, 1)
+        self.assertEqual(p.hunks[0].a_rng, (6, 81))
+        self.assertEqual(p.hunks[0].b_rng, (6, 80))
+        p.hunks[0].reviewed = p.hunks[0].APPR
+        self.assertEqual(''.join(p.apply()), self.b)
+        with patch('pywikibot.info') as info:
+            p.print_hunks()
+        self.assertIn('75 lines removed, 74 lines added',
+                      info.call_args[0][0])
+
+    def test_repetitive_timeout(self) -> None:
+        """Test that a large repetitive table hits the timeout."""
+        rows = ['|-\n', '| a\n', '| b\n', '| c\n']
+        a = ''.join(rows[i * i % 7 % 4] for i in range(20000))
+        b = ''.join(rows[i * i % 11 % 4] for i in range(20000))
+        start = time.process_time()
+        p = PatchManager(a, b, algorithm='patience', timeout=1.0)
+        self.assertLess(time.process_time() - start, 1.0)
+        self.assertTrue(p.summary)
+        self.assertLength(p.hunks, 1)
+
+    def test_unknown_algorithm(self) -> None:
+        """Test that an unknown algorithm raises ValueError."""
+        with self.assertRaisesRegex(ValueError, 'Unknown diff algorithm'):
+            PatchManager(self.a, self.b, algorithm='myers')
+
+
 class TestCherryPick(TestCase):
 
     """Test cherry_pick method."""
@@ -7,7 +7,13 @@
 """API tests which do not interact with a site."""
 from __future__ import annotations
 
+import asyncio
 import datetime
+import pickle
+import tempfile
+import threading
+import time
+from itertools import count
 from pathlib import Path
 from unittest.mock import patch
 
@@ -15,8 +21,10 @@ import pywikibot
 from pywikibot.data.api import (
     CachedRequest,
     ParamInfo,
+    PickleCacheBackend,
     QueryGenerator,
     Request,
+    SQLiteCacheBackend,
 )
 from pywikibot.exceptions import Error
 from pywikibot.family import Family
@@ -137,6 +145,157 @@ class DryCachedRequestTests(SiteAttributeTestCase):
                             self.diffsite._cachefile_path())
 
 
+class DryCacheBackendTests(SiteAttributeTestCase):
+
+    """Test CachedRequest with different cache backends."""
+
+    sites = {
+        'basesite': {
+            'family': 'wikipedia',
+            'code': 'en',
+        },
+    }
+
+    dry = True
+
+    def setUp(self) -> None:
+        """Create a temporary cache directory."""
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache_dir = Path(tmpdir.name, 'apicache')
+        self.cache_dir.mkdir()
+        patcher = patch.object(CachedRequest, '_get_cache_dir',
+                               return_value=self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _roundtrip(self, backend_name: str):
+        """Write and reload a cache entry using the given backend."""
+        with patch.object(pywikibot.config, 'API_cache_backend',
+                          backend_name):
+            req = CachedRequest(expiry=1, site=self.basesite,
+                                parameters={'action': 'query',
+                                            'meta': 'siteinfo'})
+            backend = req._get_cache_backend()
+            self.assertIs(backend, req._get_cache_backend())
+            self.assertFalse(req._load_cache())
+            req._write_cache({'query': {'general': {}}})
+
+            req = CachedRequest(expiry=1, site=self.basesite,
+                                parameters={'action': 'query',
+                                            'meta': 'siteinfo'})
+            self.assertTrue(req._load_cache())
+            self.assertEqual(req._data, {'query': {'general': {}}})
+        return backend
+
+    def test_pickle_backend(self) -> None:
+        """Test cache entries stored as pickle files."""
+        backend = self._roundtrip('pickle')
+        self.assertIsInstance(backend, PickleCacheBackend)
+        self.assertLength(list(self.cache_dir.iterdir()), 1)
+        self.assertEqual(backend.purge(), 0)
+        self.assertEqual(backend.purge(pywikibot.Timestamp.nowutc()
+                                       + datetime.timedelta(days=2)), 1)
+
+    def test_pickle_purge(self) -> None:
+        """Test purging pickle files by their stored expiry time."""
+        backend = PickleCacheBackend(self.cache_dir / 'missing')
+        self.assertEqual(backend.purge(), 0)
+
+        backend = PickleCacheBackend(self.cache_dir)
+        now = pywikibot.Timestamp.nowutc()
+        for days in (1, 60):
+            backend.store(f'key{days}', 'desc', {}, now,
+                          expires=now + datetime.timedelta(days=days),
+                          site='wikipedia:en')
+        # file of an older version without expiry trailer
+        with (self.cache_dir / 'legacy').open('wb') as f:
+            pickle.dump(('desc', {}, now), f)
+
+        self.assertEqual(backend.load('key60'), ('desc', {}, now))
+        self.assertEqual(backend.purge(now + datetime.timedelta(days=2)), 1)
+        self.assertEqual(backend.purge(now + datetime.timedelta(days=31)), 1)
+        self.assertIsNotNone(backend.load('key60'))
+        self.assertEqual(backend.purge(now + datetime.timedelta(days=61)), 1)
+        self.assertLength(list(self.cache_dir.iterdir()), 0)
+
+    def test_sqlite_backend(self) -> None:
+        """Test cache entries stored in a SQLite database."""
+        backend = self._roundtrip('sqlite')
+        self.addCleanup(backend.close)
+        self.assertIsInstance(backend, SQLiteCacheBackend)
+        self.assertEqual(backend.path.name, 'apicache.sqlite3')
+        self.assertLength(list(self.cache_dir.iterdir()), 0)
+        self.assertLength(backend, 1)
+
+        record, = backend.entries('wikipedia:en')
+        self.assertEqual(record.site, 'wikipedia:en')
+        self.assertIn("('meta', 'siteinfo|userinfo')", record.description)
+        self.assertEqual(record.expires - record.created,
+                         datetime.timedelta(days=1))
+        self.assertGreater(record.size, 0)
+        self.assertEqual(backend.load_data(record.key),
+                         {'query': {'general': {}}})
+        self.assertIsEmpty(list(backend.entries('wikipedia:de')))
+
+        self.assertEqual(backend.purge(), 0)
+        self.assertEqual(backend.purge(pywikibot.Timestamp.nowutc()
+                                       + datetime.timedelta(days=2)), 1)
+        self.assertLength(backend, 0)
+
+    def _check_eviction(self, backend) -> None:
+        """Test LRU eviction of a backend."""
+        now = pywikibot.Timestamp.nowutc()
+        expires = now + datetime.timedelta(days=1)
+        for i in range(10):
+            backend.store(f'key{i}', f'desc{i}', {'i': i}, now,
+                          expires=expires, site='wikipedia:en')
+            if i % 2:
+                backend.load('key0')  # keep key0 recently used
+            backend.evict(max_entries=5)
+
+        self.assertLessEqual(backend.usage()[0], 5)
+        self.assertIsNotNone(backend.load('key0'))
+        self.assertIsNone(backend.load('key1'))
+        self.assertIsNotNone(backend.load('key9'))
+        self.assertEqual(backend.stats['writes'], 10)
+        self.assertEqual(backend.stats['evictions'],
+                         10 - backend.usage()[0])
+
+        entries, size = backend.usage()
+        self.assertEqual(backend.evict(max_bytes=size), 0)
+        self.assertGreater(backend.evict(max_bytes=size - 1), 0)
+        self.assertLess(backend.usage()[1], size * backend.low_water)
+
+    def test_pickle_eviction(self) -> None:
+        """Test LRU eviction of pickle files."""
+        backend = PickleCacheBackend(self.cache_dir)
+        with patch('time.time', side_effect=count(time.time() + 1000)):
+            self._check_eviction(backend)
+
+    def test_sqlite_eviction(self) -> None:
+        """Test LRU eviction of SQLite entries."""
+        backend = SQLiteCacheBackend(self.cache_dir / 'test.sqlite3')
+        self.addCleanup(backend.close)
+        with patch('time.time', side_effect=count(time.time() + 1000)):
+            self._check_eviction(backend)
+
+    def test_cache_statistics(self) -> None:
+        """Test hit and miss counters of CachedRequest."""
+        backend = self._roundtrip('pickle')
+        self.assertEqual(backend.stats['misses'], 1)
+        self.assertEqual(backend.stats['hits'], 1)
+        self.assertEqual(backend.stats['writes'], 1)
+
+    def test_unknown_backend(self) -> None:
+        """Test an invalid backend name."""
+        with patch.object(pywikibot.config, 'API_cache_backend', 'foo'), \
+                self.assertRaisesRegex(ValueError,
+                                       "Unknown API cache backend 'foo'"):
+            CachedRequest._get_cache_backend()
+
+
 class MockCachedRequestKeyTests(TestCase):
 
     """Test CachedRequest using moke site objects."""
@@ -424,5 +583,80 @@ class QueryGenTests(DefaultDrySiteTestCase):
             q_gen1.request._params.items(), q_gen2.request._params.items())
 
 
+class AsyncRequestTests(DefaultDrySiteTestCase):
+
+    """Test asyncio entry points of requests and generators."""
+
+    def test_asubmit(self) -> None:
+        """Test Request.asubmit and APISite.asubmit."""
+        def submit(req):
+            time.sleep(0.01)
+            return {'title': req['titles'][0]}
+
+        async def main():
+            requests = [Request(site=self.site,
+                                parameters={'action': 'query',
+                                            'titles': f'Page {i}'})
+                        for i in range(10)]
+            results = await asyncio.gather(
+                *(req.asubmit() for req in requests))
+            site_result = await self.site.asubmit(action='query',
+                                                  titles='Foo')
+            return results, site_result
+
+        with patch.object(Request, 'submit', autospec=True,
+                          side_effect=submit) as mock:
+            results, site_result = asyncio.run(main())
+
+        self.assertEqual(results, [{'title': f'Page {i}'} for i in range(10)])
+        self.assertEqual(site_result, {'title': 'Foo'})
+        self.assertEqual(mock.call_count, 11)
+
+    def test_async_workers(self) -> None:
+        """Test the size of the asyncio thread pool."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def submit(req):
+            with lock:
+                running.append(req)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(req)
+            return {}
+
+        async def main():
+            requests = [Request(site=self.site,
+                                parameters={'action': 'query'})
+                        for i in range(12)]
+            await asyncio.gather(*(req.asubmit() for req in requests))
+
+        for workers in (2, 6):
+            peak.clear()
+            with self.subTest(workers=workers), \
+                    patch.object(pywikibot.config, 'API_async_workers',
+                                 workers), \
+                    patch.object(Request, 'submit', autospec=True,
+                                 side_effect=submit):
+                asyncio.run(main())
+                self.assertEqual(max(peak), workers)
+
+    def test_async_iteration(self) -> None:
+        """Test async iteration of a QueryGenerator."""
+        gen = QueryGenerator(site=self.site,
+                             parameters={'action': 'query', 'list': 'foo'})
+        data = {'query': {'foo': [{'bar': i} for i in range(5)]}}
+
+        async def main():
+            return [item async for item in gen]
+
+        with patch.object(type(gen.request), 'submit', return_value=data):
+            items = asyncio.run(main())
+
+        self.assertEqual(items, [{'bar': i} for i in range(5)])
+
+
 if __name__ == '__main__':
     unittest.main()
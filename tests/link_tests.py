@@ -9,15 +9,21 @@ from __future__ import annotations
 
 import re
 from contextlib import suppress
+from unittest.mock import PropertyMock, patch
 
 import pywikibot
 from pywikibot import Site, config
-from pywikibot.exceptions import InvalidTitleError, SiteDefinitionError
-from pywikibot.page import Link, Page, SiteLink
+from pywikibot.exceptions import (
+    InvalidTitleError,
+    SectionError,
+    SiteDefinitionError,
+)
+from pywikibot.page import Link, LinkTable, Page, SiteLink
 from pywikibot.site import Namespace
 from tests.aspects import (
     AlteredDefaultSiteTestCase,
     DefaultDrySiteTestCase,
+    DrySimpleRequestTestCase,
     TestCase,
     WikimediaDefaultSiteTestCase,
     unittest,
@@ -888,6 +894,96 @@ class TestForeignInterwikiLinks(WikimediaDefaultSiteTestCase):
         self.assertFalse(link._is_interwiki)
 
 
+class TestLinkTable(DrySimpleRequestTestCase):
+
+    """Test LinkTable extraction and batch resolution."""
+
+    text = ('[[foo]] [[Foo|x]] [[Foo#s]] <!--[[Hidden]]--> '
+            '<nowiki>[[No]]</nowiki> [[File:A.jpg|thumb|see [[bar baz]]]] '
+            '[[:File:B.jpg]] [[Category:C]] [[Special:Random]] [[#sec]] '
+            '[[a<b]] [[Redirect]] [[Double]]')
+
+    def submit(self, **params):
+        """Return query results for the titles of a request."""
+        pages, redirects = {}, []
+        for i, title in enumerate(params['titles'], start=1):
+            data = {'ns': 0, 'title': title, 'pageid': i}
+            if title == 'Bar baz':
+                data = {'ns': 0, 'title': title, 'missing': ''}
+            elif title == 'Sectioned' and 'redirects' in params:
+                redirects.append({'from': title, 'to': 'Target',
+                                  'tofragment': 'Missing'})
+                continue
+            elif title in ('Redirect', 'Double') and 'redirects' in params:
+                redirects.append({'from': title, 'to': 'Target'
+                                  if title == 'Redirect' else 'Redirect'})
+                continue
+            elif title in ('Redirect', 'Double', 'Sectioned'):
+                data['redirect'] = ''
+            pages[str(i)] = data
+        if redirects:
+            pages['-1'] = {'ns': 0, 'title': 'Target', 'pageid': 99}
+        return {'query': {'pages': pages, 'redirects': redirects}}
+
+    def setUp(self) -> None:
+        """Patch maxlimit of the dry site."""
+        super().setUp()
+        patcher = patch.object(type(self.site), 'maxlimit',
+                               PropertyMock(return_value=3))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_extract(self) -> None:
+        """Test that links are extracted and parsed once."""
+        table = LinkTable(self.site)
+        page = Page(self.site, 'Source')
+        linked = table.add(page, self.text)
+        self.assertEqual([p.title() for p in linked],
+                         ['Foo', 'Bar baz', 'File:B.jpg', 'Redirect',
+                          'Double'])
+        self.assertEqual(table.links, {page: linked})
+        other = table.add(Page(self.site, 'Other'), '[[Bar_baz]] [[foo]]')
+        self.assertIs(other[0], linked[1])
+        self.assertIs(other[1], linked[0])
+        self.assertLength(table.pages, 5)
+
+    def test_resolve(self) -> None:
+        """Test that linked pages are resolved in batches."""
+        table = LinkTable(self.site)
+        linked = table.add(Page(self.site, 'Source'), self.text)
+        table.resolve()
+        self.assertEqual([len(r['titles']) for r in self.requests],
+                         [3, 2, 2])
+        self.assertEqual(self.requests[-1]['titles'], ['Redirect', 'Double'])
+        foo, missing, file, redirect, double = linked
+        self.assertTrue(foo.exists())
+        self.assertFalse(foo.isRedirectPage())
+        self.assertFalse(missing.exists())
+        self.assertTrue(redirect.isRedirectPage())
+        target = redirect.getRedirectTarget()
+        self.assertEqual(target, Page(self.site, 'Target'))
+        self.assertTrue(target.exists())
+        self.assertTrue(double.isRedirectPage())
+        self.assertFalse(hasattr(double, '_redirtarget'))
+
+        table.resolve()
+        self.assertLength(self.requests, 3)
+
+    def test_resolve_section(self) -> None:
+        """Test that the section of a preloaded target is checked."""
+        table = LinkTable(self.site)
+        redirect, = table.add(Page(self.site, 'Source'), '[[Sectioned]]')
+        table.resolve()
+        target = redirect.getRedirectTarget()
+        self.assertEqual(target.title(), 'Target#Missing')
+        with patch.object(Page, 'text', PropertyMock(
+                side_effect=SectionError('Missing'))) as text:
+            self.assertIs(redirect.getRedirectTarget(), target)
+            text.assert_not_called()
+            with self.assertRaises(SectionError):
+                redirect.getRedirectTarget(ignore_section=False)
+
+
 class TestSiteLink(WikimediaDefaultSiteTestCase):
 
     """Test parsing namespaces when creating SiteLinks."""
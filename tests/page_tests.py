@@ -16,7 +16,7 @@ from unittest import mock
 
 import pywikibot
 import pywikibot.page
-from pywikibot import config
+from pywikibot import config, textlib
 from pywikibot.exceptions import (
     APIError,
     ApiTimeoutError,
@@ -691,6 +691,36 @@ class TestPageGetFileHistory(DefaultDrySiteTestCase):
             self.site.loadimageinfo.assert_called_once_with(page, history=True)
 
 
+class TestPageTextParseCache(DefaultDrySiteTestCase):
+
+    """Test that changing the page text invalidates parse results."""
+
+    def test_invalidate(self) -> None:
+        """Test that deleting the text removes its parse results."""
+        page = pywikibot.Page(self.site, 'Foo')
+        page._text = '{{Foo|bar}}'
+        self.assertEqual(page.raw_extracted_templates,
+                         [('Foo', {'1': 'bar'})])
+        key = textlib._text_key(page.text)
+        self.assertTrue(any(k[2] == key for k in textlib._parse_cache))
+        del page.text
+        self.assertFalse(any(k[2] == key for k in textlib._parse_cache))
+
+    def test_section_index(self) -> None:
+        """Test that the section index follows the page text."""
+        page = pywikibot.Page(self.site, 'Foo')
+        page._text = '== A ==\nfoo\n== B ==\nbar\n'
+        index = page.section_index
+        self.assertIs(page.section_index, index)
+        page.text = index.replace(0, '\nbaz\n== C ==\n')
+        self.assertIs(page.section_index, index)
+        self.assertEqual([s.heading for s in index.sections],
+                         ['A', 'C', 'B'])
+        page.text = '== D ==\n'
+        self.assertIsNot(page.section_index, index)
+        self.assertEqual(page.section_index.sections[0].heading, 'D')
+
+
 class TestPageRepr(DefaultDrySiteTestCase):
 
     """Test for Page's repr implementation."""
@@ -15,6 +15,7 @@ from unittest import mock
 
 import pywikibot
 from pywikibot import date, pagegenerators
+from pywikibot.data import api
 from pywikibot.exceptions import (
     NoPageError,
     ServerError,
@@ -817,6 +818,54 @@ class DryFactoryGeneratorTest(TestCase):
         self.assertFalse(gf.handle_arg('-ì'))
         self.assertFalse(gf.handle_arg('ì'))
 
+    def _redirect_filter_gens(self):
+        """Return a site and generators with and without filterredir."""
+        site = self.get_site()
+        site._paraminfo['query+allpages'] = {
+            'prefix': 'ap',
+            'limit': {'max': 10},
+            'filterredir': {'type': ['all', 'redirects', 'nonredirects']},
+        }
+        site._paraminfo['query+links'] = {'prefix': 'pl'}
+        allpages = api.PageGenerator(site=site, generator='allpages')
+        links = api.PageGenerator(site=site, generator='links',
+                                  parameters={'titles': 'test'})
+        return site, allpages, links
+
+    def test_redirect_filter_pushdown(self) -> None:
+        """Test redirect filter is pushed down into API parameters."""
+        site, allpages, _ = self._redirect_filter_gens()
+        self.assertTrue(allpages.support_redirect_filter())
+        gf = pagegenerators.GeneratorFactory(site=site)
+        gf.handle_arg('-redirect:false')
+        gen = gf.getCombinedGenerator(allpages)
+        self.assertIs(gen, allpages)
+        self.assertEqual(allpages.request['gapfilterredir'],
+                         ['nonredirects'])
+        allpages.set_redirect_filter(None)
+        self.assertNotIn('gapfilterredir', allpages.request)
+
+    def test_redirect_filter_client_side(self) -> None:
+        """Test redirect filter without API support or with conflict."""
+        site, allpages, links = self._redirect_filter_gens()
+        self.assertFalse(links.support_redirect_filter())
+        with self.assertRaises(TypeError):
+            links.set_redirect_filter(True)
+
+        gf = pagegenerators.GeneratorFactory(site=site)
+        gf.handle_arg('-redirect:true')
+        gen = gf.getCombinedGenerator(links)
+        self.assertIsNot(gen, links)
+
+        # an existing restriction is not overwritten
+        allpages.set_redirect_filter(False)
+        gf = pagegenerators.GeneratorFactory(site=site)
+        gf.handle_arg('-redirect:true')
+        gen = gf.getCombinedGenerator(allpages)
+        self.assertIsNot(gen, allpages)
+        self.assertEqual(allpages.request['gapfilterredir'],
+                         ['nonredirects'])
+
 
 class TestItemClaimFilterPageGenerator(WikidataTestCase):
 
@@ -7,13 +7,17 @@
 """Tests for the replace script and ReplaceRobot class."""
 from __future__ import annotations
 
+import pickle
+import re
 import unittest
 from contextlib import suppress
 
 import pywikibot
-from pywikibot import fixes
+from pywikibot import fixes, xmlreader
+from pywikibot.tools import suppress_warnings
 from scripts import replace
-from tests import join_data_path
+from tests import join_data_path, join_xml_data_path
+from tests.aspects import DefaultDrySiteTestCase
 from tests.bot_tests import TWNBotTestCase
 from tests.utils import empty_sites
 
@@ -331,6 +335,101 @@ class TestReplacementsMain(TWNBotTestCase):
             ])
 
 
+class TestReplacementSet(DefaultDrySiteTestCase):
+
+    """Test batched candidate search of replacements."""
+
+    @staticmethod
+    def _replacements(*rules, use_regex=True):
+        """Return compiled replacements."""
+        replacements = []
+        for old, new in rules:
+            replacement = replace.Replacement(old, new)
+            replacement.compile(use_regex, 0)
+            replacements.append(replacement)
+        return replacements
+
+    def test_literals(self) -> None:
+        """Test which rules are merged as literals."""
+        replacements = self._replacements(
+            ('colour', 'color'), (r'(?i)\bHarbour\b', 'harbor'),
+            (r'(a)\1', 'a'), (r'c\w+r', 'cr'), (r'(?x) a b', 'ab'),
+            (r'(?i)straße', 'strasse'), (r'\[\[x\]\]', 'x'),
+            (r'a\bb', 'ab'))
+        rules = replace.ReplacementSet(replacements)
+        self.assertEqual(rules.unbatched, {2, 3, 4, 5, 7})
+        self.assertEqual([literals for _, _, literals, _ in rules.scanners],
+                         [{'colour': [0], '[[x]]': [6]}, {'harbour': [1]}])
+
+        replacements = self._replacements(('a.b', 'ab'), use_regex=False)
+        rules = replace.ReplacementSet(replacements)
+        self.assertEqual(rules.scanners[0][2], {'a.b': [0]})
+
+    def test_candidates(self) -> None:
+        """Test that candidates include all matching rules."""
+        replacements = self._replacements(
+            ('col', 'kol'), ('colour', 'color'), (r'c\w+r', 'cr'),
+            (r'(?i)harbour', 'harbor'), (r'\bteh\b', 'the'),
+            (r'(?i)\bsin\b', 'sine'), ('lou', 'low'), ('colour', 'hue'))
+        rules = replace.ReplacementSet(replacements)
+        for text in ('colour HARBOUR teh', 'cr color', 'tehx', '',
+                     'SİN ſin', 'harbour col'):
+            with self.subTest(text=text):
+                expected = {i for i, r in enumerate(replacements)
+                            if r.old_regex.search(text)}
+                candidates = rules.candidates(text)
+                self.assertLessEqual(expected, candidates)
+                self.assertLessEqual(candidates - expected, {2, 4})
+                self.assertEqual(rules.candidates(text, start=3),
+                                 {i for i in candidates if i >= 3})
+
+    def test_apply_replacements(self) -> None:
+        """Test that subsequent rules see the replaced text."""
+        replacements = self._replacements(
+            ('colour', 'color'), ('color', 'hue'), ('hue', 'tone'),
+            ('blue', 'red'), use_regex=False)
+        bot = replace.ReplaceRobot([], replacements,
+                                   {'inside-tags': ['comment']},
+                                   site=self.site)
+        page = pywikibot.Page(self.site, 'Foo')
+        applied = set()
+        self.assertEqual(
+            bot.apply_replacements('colour <!--colour-->', applied, page),
+            'tone <!--colour-->')
+        self.assertEqual(applied, set(replacements[:3]))
+
+
+class TestXmlDumpReplacePageGenerator(DefaultDrySiteTestCase):
+
+    """Test XmlDumpReplacePageGenerator."""
+
+    def test_processes(self) -> None:
+        """Test that worker processes find the same pages."""
+        filename = join_xml_data_path('pair-0.10.xml')
+        replacements = TestReplacementSet._replacements(('Quzanlı', 'Q'))
+        exceptions = {'title': [re.compile('Talk')],
+                      'inside-tags': ['comment']}
+        for processes in (None, 2):
+            with self.subTest(processes=processes), suppress_warnings(
+                    r".+'allrevisions' is deprecated since release 9\.0\.0"):
+                gen = replace.XmlDumpReplacePageGenerator(
+                    filename, None, replacements, exceptions, self.site,
+                    processes=processes)
+                self.assertEqual([page.title() for page in gen],
+                                 ['Çullu, Agdam'])
+
+        # a worker process has no site
+        worker = pickle.loads(pickle.dumps(gen))
+        self.assertIsNone(worker.site)
+        entry, talk = xmlreader.XmlDump(filename, revisions='latest').parse()
+        self.assertEqual(worker._scan(entry), ('Çullu, Agdam', True))
+        self.assertIsNone(worker._scan(talk))
+        entry.text = '<!-- Quzanlı -->'
+        self.assertIsNone(worker._scan(entry))
+        worker.xmlStart = 'Çullu, Agdam'
+        self.assertEqual(worker._scan(entry), ('Çullu, Agdam', False))
+
+
 if __name__ == '__main__':
     with suppress(SystemExit):
         unittest.main()
@@ -7,9 +7,11 @@
 """Tests for generators of the site module."""
 from __future__ import annotations
 
+import random
+import time
 import unittest
 from contextlib import suppress
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 import pywikibot
 from pywikibot.data import api
@@ -23,7 +25,12 @@ from pywikibot.exceptions import (
 )
 from pywikibot.tools import suppress_warnings
 from tests import WARN_SITE_CODE, unittest_print
-from tests.aspects import DefaultSiteTestCase, DeprecationTestCase, TestCase
+from tests.aspects import (
+    DefaultDrySiteTestCase,
+    DefaultSiteTestCase,
+    DeprecationTestCase,
+    TestCase,
+)
 from tests.utils import expected_failure_if, skipping
 
 
@@ -2031,6 +2038,16 @@ class TestPagePreloading(DefaultSiteTestCase):
         pages = list(self.site.preloadpages(links, groupsize=5))
         self.assertEqual(pages, links)
 
+    def test_order_workers(self) -> None:
+        """Test concurrent preloading follows the same order of input."""
+        mainpage = self.get_mainpage()
+        links = [page for page in self.site.pagelinks(mainpage, total=20)
+                 if page.exists()]
+        pages = list(self.site.preloadpages(links, groupsize=3, workers=3))
+        self.assertEqual(pages, links)
+        for page in pages:
+            self.assertHasAttr(page, '_revid')
+
     def test_duplicates(self) -> None:
         """Test outcome is following same order of input."""
         mainpage = self.get_mainpage()
@@ -2328,6 +2345,56 @@ class TestPagePreloading(DefaultSiteTestCase):
         self.assertTrue(page.has_content())
 
 
+class TestPagePreloadingWorkersDry(DefaultDrySiteTestCase):
+
+    """Test site.preloadpages() with concurrent workers."""
+
+    class FakePropertyGenerator:
+
+        """Yield page data in reversed order after a random delay."""
+
+        def __init__(self, props, site) -> None:
+            self.props = props.split('|')
+            self.request = {}
+
+        def set_maximum_items(self, value) -> None:
+            pass
+
+        def __iter__(self):
+            time.sleep(random.random() / 50)
+            for title in reversed(self.request['titles']):
+                yield {'title': title}
+
+    def setUp(self) -> None:
+        """Patch maxlimit of the dry site."""
+        super().setUp()
+        patcher = patch.object(type(self.site), 'maxlimit',
+                               new_callable=PropertyMock, return_value=50)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(api, 'update_page')
+    @patch.object(api, 'PropertyGenerator', FakePropertyGenerator)
+    def test_order(self, update_page) -> None:
+        """Test pages are yielded in input order."""
+        pages = [pywikibot.Page(self.site, f'Page {i}') for i in range(20)]
+        for workers in (None, 1, 3, 10):
+            with self.subTest(workers=workers):
+                preloaded = list(self.site.preloadpages(
+                    pages, groupsize=3, workers=workers))
+                self.assertEqual(preloaded, pages)
+
+    @patch.object(api, 'update_page')
+    @patch.object(api, 'PropertyGenerator', FakePropertyGenerator)
+    def test_close(self, update_page) -> None:
+        """Test pending batches are cancelled if the generator is closed."""
+        pages = [pywikibot.Page(self.site, f'Page {i}') for i in range(30)]
+        gen = self.site.preloadpages(pages, groupsize=3, workers=2)
+        self.assertEqual(next(gen), pages[0])
+        gen.close()
+        self.assertLessEqual(update_page.call_count, 9)
+
+
 if __name__ == '__main__':
     with suppress(SystemExit):
         unittest.main()
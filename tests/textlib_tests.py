@@ -538,6 +538,72 @@ class TestTemplateParams(TestCase):
         self._common_results(func)
         self._stripped(func)
 
+    def test_parse_cache(self) -> None:
+        """Test that the same text is parsed only once."""
+        text = '{{a|b=c}} {{d|e}}<!-- {{f}} -->'
+        textlib.clear_parse_cache()
+        parse = textlib.wikitextparser.parse
+        with mock.patch.object(textlib.wikitextparser, 'parse',
+                               side_effect=parse) as mocked:
+            tree = textlib.parse_wikitext(text)
+            self.assertIs(textlib.parse_wikitext(text), tree)
+            result = textlib.extract_templates_and_params(text)
+            self.assertEqual(mocked.call_count, 1)
+
+            # the result is a copy
+            result[0][1]['b'] = 'x'
+            self.assertEqual(textlib.extract_templates_and_params(text),
+                             [('a', OrderedDict(b='c')),
+                              ('d', OrderedDict([('1', 'e')]))])
+            self.assertEqual(mocked.call_count, 1)
+
+            textlib.extract_templates_and_params(text, strip=True)
+            self.assertEqual(mocked.call_count, 1)
+            textlib.extract_templates_and_params(text, True)
+            self.assertEqual(mocked.call_count, 2)
+
+            textlib.clear_parse_cache(text)
+            self.assertIsNot(textlib.parse_wikitext(text), tree)
+            self.assertEqual(mocked.call_count, 3)
+
+    def test_parse_cache_size(self) -> None:
+        """Test that the parse cache is bounded."""
+        textlib.clear_parse_cache()
+        with mock.patch.object(textlib, 'PARSE_CACHE_SIZE', 2):
+            first = textlib.parse_wikitext('{{a}}')
+            textlib.parse_wikitext('{{b}}')
+            self.assertIs(textlib.parse_wikitext('{{a}}'), first)
+            textlib.parse_wikitext('{{c}}')
+            self.assertIs(textlib.parse_wikitext('{{a}}'), first)
+            self.assertLength(textlib._parse_cache, 2)
+            self.assertNotIn(
+                ('tree', textlib.wikitextparser.__name__,
+                 textlib._text_key('{{b}}')), textlib._parse_cache)
+
+    def test_parse_cache_length(self) -> None:
+        """Test that the parse cache is bounded by the text length."""
+        textlib.clear_parse_cache()
+        with mock.patch.object(textlib, 'PARSE_CACHE_MAX_LENGTH', 12):
+            first = textlib.parse_wikitext('{{a}}')
+            textlib.parse_wikitext('{{bb}}')
+            self.assertIs(textlib.parse_wikitext('{{a}}'), first)
+            self.assertEqual(textlib._parse_cache.length, 11)
+            textlib.parse_wikitext('{{c}}')
+            self.assertLength(textlib._parse_cache, 2)
+            self.assertEqual(textlib._parse_cache.length, 10)
+            self.assertIs(textlib.parse_wikitext('{{a}}'), first)
+
+            # a longer text is not cached
+            long_text = '{{' + 'd' * 20 + '}}'
+            tree = textlib.parse_wikitext(long_text)
+            self.assertIsNot(textlib.parse_wikitext(long_text), tree)
+            self.assertLength(textlib._parse_cache, 2)
+
+            textlib.clear_parse_cache('{{a}}')
+            self.assertEqual(textlib._parse_cache.length, 5)
+        textlib.clear_parse_cache()
+        self.assertEqual(textlib._parse_cache.length, 0)
+
     def test_template_simple_regex(self) -> None:
         """Test using simple regex."""
         func = textlib.extract_templates_and_params_regex_simple
@@ -1436,6 +1502,181 @@ class TestReplaceExcept(DefaultDrySiteTestCase):
             r'X\g<bar>X')
 
 
+class CountingRegex:
+
+    """Regex wrapper which counts its searches."""
+
+    def __init__(self, regex: re.Pattern[str]) -> None:
+        """Initializer."""
+        self.regex = regex
+        self.pattern = regex.pattern
+        self.flags = regex.flags
+        self.searches = 0
+
+    def search(self, text: str, pos: int = 0) -> re.Match[str] | None:
+        """Search the wrapped regex."""
+        self.searches += 1
+        return self.regex.search(text, pos)
+
+
+class TestExceptionSpans(DefaultDrySiteTestCase):
+
+    """Test the ExceptionSpans replacement index."""
+
+    def test_search(self) -> None:
+        """Test that search results are reused for later positions."""
+        spans = textlib.ExceptionSpans('a <!--b--> c <!--d-->',
+                                       site=self.site)
+        regex = textlib.get_regexes('comment', self.site)[0]
+        self.assertEqual(spans.search(regex), (2, 10))
+        self.assertEqual(spans.search(regex, 2), (2, 10))
+        self.assertEqual(spans._found[regex], ([0], [(2, 10)]))
+        self.assertEqual(spans.search(regex, 3), (13, 21))
+        self.assertEqual(spans._found[regex][0], [0, 3])
+        self.assertIsNone(spans.search(regex, 14))
+        self.assertIsNone(spans.search(regex, 20))
+        self.assertEqual(spans._found[regex][0], [0, 3, 14])
+        self.assertEqual(spans.next_exception(['comment', 'link'], 11),
+                         (13, 21))
+
+    def test_replace(self) -> None:
+        """Test subsequent replacements sharing the search results."""
+        spans = textlib.ExceptionSpans('x <!--x--> [[x]] x', site=self.site)
+        self.assertEqual(spans.replace('<', '<', ['comment', 'link']),
+                         'x <!--x--> [[x]] x')
+        self.assertLength(spans._found, 2)
+        self.assertEqual(spans.replace('x', 'y', ['comment']),
+                         'y <!--x--> [[y]] y')
+        self.assertEqual(spans.replace('y', 'z', ['comment', 'link'],
+                                       marker='.', count=1),
+                         'z. <!--x--> [[y]] y')
+        self.assertEqual(spans.text, 'z. <!--x--> [[y]] y')
+
+    def test_text_setter(self) -> None:
+        """Test that results behind a changed part are shifted."""
+        spans = textlib.ExceptionSpans('a <!--b--> c <!--d-->',
+                                       site=self.site)
+        regex = textlib.get_regexes('comment', self.site)[0]
+        for index in (0, 3, 14):
+            spans.search(regex, index)
+        spans.text = 'a <!--b--> c <!--d-->'
+        self.assertEqual(spans._found[regex][0], [0, 3, 14])
+
+        spans.text = 'aaa <!--b--> c <!--d-->'
+        self.assertEqual(spans._found[regex], ([5, 16], [(15, 23), None]))
+        self.assertEqual(spans.search(regex, 4), (4, 12))
+
+        # searches before a change may have read the changed part
+        spans.text = 'aaa <!--b--> c <!--d-->\n'
+        self.assertEqual(spans._found[regex], ([], []))
+        self.assertEqual(spans.next_exception(['comment'], 5), (15, 23))
+
+        # a word boundary reads one character before the position
+        spans = textlib.ExceptionSpans('ab', site=self.site)
+        boundary = re.compile(r'\bb')
+        self.assertIsNone(spans.search(boundary, 1))
+        self.assertIsNone(spans.search(regex, 1))
+        spans.text = ' b'
+        self.assertEqual(spans._found[regex], ([1], [None]))
+        self.assertEqual(spans._found[boundary], ([], []))
+        self.assertEqual(spans.search(boundary, 1), (1, 2))
+
+    def test_rewritten_text(self) -> None:
+        """Test that matches are searched in the rewritten text."""
+        for args, kwargs, result in (
+            (('aaaa', r'\ba', '', []), {'count': 2}, 'aa'),
+            (('aaa', '(?<=a)a', 'b', []), {}, 'aba'),
+            (('b<!--a-->', 'b<|a', 'c', ['comment']), {}, 'c!--c-->'),
+            (('b', 'b', '<!--', [], ), {'allowoverlap': True}, '<!--'),
+            (('xab', '[xb]', ' ', [re.compile(r'\ba.')]), {}, ' ab'),
+            (('xab', '[xb]', 'y', [re.compile(r'\ba.')]), {}, 'yay'),
+            (('a\n=b=', 'a\n', '\n', ['header']), {}, '\n=b='),
+            (('a=b=', 'a', '\n', ['header']), {}, '\n=b='),
+        ):
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(textlib.replaceExcept(
+                    *args, site=self.site, **kwargs), result)
+                spans = textlib.ExceptionSpans(args[0], site=self.site)
+                self.assertEqual(spans.replace(*args[1:], **kwargs),
+                                 result)
+
+    def test_search_count(self) -> None:
+        """Test that exceptions are searched once per match."""
+        comment = textlib.get_regexes('comment')[0]
+        for text, searches in (('colour <!--colour--> ' * 5000, 5001),
+                               ('colour ' * 5000 + '<!--colour-->', 1)):
+            with self.subTest(text=text[:20], searches=searches):
+                regex = CountingRegex(comment)
+                spans = textlib.ExceptionSpans(text, site=self.site)
+                result = spans.replace('colour', 'color', [regex])
+                self.assertEqual(result.count('color '), 5000)
+                self.assertLessEqual(regex.searches, searches)
+
+                regex = CountingRegex(comment)
+                with mock.patch.object(textlib, 'get_combined_regex',
+                                  return_value=regex):
+                    self.assertEqual(textlib.replaceExcept(
+                        text, 'colour', 'color', [comment]), result)
+                self.assertLessEqual(regex.searches, searches)
+
+
+class TestGetCombinedRegex(DefaultDrySiteTestCase):
+
+    """Test the get_combined_regex function."""
+
+    def test_search(self) -> None:
+        """Test that the first of the earliest matches is found."""
+        exceptions = ['comment', 'math', 'category', re.compile('(?i)foo'),
+                      re.compile(r'b # verbose', re.VERBOSE)]
+        regex = textlib.get_combined_regex(exceptions, self.site)
+        self.assertIs(textlib.get_combined_regex(exceptions, self.site),
+                      regex)
+        names = ['comment', 'math', 'math_2', 'math_3', 'category',
+                 'regex', 'regex_2']
+        self.assertEqual(list(regex.groupindex)[:len(names)], names)
+        regexes = textlib.get_regexes(exceptions, self.site)
+        text = 'a <!-- <math>x</math> --> FOO [[Category:X]] <ce>b</ce>'
+        for index in range(len(text)):
+            with self.subTest(index=index):
+                matches = [(m.start(), i, m)
+                           for i, r in enumerate(regexes)
+                           if (m := r.search(text, index))]
+                match = regex.search(text, index)
+                if not matches:
+                    self.assertIsNone(match)
+                    continue
+                _, i, expected = min(matches, key=lambda m: m[:2])
+                self.assertEqual(match.span(), expected.span())
+                self.assertEqual(match.lastgroup, names[i])
+
+    def test_not_combined(self) -> None:
+        """Test regexes which cannot be combined."""
+        self.assertIsNone(textlib.get_combined_regex([]))
+        self.assertIsNone(
+            textlib.get_combined_regex(['comment', re.compile(r'(a)\1')]))
+        with self.assertRaisesRegex(ValueError, 'site cannot be None'):
+            textlib.get_combined_regex('category')
+
+    def test_cache_size(self) -> None:
+        """Test that the combined regex cache is bounded."""
+        textlib._combined_regex_cache.clear()
+        with mock.patch.object(textlib, 'COMBINED_REGEX_CACHE_SIZE', 2):
+            first = textlib.get_combined_regex(['comment'])
+            textlib.get_combined_regex([re.compile('a')])
+            self.assertIs(textlib.get_combined_regex(['comment']), first)
+            textlib.get_combined_regex([re.compile('b')])
+            self.assertIs(textlib.get_combined_regex(['comment']), first)
+            self.assertLength(textlib._combined_regex_cache, 2)
+            self.assertNotIn(((re.compile('a'), ), None),
+                             textlib._combined_regex_cache)
+
+    def test_site_key(self) -> None:
+        """Test that site regexes are cached by family and code."""
+        regex = textlib.get_regexes('category', self.site)[0]
+        key = 'category', self.site.family.name, self.site.code
+        self.assertIs(textlib._regex_cache[key], regex)
+
+
 class TestMultiTemplateMatchBuilder(DefaultDrySiteTestCase):
 
     """Test MultiTemplateMatchBuilder."""
@@ -1721,6 +1962,85 @@ class TestExtractSections(DefaultDrySiteTestCase):
             sections.index(header)
 
 
+class TestSectionIndex(DefaultDrySiteTestCase):
+
+    """Test the SectionIndex class."""
+
+    TEXT = ('header\n'
+            '== A ==\n'
+            'foo\n'
+            '<nowiki>\n== N ==\n</nowiki>\n'
+            '=== B ===\n'
+            'bär\n'
+            '== C ==\n'
+            'baz\n'
+            '[[Category:X]]\n')
+
+    def assert_rebuilt(self, index) -> None:
+        """Assert that the index is the same as a new one."""
+        other = textlib.SectionIndex(index.text, self.site)
+        self.assertEqual(index.headings, other.headings)
+        self.assertEqual(index._starts, other._starts)
+        self.assertEqual(index._ends, other._ends)
+        self.assertEqual(index._unclosed, other._unclosed)
+
+    def test_index(self) -> None:
+        """Test headings, spans and sizes."""
+        index = textlib.SectionIndex(self.TEXT, self.site)
+        self.assertLength(index, 3)
+        self.assertEqual([s.heading for s in index.sections], ['A', 'B', 'C'])
+        self.assertEqual([s.level for s in index.sections], [2, 3, 2])
+        self.assertEqual(index.span(0), (7, 46))
+        self.assertEqual(index.span(-1), (index.headings[2].start,
+                                          len(self.TEXT)))
+        self.assertEqual(index.size(1), len('=== B ===\nbär\n') + 1)
+        self.assertEqual(index.content(),
+                         extract_sections(self.TEXT, self.site))
+        with self.assertRaises(IndexError):
+            index.span(3)
+
+    def test_disabled_order(self) -> None:
+        """Test that disabled parts are removed like removeDisabledParts."""
+        text = '<pre><nowiki></pre>\n== A ==\n</nowiki>\n== B ==\n'
+        index = textlib.SectionIndex(text, self.site)
+        self.assertTrue(textlib.isDisabled(text, text.index('A')))
+        self.assertEqual([s.heading for s in index.sections], ['B'])
+        index.replace(0, '\n<nowiki/>\n')
+        self.assert_rebuilt(index)
+
+    def test_replace(self) -> None:
+        """Test replacing the content of a section."""
+        index = textlib.SectionIndex(self.TEXT, self.site)
+        text = index.replace(1, '\n<pre>\n== P ==\n</pre>\n== D ==\nx\n')
+        self.assertEqual(index.text, text)
+        self.assertEqual(text, self.TEXT.replace(
+            'bär', '<pre>\n== P ==\n</pre>\n== D ==\nx'))
+        self.assertEqual([s.heading for s in index.sections],
+                         ['A', 'B', 'D', 'C'])
+        self.assert_rebuilt(index)
+        self.assertEqual(index.content(), extract_sections(text, self.site))
+
+        index.replace(2, '\n')
+        self.assertEqual([s.heading for s in index.sections],
+                         ['A', 'B', 'D', 'C'])
+        self.assert_rebuilt(index)
+
+    def test_replace_rebuild(self) -> None:
+        """Test replacements which affect other sections."""
+        tests = [
+            '\n<!--\n',  # unclosed comment disables following sections
+            '\nfoo',  # next heading is no longer at line start
+            '\n<nowiki>',  # unclosed tag
+            '\n<!-- comment -->\n== E ==\n',
+            '\n== E ==\n== F ==\n',
+        ]
+        for content in tests:
+            with self.subTest(content=content):
+                index = textlib.SectionIndex(self.TEXT, self.site)
+                index.replace(0, content)
+                self.assert_rebuilt(index)
+
+
 if __name__ == '__main__':
     with suppress(SystemExit):
         unittest.main()
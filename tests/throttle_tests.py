@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Tests for the throttle module."""
+from __future__ import annotations
+
+import datetime
+import tempfile
+import unittest
+from contextlib import suppress
+from pathlib import Path
+from unittest import mock
+
+from pywikibot import config
+from pywikibot.exceptions import ServerError
+from pywikibot.throttle import (
+    THROTTLE_BACKENDS,
+    SharedThrottle,
+    Throttle,
+    TokenBucket,
+)
+from tests.aspects import DefaultDrySiteTestCase, TestCase
+
+
+class TokenBucketTests(TestCase):
+
+    """Test the shared token bucket."""
+
+    net = False
+
+    def setUp(self) -> None:
+        """Create a bucket in a temporary directory."""
+        super().setUp()
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = str(Path(self._tmpdir.name, 'throttle.sqlite3'))
+        self.bucket = TokenBucket(self.path)
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self._tmpdir.cleanup()
+        super().tearDown()
+
+    def test_reserve(self) -> None:
+        """Test that reservations are spaced by the interval."""
+        with mock.patch('time.time', return_value=1000.0):
+            waits = [self.bucket.reserve('site|read', 2) for _ in range(3)]
+            self.assertEqual(waits, [0.0, 2.0, 4.0])
+            # another bucket is independent
+            self.assertEqual(self.bucket.reserve('site|write', 10), 0.0)
+
+        # a second instance shares the state like another process does
+        other = TokenBucket(self.path)
+        with mock.patch('time.time', return_value=1001.0):
+            self.assertEqual(other.reserve('site|read', 2), 5.0)
+        with mock.patch('time.time', return_value=1100.0):
+            self.assertEqual(other.reserve('site|read', 2), 0.0)
+
+    def test_capacity(self) -> None:
+        """Test burst capacity of an idle bucket."""
+        with mock.patch('time.time', return_value=1000.0):
+            waits = [self.bucket.reserve('key', 1, capacity=3)
+                     for _ in range(4)]
+        self.assertEqual(waits, [0.0, 0.0, 0.0, 1.0])
+
+    def test_block(self) -> None:
+        """Test blocking a bucket."""
+        with mock.patch('time.time', return_value=1000.0):
+            self.bucket.block('key', 30)
+            self.assertEqual(self.bucket.reserve('key', 1), 30.0)
+            self.assertEqual(self.bucket.reserve('key', 1), 31.0)
+        self.bucket.clear()
+        self.assertEqual(self.bucket.reserve('key', 1), 0.0)
+
+
+class SharedThrottleTests(DefaultDrySiteTestCase):
+
+    """Test SharedThrottle with a dry site."""
+
+    def setUp(self) -> None:
+        """Use a temporary database file."""
+        super().setUp()
+        self._tmpdir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(
+            SharedThrottle, 'bucket_filename',
+            str(Path(self._tmpdir.name, 'throttle.sqlite3')))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self._tmpdir.cleanup()
+        super().tearDown()
+
+    def test_shared_budget(self) -> None:
+        """Test two throttles share the request rate of a site."""
+        site = self.get_site()
+        first = SharedThrottle(site, mindelay=1, writedelay=5)
+        second = SharedThrottle(site, mindelay=1, writedelay=5)
+        self.assertEqual(second.process_multiplicity, 1)
+        self.assertEqual(first.get_delay(), 1)
+
+        with mock.patch('time.time', return_value=1000.0), \
+                mock.patch.object(Throttle, 'wait') as wait:
+            first()
+            second()
+            first()
+            second(write=True)
+        self.assertEqual([call.args[0] for call in wait.call_args_list],
+                         [0.0, 1.0, 2.0, 0.0])
+
+    def test_lag(self) -> None:
+        """Test lag blocks the shared buckets."""
+        site = self.get_site()
+        throttle = SharedThrottle(site, mindelay=1)
+        with mock.patch('time.time', return_value=1000.0), \
+                mock.patch.object(Throttle, 'wait') as wait:
+            throttle.lag(10)
+            self.assertEqual(wait.call_args.args[0], 10)
+            SharedThrottle(site, mindelay=1)()
+            self.assertEqual(wait.call_args.args[0], 10.0)
+
+    def test_backend_selection(self) -> None:
+        """Test site throttle class selection."""
+        self.assertEqual(set(THROTTLE_BACKENDS), {'file', 'sqlite'})
+        site = self.get_site()
+        with mock.patch.object(config, 'throttle_backend', 'sqlite'):
+            self.assertIsInstance(type(site).throttle.fget.__wrapped__(site),
+                                  SharedThrottle)
+        with mock.patch.object(config, 'throttle_backend', 'unknown'), \
+                self.assertRaisesRegex(ValueError, 'Unknown throttle'):
+            type(site).throttle.fget.__wrapped__(site)
+
+
+class AdaptiveThrottleTests(DefaultDrySiteTestCase):
+
+    """Test adaptive mode of Throttle."""
+
+    def setUp(self) -> None:
+        """Create an adaptive throttle."""
+        super().setUp()
+        self.throttle = Throttle(self.get_site(), mindelay=0.5, maxdelay=8)
+        self.throttle.adaptive = True
+
+    def test_disabled(self) -> None:
+        """Test that nothing changes if adaptive mode is disabled."""
+        self.throttle.adaptive = False
+        self.throttle.adapt(10, congested=True)
+        self.assertEqual(self.throttle.delay, 0.5)
+        self.assertIsNone(self.throttle.latency)
+
+    def test_aimd(self) -> None:
+        """Test multiplicative decrease and additive increase."""
+        self.throttle.adapt(congested=True)
+        self.assertEqual(self.throttle.delay, 1.0)
+        self.throttle.adapt(congested=True)
+        self.assertEqual(self.throttle.delay, 2.0)
+        self.throttle.adapt(0.1)
+        self.assertAlmostEqual(self.throttle.delay, 1 / 0.55)
+        for _ in range(100):
+            self.throttle.adapt(0.1)
+        self.assertEqual(self.throttle.delay, 0.5)
+        for _ in range(10):
+            self.throttle.adapt(congested=True)
+        self.assertEqual(self.throttle.delay, 8)
+
+    def test_latency(self) -> None:
+        """Test slow responses are taken as congestion."""
+        self.throttle.adapt(0.2)
+        self.assertEqual(self.throttle.delay, 0.5)
+        self.throttle.adapt(2.0)
+        self.assertEqual(self.throttle.delay, 1.0)
+        self.assertAlmostEqual(self.throttle.latency, 0.56)
+        self.assertAlmostEqual(self.throttle.base_latency, 0.2036)
+
+    def test_lag(self) -> None:
+        """Test maxlag slows down the read rate."""
+        with mock.patch.object(Throttle, 'wait'):
+            self.throttle.lag(5)
+        self.assertEqual(self.throttle.delay, 1.0)
+
+    def test_http_request(self) -> None:
+        """Test that http.request passes responses to the throttle."""
+        from pywikibot.comms import http
+        site = self.get_site()
+        site._throttle = self.throttle
+        response = mock.Mock(status_code=429, headers={},
+                             elapsed=datetime.timedelta(seconds=0.2))
+        with mock.patch.object(http, 'fetch', return_value=response), \
+                mock.patch.object(type(site), 'throttle', self.throttle):
+            http.request(site, uri='/w/api.php')
+            self.assertEqual(self.throttle.delay, 1.0)
+            response.status_code = 200
+            http.request(site, uri='/w/api.php')
+            self.assertLess(self.throttle.delay, 1.0)
+            with mock.patch.object(http, 'fetch',
+                                   side_effect=ServerError('503')), \
+                    self.assertRaises(ServerError):
+                http.request(site, uri='/w/api.php')
+        self.assertGreater(self.throttle.delay, 1.0)
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
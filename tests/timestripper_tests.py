@@ -11,7 +11,9 @@ import datetime
 import re
 import unittest
 from contextlib import suppress
+from unittest import mock
 
+from pywikibot import textlib
 from pywikibot.textlib import TimeStripper
 from pywikibot.time import TZoneFixedOffset
 from tests.aspects import TestCase
@@ -391,6 +393,41 @@ class TestTimeStripperTreatSpecialText(TestTimeStripperCase):
         txt_match = self.date + '<div ' + self.fake_date + '>'
         self.assertEqual(ts(txt_match), self.expected_date)
 
+    def test_find_timestamps(self) -> None:
+        """Test that timestamps of all lines are found."""
+        text = '\n'.join([
+            'no timestamp',
+            self.date,
+            '<div ' + self.fake_date + '>',
+            '[[foo]] ' + self.date + '\r\n3.5',
+            '',
+        ])
+        with mock.patch.object(self.ts, 'timestripper',
+                               wraps=self.ts.timestripper) as parse:
+            self.assertEqual(self.ts.find_timestamps(text), [
+                (13, self.expected_date),
+                (69, self.expected_date),
+            ])
+        # lines without all parts of a timestamp or markup are skipped
+        lines = {call.args[0] for call in parse.call_args_list}
+        self.assertNotIn('no timestamp', lines)
+        self.assertNotIn('3.5', lines)
+        self.assertIn(self.date, lines)
+        self.assertEqual(self.ts.find_timestamps(''), [])
+        self.assertEqual(self.ts.find_timestamps('06:57 06 June 2015 ('), [])
+
+    def test_site_patterns_cache(self) -> None:
+        """Test that patterns are cached for a limited number of sites."""
+        site = self.get_site()
+        key = site.family.name, site.code
+        self.assertIs(TimeStripper(site).patterns, self.ts.patterns)
+        self.assertEqual(next(reversed(TimeStripper._site_patterns)), key)
+        with mock.patch.object(textlib, 'TIMESTRIPPER_CACHE_SIZE', 0):
+            del TimeStripper._site_patterns[key]
+            ts = TimeStripper(site)
+        self.assertEqual(ts.patterns, self.ts.patterns)
+        self.assertNotIn(key, TimeStripper._site_patterns)
+
 
 class TestTimeStripperDoNotArchiveUntil(TestTimeStripperCase):
 
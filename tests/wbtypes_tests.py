@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import datetime
+import json
 import operator
 import unittest
 from contextlib import suppress
@@ -1032,6 +1033,42 @@ class TestWbUnknown(WbRepresentationTestCase):
                          {'text': 'Test this!', 'language': 'en'})
 
 
+class TestWbRepresentationSlots(WbRepresentationTestCase):
+
+    """Test compact representation of Wikibase data types."""
+
+    dry = True
+
+    def test_slots(self) -> None:
+        """Test that representations have no instance dict."""
+        repo = self.get_repo()
+        for value in (
+            pywikibot.Coordinate(1, 2, precision=1, site=repo),
+            pywikibot.WbTime(2010, site=repo),
+            pywikibot.WbQuantity(5, site=repo),
+            pywikibot.WbMonolingualText('text', 'en'),
+            pywikibot.WbUnknown({}),
+        ):
+            with self.subTest(type=type(value).__name__):
+                self.assertFalse(hasattr(value, '__dict__'))
+
+    def test_interned(self) -> None:
+        """Test that repeated strings from JSON are shared."""
+        repo = self.get_repo()
+        data = '{"time": "+2010-01-01T00:00:00Z", "precision": 9, ' \
+               '"before": 0, "after": 0, "timezone": 0, "calendarmodel": ' \
+               '"http://www.wikidata.org/entity/Q1985727"}'
+        first, second = (
+            pywikibot.WbTime.fromWikibase(json.loads(data), repo)
+            for _ in range(2))
+        self.assertIs(first.calendarmodel, second.calendarmodel)
+        first, second = (
+            pywikibot.WbMonolingualText.fromWikibase(
+                json.loads('{"text": "foo", "language": "en"}'))
+            for _ in range(2))
+        self.assertIs(first.language, second.language)
+
+
 if __name__ == '__main__':
     with suppress(SystemExit):
         unittest.main()
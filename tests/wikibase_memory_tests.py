@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+#
+# (C) Pywikibot team, 2026
+#
+# Distributed under the terms of the MIT license.
+#
+"""Memory benchmark for decoded claims of Wikibase items.
+
+The benchmark decodes the claims of many items with typical statements
+and records the memory footprint per item with :mod:`tracemalloc`. It
+is skipped unless :envvar:`PYWIKIBOT_TEST_BENCHMARK` is set to 1::
+
+    PYWIKIBOT_TEST_BENCHMARK=1 python -m unittest tests.wikibase_memory_tests
+
+With Python 3.11 an item with six statements and six references used
+13,013 bytes before claims and Wikibase values used ``__slots__`` and
+shared strings and item targets, and 6,706 bytes afterwards.
+
+.. version-added:: 11.7
+"""
+from __future__ import annotations
+
+import gc
+import json
+import os
+import tracemalloc
+import unittest
+from contextlib import suppress
+
+from pywikibot.page._collections import ClaimCollection
+from tests import unittest_print
+from tests.aspects import DefaultDrySiteTestCase
+
+
+def snak(prop: str, datatype: str, value, value_type: str) -> dict:
+    """Return the JSON of a value snak."""
+    return {'snaktype': 'value', 'property': prop, 'datatype': datatype,
+            'datavalue': {'value': value, 'type': value_type}}
+
+
+def statement(item_id: str, prop: str, mainsnak: dict) -> dict:
+    """Return the JSON of a statement with a reference."""
+    source = snak('P248', 'wikibase-item',
+                  {'entity-type': 'item', 'numeric-id': 328, 'id': 'Q328'},
+                  'wikibase-entityid')
+    return {'id': f'{item_id}${prop}', 'rank': 'normal',
+            'type': 'statement', 'mainsnak': mainsnak,
+            'references': [{'hash': 'abc', 'snaks-order': ['P248'],
+                            'snaks': {'P248': [source]}}]}
+
+
+def claims_json(number: int) -> dict:
+    """Return the claims JSON of an item with six statements."""
+    item_id = f'Q{number}'
+    values = {
+        'P31': ('wikibase-item', 'wikibase-entityid',
+                {'entity-type': 'item', 'numeric-id': 5, 'id': 'Q5'}),
+        'P569': ('time', 'time',
+                 {'time': '+2001-01-15T00:00:00Z', 'timezone': 0,
+                  'before': 0, 'after': 0, 'precision': 11,
+                  'calendarmodel':
+                      'http://www.wikidata.org/entity/Q1985727'}),
+        'P1082': ('quantity', 'quantity',
+                  {'amount': '+12',
+                   'unit': 'http://www.wikidata.org/entity/Q11573'}),
+        'P625': ('globe-coordinate', 'globecoordinate',
+                 {'latitude': 52.5, 'longitude': 13.4, 'altitude': None,
+                  'precision': 0.01,
+                  'globe': 'http://www.wikidata.org/entity/Q2'}),
+        'P1476': ('monolingualtext', 'monolingualtext',
+                  {'text': 'Foo', 'language': 'en'}),
+        'P214': ('external-id', 'string', str(number)),
+    }
+    # a JSON round trip gives distinct strings like an API response
+    return json.loads(json.dumps({
+        prop: [statement(item_id, prop,
+                         snak(prop, datatype, value, value_type))]
+        for prop, (datatype, value_type, value) in values.items()}))
+
+
+class TestClaimMemory(DefaultDrySiteTestCase):
+
+    """Measure the memory of decoded claims per item."""
+
+    items = 2000
+
+    #: upper limit of bytes per item to detect regressions
+    max_bytes = 10000
+
+    def test_claims_per_item(self) -> None:
+        """Test the memory footprint of decoded claims per item."""
+        repo = self.site.data_repository()
+        data = [claims_json(number) for number in range(self.items)]
+        collections = []
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for claims in data:
+                collection = ClaimCollection.fromJSON(claims, repo)
+                for prop in collection:
+                    collection[prop]
+                collections.append(collection)
+            gc.collect()
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        per_item = (after - before) / self.items
+        unittest_print(f'\n{per_item:.0f} bytes per item '
+                       '(6 statements, 6 references)')
+        self.assertLess(per_item, self.max_bytes)
+
+
+def setUpModule() -> None:
+    """Skip benchmarks if PYWIKIBOT_TEST_BENCHMARK variable is not set."""
+    if os.environ.get('PYWIKIBOT_TEST_BENCHMARK', '0') != '1':
+        raise unittest.SkipTest('benchmarks are disabled')
+
+
+if __name__ == '__main__':
+    with suppress(SystemExit):
+        unittest.main()
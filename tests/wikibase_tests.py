@@ -11,21 +11,29 @@ import copy
 import json
 import unittest
 from contextlib import suppress
+from unittest.mock import Mock, patch
 
 import pywikibot
 from pywikibot import pagegenerators
+from pywikibot.bot import WikidataBot
 from pywikibot.exceptions import (
     InvalidTitleError,
     IsNotRedirectPageError,
     IsRedirectPageError,
     NoPageError,
+    ServerError,
     WikiBaseError,
 )
 from pywikibot.page import ItemPage, PropertyPage, WikibasePage
 from pywikibot.site import Namespace, NamespacesDict
 from pywikibot.tools import suppress_warnings
 from tests import WARN_SITE_CODE, join_pages_path
-from tests.aspects import TestCase, WikidataTestCase
+from tests.aspects import (
+    DefaultDrySiteTestCase,
+    DrySimpleRequestTestCase,
+    TestCase,
+    WikidataTestCase,
+)
 from tests.basepage import (
     BasePageLoadRevisionsCachingTestBase,
     BasePageMethodsTestBase,
@@ -1181,6 +1189,289 @@ class TestPreloadingEntityGenerator(TestCase):
             self.assertIsInstance(item, ItemPage)
 
 
+class TestItemLoadFiltered(DrySimpleRequestTestCase):
+
+    """Test loading a part of the item data with a dry site."""
+
+    CONTENT = {
+        'id': 'Q1', 'type': 'item', 'lastrevid': 10,
+        'labels': {lang: {'language': lang, 'value': f'label {lang}'}
+                   for lang in ('en', 'de', 'fr')},
+        'descriptions': {'en': {'language': 'en', 'value': 'desc'}},
+        'aliases': {},
+        'claims': {},
+        'sitelinks': {dbname: {'site': dbname, 'title': 'Foo', 'badges': []}
+                      for dbname in ('enwiki', 'dewiki')},
+    }
+
+    def submit(self, **params):
+        """Return the entity filtered by the request parameters."""
+        props = params.get('props') or list(self.CONTENT)
+        content = {key: value for key, value in self.CONTENT.items()
+                   if key in props or not isinstance(value, dict)}
+        for key, allowed in (('labels', params.get('languages')),
+                             ('descriptions', params.get('languages')),
+                             ('aliases', params.get('languages')),
+                             ('sitelinks', params.get('sitefilter'))):
+            if allowed is not None and key in content:
+                content[key] = {name: value
+                                for name, value in content[key].items()
+                                if name in allowed}
+        return {'success': 1, 'entities': {'Q1': copy.deepcopy(content)}}
+
+    def setUp(self) -> None:
+        """Set up the dry data repository."""
+        super().setUp()
+        self.repo = self.site.data_repository()
+
+    def test_props(self) -> None:
+        """Test that parts which were not loaded are fetched lazily."""
+        item = ItemPage(self.repo, 'Q1')
+        data = item.get(props=['labels'])
+        self.assertEqual(self.requests[0]['props'], ('info', 'labels'))
+        self.assertEqual(set(data), {'labels'})
+        self.assertEqual(item.latest_revision_id, 10)
+        item.labels['en'] = 'changed'
+        self.assertEqual(item.sitelinks['dewiki'].title, 'Foo')
+        self.assertLength(self.requests, 2)
+        self.assertEqual(self.requests[1]['props'], ('info', 'sitelinks'))
+        self.assertEqual(item.labels['en'], 'changed')
+        self.assertEqual(item.toJSON(diffto=item._content),
+                         {'labels': {'en': {'language': 'en',
+                                            'value': 'changed'}}})
+        item.get()
+        self.assertLength(self.requests, 2)
+        item.get(props=['descriptions', 'claims'])
+        self.assertLength(self.requests, 3)
+        self.assertEqual(self.requests[2]['props'],
+                         ('info', 'claims', 'descriptions'))
+        self.assertEqual(item.descriptions['en'], 'desc')
+        self.assertEqual(item._partial, {'aliases': None})
+        self.assertEqual(item.aliases, {})
+        self.assertLength(self.requests, 4)
+        self.assertEqual(item._partial, {})
+
+    def test_languages(self) -> None:
+        """Test that filtered collections are completed on lookup."""
+        item = ItemPage(self.repo, 'Q1')
+        item.get(languages=['en'], sitefilter=['enwiki'])
+        self.assertEqual(self.requests[0]['languages'], ['en'])
+        self.assertEqual(self.requests[0]['sitefilter'], ['enwiki'])
+        self.assertEqual(item.labels['en'], 'label en')
+        self.assertIn('enwiki', item.sitelinks)
+        self.assertLength(self.requests, 1)
+        del item.labels['en']
+        self.assertEqual(item.labels['de'], 'label de')
+        self.assertLength(self.requests, 2)
+        self.assertNotIn('en', item.labels)
+        self.assertEqual(set(item.labels), {'de', 'fr'})
+        self.assertEqual(set(item._content['labels']), {'en', 'de', 'fr'})
+        self.assertNotIn('nlwiki', item.sitelinks)
+        self.assertLength(self.requests, 3)
+        self.assertEqual(set(item.sitelinks), {'enwiki', 'dewiki'})
+
+    def test_local_changes(self) -> None:
+        """Test that local changes are kept when data are completed."""
+        item = ItemPage(self.repo, 'Q1')
+        item.get(languages=['en'], sitefilter=['enwiki'])
+        item.labels['de'] = 'mine'
+        item.labels['fr'] = 'temporary'
+        del item.labels['fr']
+        item.sitelinks['dewiki'] = 'Bar'
+        self.assertLength(self.requests, 1)
+        self.assertNotIn('nl', item.labels)
+        self.assertNotIn('nlwiki', item.sitelinks)
+        self.assertLength(self.requests, 3)
+        self.assertEqual(item.labels, {'en': 'label en', 'de': 'mine'})
+        self.assertEqual(item.sitelinks['dewiki'].title, 'Bar')
+        self.assertEqual(item.toJSON(diffto=item._content), {
+            'labels': {'de': {'language': 'de', 'value': 'mine'},
+                       'fr': {'language': 'fr', 'value': ''}},
+            'sitelinks': {'dewiki': {'site': 'dewiki', 'title': 'Bar',
+                                     'badges': []}},
+        })
+
+    def test_mediainfo_statements(self) -> None:
+        """Test that statements of MediaInfo are loaded as claims prop."""
+        mediainfo = pywikibot.MediaInfo(self.repo, 'M1')
+        # content of a preload_entities() request with props=labels
+        mediainfo._content = {'id': 'M1', 'type': 'mediainfo',
+                              'lastrevid': 10, 'labels': {}}
+        mediainfo._partial = mediainfo._get_partial({'labels'}, None, None)
+        self.assertEqual(mediainfo._partial, {'statements': None})
+        self.assertEqual(set(mediainfo.get()), {'labels'})
+        self.assertEqual(mediainfo.statements, {})
+        self.assertLength(self.requests, 1)
+        self.assertEqual(self.requests[0]['props'], ('info', 'claims'))
+        self.assertEqual(mediainfo._partial, {})
+
+    def test_invalid_props(self) -> None:
+        """Test that unknown props raise ValueError."""
+        with self.assertRaisesRegex(ValueError, 'Unknown props'):
+            ItemPage(self.repo, 'Q1').get(props=['labels', 'info'])
+
+
+class TestClaimMemory(DefaultDrySiteTestCase):
+
+    """Test compact representation of claims with a dry site."""
+
+    def setUp(self) -> None:
+        """Set up the data repository and the statement JSON."""
+        super().setUp()
+        self.repo = self.site.data_repository()
+        self.statement = {
+            'id': 'Q1$abc', 'rank': 'normal', 'type': 'statement',
+            'mainsnak': {
+                'snaktype': 'value', 'property': 'P31',
+                'datatype': 'wikibase-item',
+                'datavalue': {'type': 'wikibase-entityid',
+                              'value': {'entity-type': 'item',
+                                        'numeric-id': 5, 'id': 'Q5'}}},
+        }
+
+    def test_slots(self) -> None:
+        """Test that claims have no instance dict."""
+        claim = pywikibot.Claim.fromJSON(self.repo, self.statement)
+        self.assertFalse(hasattr(claim, '__dict__'))
+        self.assertIsNone(claim._qualifiers)
+        self.assertIsNone(claim._sources)
+        self.assertNotIn('qualifiers', claim.toJSON())
+        self.assertIsNone(claim._qualifiers)
+        self.assertEqual(claim.qualifiers, {})
+        self.assertEqual(claim.sources, [])
+
+    def test_shared_target(self) -> None:
+        """Test that item targets and strings from JSON are shared."""
+        first, second = (
+            pywikibot.Claim.fromJSON(self.repo, json.loads(
+                json.dumps(self.statement)))
+            for _ in range(2))
+        self.assertIs(first.target, second.target)
+        self.assertIs(first.rank, second.rank)
+        self.assertIs(first.id, second.id)
+        first.setTarget(ItemPage(self.repo, 'Q6'))
+        self.assertEqual(second.target, ItemPage(self.repo, 'Q5'))
+
+
+class TestEntityEditBatch(DrySimpleRequestTestCase):
+
+    """Test EntityEditBatch with a dry site."""
+
+    def submit(self, **params):
+        """Return a simple entity for each requested id."""
+        entities = {
+            entity_id: {
+                'id': entity_id, 'type': 'item', 'lastrevid': 10,
+                'labels': {'en': {'language': 'en', 'value': 'label'},
+                           'de': {'language': 'de', 'value': 'Label'}},
+                'descriptions': {}, 'aliases': {}, 'claims': {},
+                'sitelinks': {'enwiki': {'site': 'enwiki', 'title': 'Foo',
+                                         'badges': []}},
+            } for entity_id in params['ids'].split('|')}
+        return {'success': 1, 'entities': entities}
+
+    def setUp(self) -> None:
+        """Patch editEntity of the dry data repository."""
+        super().setUp()
+        self.repo = self.site.data_repository()
+        patcher = patch.object(
+            type(self.repo), 'editEntity',
+            Mock(return_value={'entity': {'lastrevid': 11}}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_flush(self) -> None:
+        """Test that changes of an entity are saved with one edit."""
+        item = ItemPage(self.repo, 'Q1')
+        unchanged = ItemPage(self.repo, 'Q2')
+        claim = pywikibot.Claim(self.repo, 'P31', datatype='wikibase-item')
+        claim.setTarget(ItemPage(self.repo, 'Q5'))
+        qualifier = pywikibot.Claim(self.repo, 'P1', datatype='string')
+        qualifier.setTarget('qualifier')
+        source = pywikibot.Claim(self.repo, 'P2', datatype='string')
+        source.setTarget('source')
+
+        with pywikibot.page.EntityEditBatch(summary='test') as batch:
+            batch.add_claim(item, claim)
+            batch.add_qualifier(claim, qualifier)
+            batch.add_sources(claim, [source])
+            batch.edit_labels(item, {'en': 'changed', 'de': ''})
+            batch.set_sitelinks(item, [{'site': 'dewiki', 'title': 'Bar'}])
+            batch.add(unchanged)
+            self.assertLength(batch, 2)
+            with self.assertRaisesRegex(ValueError, 'already used'):
+                batch.add_claim(unchanged, claim)
+
+        edit = self.repo.editEntity
+        edit.assert_called_once()
+        (entity, data), kwargs = edit.call_args
+        self.assertIs(entity, item)
+        self.assertEqual(kwargs, {'baserevid': 10, 'summary': 'test'})
+        self.assertEqual(set(data), {'labels', 'claims', 'sitelinks'})
+        self.assertEqual(data['labels'],
+                         {'en': {'language': 'en', 'value': 'changed'},
+                          'de': {'language': 'de', 'value': ''}})
+        self.assertEqual(data['sitelinks'],
+                         {'dewiki': {'site': 'dewiki', 'title': 'Bar',
+                                     'badges': []}})
+        statement, = data['claims']['P31']
+        self.assertEqual(list(statement['qualifiers']), ['P1'])
+        self.assertEqual(list(statement['references'][0]['snaks']), ['P2'])
+        self.assertLength(batch, 0)
+        self.assertFalse(hasattr(item, '_content'))
+        self.assertEqual(item.latest_revision_id, 11)
+
+    def test_no_flush_on_error(self) -> None:
+        """Test that the batch is not saved if an exception occurs."""
+        item = ItemPage(self.repo, 'Q1')
+        with self.assertRaises(KeyError), \
+             pywikibot.page.EntityEditBatch() as batch:
+            batch.edit_labels(item, {'en': 'changed'})
+            raise KeyError
+        self.repo.editEntity.assert_not_called()
+        self.assertEqual(batch.entities, (item, ))
+        batch.clear()
+        self.assertLength(batch, 0)
+
+    def test_user_save_batch(self) -> None:
+        """Test that entities which were not saved remain in the batch."""
+        items = [ItemPage(self.repo, f'Q{num}') for num in range(1, 5)]
+        batch = pywikibot.page.EntityEditBatch(summary='test')
+        for item in items[:3]:
+            batch.edit_labels(item, {'en': 'changed'})
+        batch.add(items[3])
+        bot = Mock(user_edit_entity=Mock(side_effect=[True, False, True]))
+        self.assertFalse(WikidataBot.user_save_batch(bot, batch))
+        self.assertEqual(bot.user_edit_entity.call_count, 3)
+        bot.user_edit_entity.assert_called_with(items[2], summary='test',
+                                                show_diff=False)
+        self.assertEqual(batch.entities, (items[1], ))
+
+        batch.edit_labels(items[2], {'en': 'again'})
+        bot.user_edit_entity.side_effect = ServerError('down')
+        with self.assertRaises(ServerError):
+            WikidataBot.user_save_batch(bot, batch)
+        self.assertEqual(batch.entities, (items[1], items[2]))
+
+    def test_user_add_claim(self) -> None:
+        """Test that save options are not dropped with a batch."""
+        item = ItemPage(self.repo, 'Q1')
+        claim = pywikibot.Claim(self.repo, 'P1', datatype='string')
+        claim.setTarget('value')
+        batch = pywikibot.page.EntityEditBatch()
+        bot = Mock()
+        for kwargs in ({'summary': 'test'}, {'bot': False},
+                       {'ignore_server_errors': True}):
+            with self.subTest(**kwargs), \
+                 self.assertRaisesRegex(ValueError, 'save options'):
+                WikidataBot.user_add_claim(bot, item, claim, batch=batch,
+                                           **kwargs)
+        self.assertLength(batch, 0)
+        self.assertTrue(WikidataBot.user_add_claim(bot, item, claim,
+                                                   batch=batch))
+        self.assertEqual(batch.entities, (item, ))
+
+
 class TestNamespaces(WikidataTestCase):
 
     """Test cases to test namespaces of Wikibase entities."""
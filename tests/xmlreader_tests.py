@@ -7,8 +7,13 @@
 """Tests for xmlreader module."""
 from __future__ import annotations
 
+import bz2
+import pickle
+import re
+import tempfile
 import unittest
 from contextlib import suppress
+from pathlib import Path
 
 from pywikibot import xmlreader
 from pywikibot.tools import suppress_warnings
@@ -22,6 +27,27 @@ def get_entries(filename, **kwargs):
                                   **kwargs).parse())
 
 
+def talk_title(entry):
+    """Return the title of a talk page entry."""
+    return entry.title if entry.ns == '1' else None
+
+
+class TalkTitle:
+
+    """Picklable callable which counts how often it was pickled."""
+
+    pickled = 0
+
+    def __call__(self, entry):
+        """Return the title of a talk page entry."""
+        return talk_title(entry)
+
+    def __reduce__(self):
+        """Count pickling in the current process."""
+        type(self).pickled += 1
+        return type(self), ()
+
+
 class ExportDotThreeTestCase(TestCase):
 
     """XML export version 0.3 tests."""
@@ -73,7 +99,7 @@ class ExportDotThreeTestCase(TestCase):
         """Compare the tested variant with the previous (if not None)."""
         entries = get_entries('article-pyrus' + variant,
                               revisions=revisions)
-        result = [entry.__dict__ for entry in entries]
+        result = [entry.asdict() for entry in entries]
         if previous:
             self.assertEqual(previous, result)
         return result
@@ -138,6 +164,242 @@ class ExportDotTenTestCase(TestCase):
             'moved [[Çullu, Agdam]] to [[Çullu, Quzanlı]]:&#32;dab')
 
 
+class XmlEntryTestCase(TestCase):
+
+    """Test lazy XmlEntry and parse filters."""
+
+    net = False
+
+    def test_lazy_fields(self) -> None:
+        """Test that revision fields are decoded on first access."""
+        entry = next(xmlreader.XmlDump(join_xml_data_path('pair-0.10.xml'),
+                                       revisions='latest').parse())
+        self.assertFalse(hasattr(entry, '__dict__'))
+        self.assertIs(entry._text, xmlreader._UNSET)
+        self.assertEqual(entry.title, 'Çullu, Agdam')
+        self.assertIs(entry._text, xmlreader._UNSET)
+        self.assertStartsWith(entry.text, "'''Çullu, Agdam''' may refer")
+        self.assertEqual(entry._text, entry.text)
+        entry.text = 'changed'
+        self.assertEqual(entry.text, 'changed')
+
+    def test_entry(self) -> None:
+        """Test XmlEntry initializer, equality and pickling."""
+        entry = next(xmlreader.XmlDump(join_xml_data_path('pair-0.10.xml'),
+                                       revisions='latest').parse())
+        copy = xmlreader.XmlEntry(**entry.asdict())
+        self.assertEqual(copy, entry)
+        self.assertEqual(pickle.loads(pickle.dumps(entry)), entry)
+        self.assertIn("title='Çullu, Agdam'", repr(entry))
+        copy.comment = 'other'
+        self.assertNotEqual(copy, entry)
+
+    def test_headers_only(self) -> None:
+        """Test header-only parsing."""
+        dump = xmlreader.XmlDump(join_xml_data_path('pair-0.10.xml'),
+                                 revisions='all')
+        headers = list(dump.parse(headers_only=True))
+        self.assertLength(headers, 2)
+        self.assertIsInstance(headers[0], xmlreader.Headers)
+        self.assertEqual([h.title for h in headers],
+                         ['Çullu, Agdam', 'Talk:Çullu, Agdam'])
+        self.assertEqual(headers[1].pageid, '19252824')
+
+    def test_filters(self) -> None:
+        """Test namespace and title filters."""
+        dump = xmlreader.XmlDump(join_xml_data_path('pair-0.10.xml'),
+                                 revisions='all')
+        entries = list(dump.parse(namespaces=[1]))
+        self.assertLength(entries, 2)
+        self.assertEqual({e.title for e in entries}, {'Talk:Çullu, Agdam'})
+        entries = list(dump.parse(
+            title_filter=lambda title: not title.startswith('Talk:')))
+        self.assertEqual({e.title for e in entries}, {'Çullu, Agdam'})
+        self.assertIsEmpty(list(dump.parse(namespaces=[0],
+                                           title_filter=str.islower)))
+
+
+class MultistreamTestCase(TestCase):
+
+    """Parallel parsing tests of multistream bz2 dumps."""
+
+    net = False
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create a multistream dump with its index from pair-0.10.xml."""
+        super().setUpClass()
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        path = Path(cls._tmpdir.name)
+        text = Path(join_xml_data_path('pair-0.10.xml')).read_bytes()
+        start = text.index(b'<page>')
+        end = text.rindex(b'</page>') + len(b'</page>')
+        pages = []
+        # make 10 distinct pages from the 2 pages of the dump
+        for i in range(5):
+            for page in re.findall(rb'<page>.*?</page>', text[start:end],
+                                   re.DOTALL):
+                page = re.sub(rb'</title>', f' {i}</title>'.encode(), page)
+                page = re.sub(rb'<id>(\d+)</id>',
+                              lambda m, i=i: b'<id>%d</id>' % (
+                                  int(m[1]) + i),
+                              page, count=1)
+                pages.append(page)
+        streams = [text[:start]]
+        streams += [b'\n'.join(pages[i:i + 3])
+                    for i in range(0, len(pages), 3)]
+        streams.append(text[end:])
+
+        cls.dump = path / 'test-multistream.xml.bz2'
+        cls.index = path / 'test-multistream-index.txt.bz2'
+        lines = []
+        with open(cls.dump, 'wb') as f:
+            for stream in streams:
+                for title, pageid in re.findall(
+                        rb'<title>(.*?)</title>.*?<id>(\d+)</id>', stream,
+                        re.DOTALL):
+                    lines.append(f'{f.tell()}:{pageid.decode()}:'
+                                 f'{title.decode()}\n')
+                f.write(bz2.compress(stream))
+        cls.index.write_bytes(bz2.compress(''.join(lines).encode()))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the temporary dump."""
+        cls._tmpdir.cleanup()
+        super().tearDownClass()
+
+    def _entries(self, filename, **kwargs):
+        """Return parsed entries as dicts."""
+        dump = xmlreader.XmlDump(str(filename), revisions='all')
+        return [entry.asdict() for entry in dump.parse(**kwargs)]
+
+    def test_stream_offsets(self) -> None:
+        """Test stream offsets from index and by scanning the dump."""
+        dump = xmlreader.XmlDump(str(self.dump), revisions='all')
+        from_index = dump.stream_offsets()
+        self.assertLength(from_index, 5)
+        self.assertEqual(from_index[0], 0)
+        dump = xmlreader.XmlDump(str(self.dump), revisions='all',
+                                 index=str(self.index))
+        self.assertEqual(dump.stream_offsets(), from_index)
+        self.index.rename(self.index.with_suffix('.bak'))
+        try:
+            # the scan finds the footer stream too
+            dump = xmlreader.XmlDump(str(self.dump), revisions='all')
+            scanned = dump.stream_offsets()
+        finally:
+            self.index.with_suffix('.bak').rename(self.index)
+        self.assertEqual(scanned[:-1], from_index)
+        self.assertLength(scanned, 6)
+
+    def test_parallel(self) -> None:
+        """Test parallel parsing gives the same entries as serial."""
+        serial = self._entries(self.dump)
+        self.assertLength(serial, 20)
+        self.assertEqual(self._entries(self.dump, processes=2), serial)
+        dump = xmlreader.XmlDump(str(self.dump), revisions='all')
+        headers = list(dump.parse(processes=2, headers_only=True,
+                                  namespaces=[1]))
+        self.assertLength(headers, 5)
+        self.assertTrue(all(h.title.startswith('Talk:') for h in headers))
+        unordered = self._entries(self.dump, processes=2, ordered=False)
+        key = lambda entry: (entry['revisionid'], entry['id'])  # noqa: E731
+        self.assertEqual(sorted(map(key, unordered)),
+                         sorted(map(key, serial)))
+
+    def test_map_entries(self) -> None:
+        """Test calling a function by worker processes."""
+        dump = xmlreader.XmlDump(str(self.dump), revisions='latest')
+        serial = list(dump.map_entries(talk_title))
+        self.assertLength(serial, 5)
+        self.assertTrue(all(title.startswith('Talk:') for title in serial))
+        self.assertEqual(list(dump.map_entries(talk_title, processes=2)),
+                         serial)
+        filename = join_xml_data_path('pair-0.10.xml')
+        dump = xmlreader.XmlDump(filename, revisions='latest')
+        self.assertEqual(list(dump.map_entries(talk_title, processes=2)),
+                         ['Talk:Çullu, Agdam'])
+
+    def test_map_entries_pickle(self) -> None:
+        """Test that the function is sent once to each worker."""
+        dump = xmlreader.XmlDump(str(self.dump), revisions='latest')
+        TalkTitle.pickled = 0
+        self.assertLength(list(dump.map_entries(TalkTitle(), processes=2)),
+                          5)
+        self.assertLessEqual(TalkTitle.pickled, 2)
+
+    def test_plain_fallback(self) -> None:
+        """Test that plain dumps are parsed serially."""
+        filename = join_xml_data_path('pair-0.10.xml')
+        self.assertEqual(self._entries(filename, processes=2),
+                         self._entries(filename))
+
+    def test_lookup(self) -> None:
+        """Test lookup using the multistream index and the page index."""
+        serial = {entry.title: entry.asdict()
+                  for entry in xmlreader.XmlDump(str(self.dump),
+                                                 revisions='latest').parse()}
+        self.assertLength(serial, 10)
+        dump = xmlreader.XmlDump(str(self.dump), revisions='latest')
+        for key in ('Çullu, Agdam 3', 19252823):
+            with self.subTest(key=key):
+                entry = dump.lookup(key)
+                self.assertEqual(entry.asdict(), serial[entry.title])
+        self.assertEqual(dump.lookup(19252827).title, 'Talk:Çullu, Agdam 3')
+        self.assertIsNone(dump.lookup('Missing page'))
+
+        # build an own page index of the multistream dump
+        index = dump.build_index()
+        try:
+            self.assertEqual(index, str(self.dump) + '.index.bz2')
+            dump = xmlreader.XmlDump(str(self.dump), revisions='latest')
+            titles = ['Talk:Çullu, Agdam 4', 'Çullu, Agdam 0', 'Missing']
+            entries = list(dump.lookup_pages(titles))
+            self.assertEqual([entry.title for entry in entries],
+                             ['Çullu, Agdam 0', 'Talk:Çullu, Agdam 4'])
+            for entry in entries:
+                self.assertEqual(entry.asdict(), serial[entry.title])
+        finally:
+            Path(index).unlink()
+
+
+class DumpIndexTestCase(TestCase):
+
+    """Page index tests of plain and single stream dumps."""
+
+    net = False
+
+    def test_lookup(self) -> None:
+        """Test lookup in plain and compressed dumps."""
+        source = Path(join_xml_data_path('dummy-template.xml'))
+        expected = {entry.title: entry.asdict()
+                    for entry in get_entries(source.name, revisions='latest')}
+        self.assertLength(expected, 3)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain = Path(tmpdir, source.name)
+            plain.write_bytes(source.read_bytes())
+            compressed = Path(tmpdir, source.name + '.bz2')
+            compressed.write_bytes(bz2.compress(source.read_bytes()))
+            for filename in (plain, compressed):
+                with self.subTest(filename=filename.name):
+                    dump = xmlreader.XmlDump(str(filename),
+                                             revisions='latest')
+                    entries = list(dump.lookup_pages(reversed(expected)))
+                    self.assertFalse(dump.uri is None)
+                    self.assertTrue(
+                        Path(str(filename) + '.index.bz2').exists())
+                    self.assertEqual([entry.asdict() for entry in entries],
+                                     list(expected.values()))
+
+    def test_utf16(self) -> None:
+        """Test that UTF-16 dumps cannot be indexed."""
+        dump = xmlreader.XmlDump(join_xml_data_path('article-pyrus-utf16.xml'),
+                                 revisions='latest')
+        with self.assertRaisesRegex(ValueError, 'Only UTF-8 dumps'):
+            dump.build_index('unused.index.bz2')
+
+
 if __name__ == '__main__':
     with suppress(SystemExit):
         unittest.main()